@@ -0,0 +1,137 @@
+# 회의 분석 집계 (로컬, 마감된 회차마다 한 번씩만 계산)
+# 분석 화면은 History 원본이 아니라 아래 집계 테이블만 읽습니다.
+#  - dept_status: 회차 x 부서별 진행상태 건수와 마감 시각 이후 등록 건수
+#  - open_items / completions: 같은 부서의 같은 업무내용을 한 안건으로 보고,
+#    처음 "진행중"으로 보인 회차부터 "완료"로 보인 회차까지의 일수
+# 새 회차는 관리자 마감 직후(또는 분석 화면을 열 때) 그 회차의 레코드만 읽어서 더합니다.
+# History에서 회차가 사라지면 진행 기간 계산을 되돌릴 수 없으므로 처음부터 다시 집계합니다.
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import hashlib
+import sqlite3
+import threading
+
+from config import DEPT_ORDER, get_storage_config
+from frames import STATUS_ORDER, meeting_date
+
+SUBMISSION_CUTOFF = "09:00"  # 회의 당일 이 시각까지 등록하면 제때 제출한 것으로 봅니다
+
+class HistoryAnalytics:
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        counts = ", ".join(f'"{s}" INTEGER NOT NULL DEFAULT 0' for s in STATUS_ORDER)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meetings (seq INTEGER PRIMARY KEY AUTOINCREMENT, meeting TEXT UNIQUE NOT NULL, meeting_date TEXT)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dept_status (meeting TEXT NOT NULL, dept TEXT NOT NULL,"
+            f" total INTEGER NOT NULL, {counts}, late INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (meeting, dept))"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS open_items (item TEXT PRIMARY KEY, dept TEXT NOT NULL, started TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS completions (item TEXT NOT NULL, dept TEXT NOT NULL, started TEXT NOT NULL, finished TEXT NOT NULL, days INTEGER NOT NULL)")
+        self._conn.commit()
+
+    def sync(self, storage):
+        """아직 집계하지 않은 회차만 마감 순서대로 더합니다. 더한 회차 수를 반환."""
+        with self._sync_lock:
+            meetings = storage.list_meetings()
+            with self._lock:
+                done = [row[0] for row in self._conn.execute("SELECT meeting FROM meetings ORDER BY seq")]
+            if set(done) - set(meetings):
+                with self._lock, self._conn:
+                    for table in ("meetings", "dept_status", "open_items", "completions"):
+                        self._conn.execute(f"DELETE FROM {table}")
+                done = []
+            added = [name for name in meetings if name not in set(done)]
+            records = storage.records_for_meetings(added) if added else {}
+            with self._lock, self._conn:
+                for name in added:
+                    self._add(name, records.get(name, []))
+            return len(added)
+
+    def _add(self, meeting_name, records):
+        day = meeting_date(meeting_name)
+        if day is None:
+            # 회차 이름에 날짜가 없으면 가장 늦은 등록일을 회의 날짜로 봅니다
+            entered = [str(r.get("입력일시", ""))[:10] for r in records if str(r.get("입력일시", ""))[:10]]
+            day = datetime.strptime(max(entered), "%Y-%m-%d").date() if entered else None
+        day_text = day.isoformat() if day else ""
+        cutoff = f"{day_text} {SUBMISSION_CUTOFF}"
+        self._conn.execute("INSERT INTO meetings (meeting, meeting_date) VALUES (?, ?)", (meeting_name, day_text))
+
+        stats = {}
+        for record in records:
+            dept = str(record.get("부서명", ""))
+            status = str(record.get("진행상태", ""))
+            row = stats.setdefault(dept, {"total": 0, "late": 0, **{s: 0 for s in STATUS_ORDER}})
+            row["total"] += 1
+            if status in row:
+                row[status] += 1
+            if day and str(record.get("입력일시", "")) > cutoff:
+                row["late"] += 1
+            if not day:
+                continue
+            item = hashlib.sha1(f"{dept}|{' '.join(str(record.get('업무내용', '')).split())}".encode("utf-8")).hexdigest()[:16]
+            if status == "진행중":
+                self._conn.execute("INSERT OR IGNORE INTO open_items (item, dept, started) VALUES (?, ?, ?)", (item, dept, day_text))
+            elif status == "완료":
+                opened = self._conn.execute("SELECT started FROM open_items WHERE item = ?", (item,)).fetchone()
+                if opened:
+                    days = (day - datetime.strptime(opened[0], "%Y-%m-%d").date()).days
+                    self._conn.execute(
+                        "INSERT INTO completions (item, dept, started, finished, days) VALUES (?, ?, ?, ?, ?)",
+                        (item, dept, opened[0], day_text, days),
+                    )
+                    self._conn.execute("DELETE FROM open_items WHERE item = ?", (item,))
+
+        columns = ["total"] + STATUS_ORDER + ["late"]
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        marks = ", ".join("?" for _ in columns)
+        self._conn.executemany(
+            f"INSERT INTO dept_status (meeting, dept, {column_list}) VALUES (?, ?, {marks})",
+            [(meeting_name, dept, *[row[c] for c in columns]) for dept, row in stats.items()],
+        )
+
+    def _frame(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def meeting_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+    def delay_trend(self):
+        """회의 날짜 x 부서별 지연 건수 (행: 회의 날짜, 열: 부서)"""
+        df = self._frame(
+            'SELECT m.meeting_date, d.dept, d."지연" AS delayed FROM dept_status d JOIN meetings m ON m.meeting = d.meeting'
+            " WHERE m.meeting_date != '' ORDER BY m.meeting_date"
+        )
+        return df.pivot_table(index="meeting_date", columns="dept", values="delayed", aggfunc="sum", fill_value=0)
+
+    def completion_durations(self):
+        """부서별 진행중 -> 완료 기간 (건수, 평균/중앙값/최장 일수)"""
+        df = self._frame("SELECT dept, days FROM completions")
+        return df.groupby("dept")["days"].agg(건수="count", 평균일수="mean", 중앙값="median", 최장="max").sort_values("평균일수", ascending=False)
+
+    def punctuality(self):
+        """부서별 제출 현황 (DEPT_ORDER 전체, 날짜가 있는 회차 기준)"""
+        total = self._frame("SELECT COUNT(*) AS n FROM meetings WHERE meeting_date != ''")["n"].iloc[0]
+        df = self._frame(
+            "SELECT d.dept, COUNT(*) AS submitted, SUM(d.late = 0) AS on_time, SUM(d.late) AS late_items"
+            " FROM dept_status d JOIN meetings m ON m.meeting = d.meeting WHERE m.meeting_date != '' GROUP BY d.dept"
+        ).set_index("dept")
+        depts = DEPT_ORDER + [d for d in df.index if d not in DEPT_ORDER]
+        df = df.reindex(depts, fill_value=0)
+        return pd.DataFrame({
+            "제출 회차": df["submitted"],
+            "미제출 회차": total - df["submitted"],
+            "제때 제출": df["on_time"],
+            "늦게 등록된 안건": df["late_items"],
+            "준수율": (df["on_time"] / total if total else df["on_time"] * 0.0),
+        })
+
+@st.cache_resource
+def get_analytics():
+    return HistoryAnalytics(get_storage_config()["analytics_path"])
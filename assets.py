@@ -0,0 +1,120 @@
+# 정적 파일 (로고 이미지, 화면 CSS)
+# 프로세스가 뜬 뒤 처음 쓸 때 한 번만 읽고 변환해 두고, 화면을 다시 그릴 때는 만들어 둔 값을 그대로 씁니다.
+import streamlit as st
+from io import BytesIO
+import os
+import re
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_FILES = ["logo.png", "logo.jpg"]  # 앞에 있는 파일부터 찾습니다
+LOGO_MAX_WIDTH = 640  # px. 사이드바 폭(약 300px)의 두 배 (고해상도 화면용)
+IMAGE_JPEG_QUALITY = 85
+
+@st.cache_resource(show_spinner=False)
+def load_image(file_name, max_width):
+    """ASSET_DIR의 이미지를 max_width 이하로 줄인 바이트 (파일이 없으면 None).
+
+    투명 영역이 없으면 JPEG, 있으면 PNG로 저장합니다. st.image가 고르는 형식과 같으므로
+    화면을 다시 그릴 때마다 이미지를 다시 인코딩하지 않습니다.
+    """
+    path = os.path.join(ASSET_DIR, file_name)
+    if not os.path.exists(path):
+        return None
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.load()
+    if image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)), Image.LANCZOS)
+    buffer = BytesIO()
+    if image.mode in ("RGBA", "LA", "P"):
+        image.save(buffer, format="PNG", optimize=True)
+    else:
+        image.convert("RGB").save(buffer, format="JPEG", quality=IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+def logo_image():
+    return next((data for data in (load_image(name, LOGO_MAX_WIDTH) for name in LOGO_FILES) if data), None)
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,])\s*", r"\1", css).strip()
+
+# 화면 CSS. Streamlit은 화면을 다시 그릴 때마다 모든 요소를 새로 보내므로 주석과 공백을 미리 걷어 둡니다.
+PAGE_CSS = """
+/* 전체 폰트 적용 */
+@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700;900&display=swap');
+
+html, body, [class*="css"] {
+    font-family: 'Noto Sans KR', sans-serif;
+}
+
+.stApp { background-color: #f8f9fa; }
+
+/* 헤더 스타일 */
+.main-header { 
+    font-size: 2.2rem; color: #003478; font-weight: 900; 
+    margin-top: 10px; margin-bottom: 5px; 
+}
+.sub-header {
+    font-size: 1.0rem; color: #666; margin-bottom: 25px;
+}
+
+/* 카드 박스 */
+.card-box { 
+    background-color: white; padding: 20px 10px; border-radius: 10px; 
+    border: 1px solid #edf2f7; 
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1); 
+    text-align: center; border-top: 4px solid #003478; 
+}
+.card-box h5 { margin: 0; font-size: 0.9rem; color: #718096; }
+.card-box h2 { margin: 5px 0 0 0; font-size: 1.8rem; font-weight: 700; color: #2d3748; }
+
+.admin-box { 
+    background-color: #ebf8ff; padding: 20px; border-radius: 10px; border: 1px solid #bee3f8; 
+}
+
+/* [중요] HTML 테이블 스타일 정의 */
+.kiwu-table-container {
+    overflow-x: auto;
+}
+table.kiwu-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 10px 0;
+    background-color: white;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+}
+/* 헤더 스타일 */
+table.kiwu-table th {
+    background-color: #f0f2f6;
+    color: #003478;
+    font-size: 15px;       
+    font-weight: 900;      
+    text-align: center;    
+    padding: 15px 10px;
+    border-bottom: 3px solid #003478; 
+    white-space: nowrap;
+}
+/* 데이터 셀 스타일 */
+table.kiwu-table td {
+    padding: 12px 10px;
+    border-bottom: 1px solid #e2e8f0;
+    text-align: center;    
+    font-size: 15px;
+    color: #333;
+}
+/* 업무내용 컬럼(3번째)만 좌측 정렬 */
+table.kiwu-table td:nth-child(3) {
+    text-align: left;
+    min-width: 300px;
+}
+
+@media print {
+    .stSidebar, header, footer, .no-print { display: none !important; }
+    .print-only { display: block !important; }
+    .stApp { background-color: white !important; }
+}
+"""
+PAGE_STYLE = f"<style>{minify_css(PAGE_CSS)}</style>"
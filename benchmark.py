@@ -0,0 +1,579 @@
+# 오프라인 성능 측정: 구글 시트 없이 app.py의 메뉴별 화면 시간, API 호출 수, 최대 메모리를 잽니다.
+#
+#   python benchmark.py                                      # 기본 시나리오 (Current 30/300/3000행 x History 10000행)
+#   python benchmark.py --current 300 --history 10000,100000 --latency 0.2 --per-kcell 0.005
+#   python benchmark.py --error-rate 0.05                    # 요청의 5%를 429(할당량 초과)로 돌려줌
+#   python benchmark.py --app ../v1/app.py --label v1        # 다른 버전의 app.py 측정
+#   python benchmark.py --compare v1                         # 이번 결과를 v1 라벨(또는 커밋)의 마지막 결과와 비교
+#   python benchmark.py --list                               # 저장된 결과 목록
+#
+# 가짜 시트는 gspread의 Client/Spreadsheet/Worksheet 자리에 들어가지만, 요청은 app.py가 만든 HTTP 클라이언트의
+# request()를 그대로 거칩니다 (실제 네트워크 대신 FakeSession이 받음). 그래서 앱의 요청 스케줄러, 재시도,
+# 계측이 실제와 같이 동작하고, 스케줄러가 없는 예전 버전의 app.py도 같은 방법으로 잴 수 있습니다.
+# 요청 한 번의 지연 = --latency + --per-kcell x (주고받은 셀 수 / 1000)
+#
+# 시나리오마다 먼저 한 번 실행해서 앱이 쓰는 보조 시트(색인, 리비전 등)와 로컬 파일을 만들어 두고,
+# 캐시를 비운 뒤(서버 재시작과 같음, 다만 모듈 import는 이미 끝난 상태) 메뉴를 차례로 엽니다. 결과는 benchmark_results.jsonl에 한 줄씩 쌓입니다.
+import argparse
+import ast
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+
+import gspread
+import requests
+import streamlit as st
+from streamlit import logger as streamlit_logger
+from gspread.utils import a1_range_to_grid_range, rowcol_to_a1
+from streamlit.testing.v1 import AppTest
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_results.jsonl")
+SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets/fake"
+CURRENT_HEADER = ["입력일시", "부서명", "구분", "업무내용", "진행상태", "마감기한", "담당자", "비고", "비밀번호", "ID"]
+HISTORY_HEADER = ["회차정보", "입력일시", "부서명", "구분", "업무내용", "진행상태", "마감기한", "담당자", "비고"]
+STATUSES = ["진행중", "예정", "완료", "지연"]
+TYPES = ["주요현안", "일반보고", "협조요청"]
+RECORD_PASSWORD = "1234"
+ADMIN_PASSWORD = "1234"  # secrets가 없을 때 앱의 기본 관리자 비밀번호
+SETTLE_QUIET = 0.5     # 초. 이 시간 동안 요청이 없으면 백그라운드 작업(저널 반영, 미리 읽기)이 끝난 것으로 봅니다
+SETTLE_TIMEOUT = 30    # 초
+REGRESSION_RATIO = 1.2  # 비교할 때 20% 넘게 느려지면 표시
+REGRESSION_MIN_MS = 50
+
+# --- 가짜 gspread ---
+
+class FakeBackend:
+    """가짜 스프레드시트 한 개의 데이터와 요청 통계"""
+
+    def __init__(self, sheets, latency, per_kcell, error_rate):
+        self.sheets = sheets  # 시트 이름 -> 행 목록 (머리글 포함, 값은 모두 문자열)
+        self.latency = latency
+        self.per_kcell = per_kcell
+        self.error_rate = error_rate
+        self.lock = threading.RLock()
+        self.requests = 0
+        self.quota_errors = 0
+        self.in_flight = 0
+        self.last_request = time.monotonic()
+        self._pending = threading.local()
+
+    def client(self, http_client_class=None):
+        http_client = (http_client_class or gspread.http_client.HTTPClient)(None, session=FakeSession(self))
+        return FakeClient(self, http_client)
+
+    def call(self, http_client, method, url, operation):
+        """operation을 앱의 HTTP 클라이언트를 거쳐 실행하고 그 결과를 돌려줍니다."""
+        self._pending.operation = operation
+        http_client.request(method, url)
+        return self._pending.result
+
+    def serve(self, method, url):
+        """FakeSession.request에서 호출: 지연 후 실행하거나 429로 거절"""
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+        try:
+            if random.random() < self.error_rate:
+                time.sleep(self.latency)
+                with self.lock:
+                    self.quota_errors += 1
+                return 429, {"error": {"code": 429, "message": "Quota exceeded (fake)", "status": "RESOURCE_EXHAUSTED"}}
+            with self.lock:
+                result, cells = self._pending.operation()
+            time.sleep(self.latency + self.per_kcell * cells / 1000)
+            self._pending.result = result
+            return 200, {}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.last_request = time.monotonic()
+
+    def settle(self):
+        """백그라운드 요청이 잠잠해질 때까지 기다립니다."""
+        deadline = time.monotonic() + SETTLE_TIMEOUT
+        while time.monotonic() < deadline:
+            with self.lock:
+                idle = self.in_flight == 0 and time.monotonic() - self.last_request >= SETTLE_QUIET
+            if idle:
+                return
+            time.sleep(0.05)
+
+class FakeSession:
+    """HTTPClient가 쓰는 requests.Session 대역"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def request(self, method, url, **kwargs):
+        status, body = self.backend.serve(method, url)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode("utf-8")
+        response.url = url
+        return response
+
+class FakeClient:
+    def __init__(self, backend, http_client):
+        self.backend = backend
+        self.http_client = http_client
+
+    def _call(self, method, url, operation):
+        return self.backend.call(self.http_client, method, url, operation)
+
+    def open(self, title):
+        # 실제 open()은 Drive 검색 + 스프레드시트 메타데이터 조회 두 번입니다
+        self._call("GET", "https://www.googleapis.com/drive/v3/files", lambda: (None, 0))
+        self._call("GET", SHEETS_URL, lambda: (None, 0))
+        return FakeSpreadsheet(self, title)
+
+class FakeSpreadsheet:
+    def __init__(self, client, title):
+        self.client = client
+        self.title = title
+
+    def worksheets(self):
+        return self.client._call("GET", SHEETS_URL, lambda: ([FakeWorksheet(self.client, t) for t in self.client.backend.sheets], 0))
+
+    def worksheet(self, title):
+        def find():
+            if title not in self.client.backend.sheets:
+                return None, 0
+            return FakeWorksheet(self.client, title), 0
+        sheet = self.client._call("GET", SHEETS_URL, find)
+        if sheet is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return sheet
+
+    def add_worksheet(self, title, rows=1000, cols=26, **kwargs):
+        def add():
+            self.client.backend.sheets.setdefault(title, [])
+            return FakeWorksheet(self.client, title), 0
+        return self.client._call("POST", SHEETS_URL + ":batchUpdate", add)
+
+class FakeWorksheet:
+    """app.py가 쓰는 gspread.Worksheet 메서드만 구현한 가짜 시트"""
+
+    def __init__(self, client, title):
+        self.client = client
+        self.title = title
+
+    @property
+    def _rows(self):
+        return self.client.backend.sheets[self.title]
+
+    @property
+    def row_count(self):
+        return max(1000, len(self._rows))
+
+    def _read(self, url_suffix, operation):
+        def run():
+            result = operation()  # 행 목록
+            return result, sum(len(row) for row in result)
+        return self.client._call("GET", f"{SHEETS_URL}/values{url_suffix}", run)
+
+    def _write(self, method, url_suffix, cells, operation):
+        return self.client._call(method, f"{SHEETS_URL}/values{url_suffix}", lambda: (operation(), cells))
+
+    @staticmethod
+    def _grid(range_name):
+        grid = a1_range_to_grid_range(range_name)
+        return (grid.get("startRowIndex", 0), grid.get("endRowIndex", 10 ** 7),
+                grid.get("startColumnIndex", 0), grid.get("endColumnIndex", 100))
+
+    def _slice(self, range_name):
+        r0, r1, c0, c1 = self._grid(range_name)
+        return [list(row[c0:c1]) for row in self._rows[r0:r1]]
+
+    def get_all_values(self, **kwargs):
+        return self._read(f"/{self.title}", lambda: [list(r) for r in self._rows])
+
+    def get_all_records(self, **kwargs):
+        def records():
+            if not self._rows:
+                return []
+            header = self._rows[0]
+            return [[r[i] if i < len(r) else "" for i in range(len(header))] for r in self._rows[1:]]
+        rows = self._read(f"/{self.title}", records)
+        header = self._rows[0] if self._rows else []
+        return [dict(zip(header, r)) for r in rows]
+
+    def get(self, range_name=None, **kwargs):
+        return self._read(f"/{self.title}", lambda: self._slice(range_name))
+
+    def batch_get(self, ranges, **kwargs):
+        def run():
+            blocks = [self._slice(r) for r in ranges]
+            return blocks, sum(len(row) for block in blocks for row in block)
+        return self.client._call("GET", f"{SHEETS_URL}/values:batchGet", run)
+
+    def row_values(self, row, **kwargs):
+        values = self._read(f"/{self.title}", lambda: [list(self._rows[row - 1])] if row - 1 < len(self._rows) else [])
+        return values[0] if values else []
+
+    def col_values(self, col, **kwargs):
+        values = self._read(f"/{self.title}", lambda: [[r[col - 1] if col - 1 < len(r) else ""] for r in self._rows])
+        return [v[0] for v in values]
+
+    def _put(self, values, r0, c0):
+        rows = self._rows
+        for i, vals in enumerate(values):
+            while len(rows) <= r0 + i:
+                rows.append([])
+            row = rows[r0 + i]
+            for j, value in enumerate(vals):
+                while len(row) <= c0 + j:
+                    row.append("")
+                row[c0 + j] = str(value)
+
+    def update(self, values=None, range_name=None, **kwargs):
+        r0, _, c0, _ = self._grid(range_name)
+        return self._write("PUT", f"/{self.title}", sum(len(v) for v in values), lambda: self._put(values, r0, c0))
+
+    def update_cell(self, row, col, value):
+        return self._write("PUT", f"/{self.title}", 1, lambda: self._put([[value]], row - 1, col - 1))
+
+    def batch_update(self, data, **kwargs):
+        def run():
+            for item in data:
+                r0, _, c0, _ = self._grid(item["range"])
+                self._put(item["values"], r0, c0)
+        return self._write("POST", ":batchUpdate", sum(len(v) for item in data for v in item["values"]), run)
+
+    def append_rows(self, rows, **kwargs):
+        def run():
+            start = len(self._rows) + 1
+            self._rows.extend([str(v) for v in row] for row in rows)
+            width = max((len(r) for r in rows), default=1)
+            end_col = rowcol_to_a1(1, width)[:-1]
+            return {"updates": {"updatedRange": f"{self.title}!A{start}:{end_col}{len(self._rows)}"}}
+        return self._write("POST", f"/{self.title}:append", sum(len(r) for r in rows), run)
+
+    def append_row(self, row, **kwargs):
+        return self.append_rows([row])
+
+    def delete_rows(self, start, end=None):
+        def run():
+            del self._rows[start - 1:end or start]
+        return self.client._call("POST", SHEETS_URL + ":batchUpdate", lambda: (run(), 0))
+
+    def batch_clear(self, ranges):
+        def run():
+            for range_name in ranges:
+                r0, r1, c0, c1 = self._grid(range_name)
+                for row in self._rows[r0:r1]:
+                    for j in range(c0, min(c1, len(row))):
+                        row[j] = ""
+            while self._rows and not any(self._rows[-1]):
+                self._rows.pop()
+        return self._write("POST", ":batchClear", 0, run)
+
+    def clear(self):
+        return self._write("POST", f"/{self.title}:clear", 0, lambda: self._rows.clear())
+
+# --- 데이터 ---
+
+def app_departments(app_path):
+    """app.py 또는 같은 폴더 config.py의 DEPT_ORDER (찾지 못하면 임의의 부서 29개)"""
+    for path in (app_path, os.path.join(os.path.dirname(app_path), "config.py")):
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "DEPT_ORDER" for t in node.targets):
+                return ast.literal_eval(node.value)
+    return [f"부서{i:02d}" for i in range(1, 30)]
+
+def make_sheets(depts, current_rows, history_rows, meeting_rows, seed=0):
+    rng = random.Random(seed)
+    today = date(2026, 1, 8)
+    current = [CURRENT_HEADER]
+    for i in range(current_rows):
+        dept = depts[i % len(depts)]
+        current.append([
+            f"{today - timedelta(days=i % 5):%Y-%m-%d} {8 + i % 10:02d}:{i % 60:02d}", dept, rng.choice(TYPES),
+            f"{dept} 업무 {i} 추진 현황 보고 및 예산 검토", rng.choice(STATUSES), f"{today + timedelta(days=i % 30):%Y-%m-%d}",
+            f"담당자{i % 97}", "" if i % 3 else "협조 필요", RECORD_PASSWORD, uuid.UUID(int=rng.getrandbits(128)).hex[:12],
+        ])
+    history = [HISTORY_HEADER]
+    meetings = max(1, history_rows // meeting_rows) if history_rows else 0
+    for m in range(meetings):
+        meeting_day = today - timedelta(weeks=meetings - m)
+        name = f"{meeting_day:%Y-%m-%d} 정기회의"
+        count = meeting_rows if m < meetings - 1 else history_rows - meeting_rows * (meetings - 1)
+        for i in range(count):
+            dept = depts[i % len(depts)]
+            history.append([
+                name, f"{meeting_day - timedelta(days=1 + i % 3):%Y-%m-%d} {8 + i % 10:02d}:{i % 60:02d}", dept,
+                rng.choice(TYPES), f"{dept} 업무 {(m * 7 + i) % 500} 추진 현황 보고", rng.choice(STATUSES),
+                f"{meeting_day + timedelta(days=i % 30):%Y-%m-%d}", f"담당자{i % 97}", "",
+            ])
+    return {"Current": current, "History": history}
+
+# --- 앱 실행 ---
+
+def install(backend):
+    """gspread 연결 함수를 가짜로 바꿉니다 (앱이 넘기는 http_client 클래스는 그대로 씁니다)."""
+    def connect(*args, http_client=None, **kwargs):
+        return backend.client(http_client)
+    gspread.service_account = connect
+    gspread.service_account_from_dict = connect
+
+def by_label(elements, label):
+    return next(e for e in elements if e.label.startswith(label))
+
+def pick_menu(at, name):
+    radio = at.sidebar.radio[0]
+    radio.set_value(next(o for o in radio.options if f"({name})" in o))
+
+class Session:
+    """AppTest 하나로 메뉴를 돌며 단계마다 시간/요청/메모리를 기록합니다."""
+
+    def __init__(self, app_path, backend, memory):
+        self.at = AppTest.from_file(app_path, default_timeout=600)
+        self.backend = backend
+        self.memory = memory
+        self.steps = {}
+
+    def step(self, name, action=None):
+        if action:
+            action(self.at)
+        before = self.backend.requests, self.backend.quota_errors
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        self.at.run()
+        elapsed = time.perf_counter() - started
+        peak = (tracemalloc.get_traced_memory()[1] - base) / 2 ** 20 if self.memory else None
+        self.backend.settle()
+        errors = [str(e.value)[:200] for e in self.at.exception] + [str(e.value)[:200] for e in self.at.error]
+        self.steps[name] = {
+            "ms": round(elapsed * 1000),
+            "calls": self.backend.requests - before[0],
+            "quota_errors": self.backend.quota_errors - before[1],
+            "peak_mb": round(peak, 1) if peak is not None else None,
+            "errors": errors,
+        }
+        return self.at
+
+    def run_menus(self):
+        at = self.at
+        self.step("Current 첫 화면")
+        self.step("Input 화면", lambda at: pick_menu(at, "Input"))
+
+        def submit(at):
+            by_label(at.text_area, "업무 내용").set_value("벤치마크 안건 등록")
+            by_label(at.text_input, "비밀번호").set_value(RECORD_PASSWORD)
+            by_label(at.button, "💾 등록하기").click()
+        self.step("Input 등록", submit)
+        self.step("Current 새로고침", lambda at: pick_menu(at, "Current"))
+
+        self.step("Edit 화면", lambda at: pick_menu(at, "Edit"))
+        if any(e.label.startswith("비밀번호 확인") for e in at.text_input):
+            def confirm(at):
+                by_label(at.text_input, "비밀번호 확인").set_value(RECORD_PASSWORD)
+                by_label(at.button, "확인").click()
+            self.step("Edit 인증", confirm)
+
+            def save(at):
+                by_label(at.text_area, "업무 내용").set_value("벤치마크 수정 내용")
+                by_label(at.button, "수정 저장").click()
+            if any(b.label == "수정 저장" for b in at.button):
+                self.step("Edit 저장", save)
+
+        self.step("History 화면", lambda at: pick_menu(at, "History"))
+        self.step("Export 화면", lambda at: pick_menu(at, "Export"))
+
+        self.step("Admin 화면", lambda at: pick_menu(at, "Admin"))
+        by_label(at.text_input, "관리자 비밀번호").set_value(ADMIN_PASSWORD)
+        at.run()
+        self.backend.settle()
+
+        def close(at):
+            by_label(at.text_input, "마감할 회차 이름").set_value(f"{date.today():%Y-%m-%d} 벤치마크 회의")
+            by_label(at.checkbox, "⚠️ 데이터 마감 확인").check()
+            by_label(at.button, "🚀 마감 실행").click()
+        self.step("Admin 마감", close)
+        return self.steps
+
+def run_scenario(app_path, depts, args, current_rows, history_rows, memory):
+    """시나리오 하나 (데이터를 새로 만들고 준비 실행 -> 재시작 -> 측정)"""
+    backend = FakeBackend(
+        make_sheets(depts, current_rows, history_rows, args.meeting_rows),
+        latency=args.latency, per_kcell=args.per_kcell, error_rate=0.0,
+    )
+    install(backend)
+    workdir = tempfile.mkdtemp(prefix="kiwu-bench-")
+    os.environ.update({
+        "KIWU_STORAGE_BACKEND": "gspread",
+        "KIWU_JOURNAL_PATH": os.path.join(workdir, "journal.db"),
+        "KIWU_SQLITE_PATH": os.path.join(workdir, "meeting.db"),
+        "KIWU_SEARCH_PATH": os.path.join(workdir, "search.db"),
+        "KIWU_ANALYTICS_PATH": os.path.join(workdir, "analytics.db"),
+        "KIWU_HISTORY_SNAPSHOT": os.path.join(workdir, "history.arrow"),
+        "KIWU_METRICS_FILE": "",
+    })
+    try:
+        # 준비 실행: 앱이 보조 시트와 로컬 파일을 만들도록 첫 화면과 지난 기록을 한 번 엽니다
+        st.cache_resource.clear()
+        st.cache_data.clear()
+        warmup = AppTest.from_file(app_path, default_timeout=600).run()
+        pick_menu(warmup, "History")
+        warmup.run()
+        backend.settle()
+
+        # 서버 재시작과 같은 상태에서 측정
+        st.cache_resource.clear()
+        st.cache_data.clear()
+        backend.error_rate = args.error_rate
+        return Session(app_path, backend, memory).run_menus()
+    finally:
+        backend.settle()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def run_benchmark(args):
+    app_path = os.path.abspath(args.app)
+    app_dir = os.path.dirname(app_path)
+    # app.py가 같은 폴더의 minutes.py와 이미지 파일을 찾을 수 있도록
+    os.chdir(app_dir)
+    sys.path.insert(0, app_dir)
+    depts = app_departments(app_path)
+    results = {}
+    for history_rows in args.history:
+        for current_rows in args.current:
+            scenario = f"current={current_rows} history={history_rows}"
+            print(f"== {scenario}", flush=True)
+            steps = run_scenario(app_path, depts, args, current_rows, history_rows, memory=False)
+            if args.memory:
+                # 메모리는 추적하는 동안 느려지므로 따로 한 번 더 돌려서 잽니다
+                tracemalloc.start()
+                try:
+                    peaks = run_scenario(app_path, depts, args, current_rows, history_rows, memory=True)
+                finally:
+                    tracemalloc.stop()
+                for name, step in steps.items():
+                    step["peak_mb"] = peaks.get(name, {}).get("peak_mb")
+            results[scenario] = steps
+            print_steps(steps)
+    return results
+
+# --- 결과 저장/비교 ---
+
+def git_version(path):
+    def git(*cmd):
+        return subprocess.run(["git", *cmd], cwd=path, capture_output=True, text=True).stdout.strip()
+    commit = git("rev-parse", "--short", "HEAD")
+    if commit and git("status", "--porcelain"):
+        commit += "-dirty"
+    return commit or None
+
+def print_steps(steps):
+    print(f"  {'단계':<16}{'ms':>8}{'API':>6}{'429':>5}{'peak MB':>9}  오류")
+    for name, s in steps.items():
+        peak = "-" if s["peak_mb"] is None else f"{s['peak_mb']:.1f}"
+        print(f"  {name:<16}{s['ms']:>8}{s['calls']:>6}{s['quota_errors']:>5}{peak:>9}  {'; '.join(s['errors'])[:80]}")
+
+def load_results():
+    if not os.path.exists(RESULTS_FILE):
+        return []
+    with open(RESULTS_FILE, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def save_result(record):
+    with open(RESULTS_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+def compare(record, baseline):
+    print(f"\n== 비교: {baseline['label'] or baseline['commit']} ({baseline['time']}) -> {record['label'] or record['commit']}")
+    if baseline["config"] != record["config"]:
+        print(f"  ※ 설정이 다릅니다: {baseline['config']} -> {record['config']}")
+    regressions = 0
+    for scenario, steps in record["results"].items():
+        before_steps = baseline["results"].get(scenario)
+        if not before_steps:
+            continue
+        print(f"  {scenario}")
+        for name, now in steps.items():
+            before = before_steps.get(name)
+            if not before:
+                continue
+            slower = now["ms"] > before["ms"] * REGRESSION_RATIO and now["ms"] - before["ms"] > REGRESSION_MIN_MS
+            more_calls = now["calls"] > before["calls"]
+            regressions += slower or more_calls
+            change = (now["ms"] - before["ms"]) / before["ms"] * 100 if before["ms"] else 0.0
+            peak = ""
+            if now.get("peak_mb") is not None and before.get("peak_mb") is not None:
+                peak = f"  메모리 {before['peak_mb']:.1f} -> {now['peak_mb']:.1f}MB"
+            mark = "⚠️ " if slower or more_calls else "   "
+            print(f"  {mark}{name:<16}{before['ms']:>7} -> {now['ms']:>7}ms ({change:+.0f}%)  API {before['calls']} -> {now['calls']}{peak}")
+    print(f"  느려지거나 API 호출이 늘어난 단계: {regressions}개")
+    return regressions
+
+def find_baseline(records, ref):
+    """ref(라벨 또는 커밋 앞부분)와 맞는 가장 최근 결과"""
+    for record in reversed(records):
+        if ref in (record.get("label"), record.get("commit")) or (record.get("commit") or "").startswith(ref):
+            return record
+    return None
+
+def parse_sizes(text):
+    return [int(v) for v in text.split(",") if v.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 구글 시트로 app.py의 메뉴별 성능을 잽니다.")
+    parser.add_argument("--app", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"))
+    parser.add_argument("--current", type=parse_sizes, default=[30, 300, 3000], help="Current 행 수 (쉼표로 여러 개)")
+    parser.add_argument("--history", type=parse_sizes, default=[10000], help="History 행 수 (쉼표로 여러 개)")
+    parser.add_argument("--meeting-rows", type=int, default=100, help="History 회차당 행 수")
+    parser.add_argument("--latency", type=float, default=0.15, help="요청 한 번의 기본 지연 (초)")
+    parser.add_argument("--per-kcell", type=float, default=0.002, help="셀 1000개당 추가 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429로 거절할 요청 비율 (0~1)")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="메모리 측정(두 번째 실행)을 건너뜁니다")
+    parser.add_argument("--label", default="", help="결과에 붙일 이름 (비교할 때 사용)")
+    parser.add_argument("--compare", nargs="?", const="", default=None, metavar="REF",
+                        help="저장된 결과와 비교 (REF: 라벨/커밋, 생략하면 직전 결과)")
+    parser.add_argument("--no-save", dest="save", action="store_false", help="결과를 저장하지 않습니다")
+    parser.add_argument("--list", action="store_true", help="저장된 결과 목록만 보여줍니다")
+    args = parser.parse_args()
+
+    if args.list:
+        for record in load_results():
+            print(f"{record['time']}  {record.get('label') or '-':<12} {record.get('commit') or '-':<14} {record['config']}")
+        return 0
+
+    # AppTest를 Streamlit 서버 없이 돌릴 때 나오는 경고는 숨깁니다
+    streamlit_logger.set_log_level("error")
+    records = load_results()
+    record = {
+        "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "label": args.label,
+        "commit": git_version(os.path.dirname(os.path.abspath(args.app))),
+        "config": {
+            "latency": args.latency, "per_kcell": args.per_kcell, "error_rate": args.error_rate,
+            "meeting_rows": args.meeting_rows, "python": sys.version.split()[0],
+        },
+        "results": run_benchmark(args),
+    }
+    if args.save:
+        save_result(record)
+        print(f"\n결과를 {RESULTS_FILE}에 저장했습니다.")
+    if args.compare is not None:
+        baseline = find_baseline(records, args.compare) if args.compare else (records[-1] if records else None)
+        if baseline is None:
+            print("비교할 결과가 없습니다.")
+        else:
+            return 1 if compare(record, baseline) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+# 설정 (부서 목록, 저장소/로컬 파일 경로)
+import streamlit as st
+import os
+
+# 부서 순서 (고정 리스트)
+DEPT_ORDER = [
+    "교목실", "감사팀", "기획팀", "미래전략센터", "혁신지원사업단", 
+    "교무수업팀", "교무인사팀", "교육혁신센터", "학사학위센터", 
+    "학생복지팀", "장애학생지원센터", "학생상담센터", "사회공헌센터", 
+    "커뮤니케이션팀", "입학지원팀", "취창업진로지원센터", "산학운영팀", 
+    "RISE사업단", "현장실습지원센터", "일학습병행공동훈련센터", 
+    "총무팀", "시설안전팀", "국제교육팀", "글로벌커리어센터", 
+    "글로벌인재정주지원센터", "평생교육원", "도서관", "전산정보원", "SG캠퍼스사업단"
+]
+
+# secrets의 [storage] 설정보다 환경변수(KIWU_*)가 우선합니다 (오프라인 테스트용)
+def get_storage_config():
+    try:
+        cfg = dict(st.secrets["storage"]) if "storage" in st.secrets else {}
+    except Exception:
+        cfg = {}
+    return {
+        "backend": os.environ.get("KIWU_STORAGE_BACKEND", cfg.get("backend", "gspread")),
+        "sqlite_path": os.environ.get("KIWU_SQLITE_PATH", cfg.get("sqlite_path", "kiwu_meeting.db")),
+        "mirror_to_sheets": bool(cfg.get("mirror_to_sheets", False)),
+        "journal_path": os.environ.get("KIWU_JOURNAL_PATH", cfg.get("journal_path", "kiwu_journal.db")),
+        "search_index_path": os.environ.get("KIWU_SEARCH_PATH", cfg.get("search_index_path", "kiwu_search.db")),
+        "analytics_path": os.environ.get("KIWU_ANALYTICS_PATH", cfg.get("analytics_path", "kiwu_analytics.db")),
+        # 빈 문자열이면 History 로컬 사본을 쓰지 않습니다
+        "history_snapshot_path": os.environ.get("KIWU_HISTORY_SNAPSHOT", cfg.get("history_snapshot_path", "kiwu_history.arrow")),
+        # 지정하면 계측 값을 Prometheus 텍스트 형식으로 이 파일에 씁니다
+        "metrics_path": os.environ.get("KIWU_METRICS_FILE", cfg.get("metrics_path", "")),
+    }
@@ -0,0 +1,90 @@
+# 안건 DataFrame (모든 메뉴 공용)
+# 레코드는 항상 records_to_df()로 같은 형태의 DataFrame으로 만듭니다.
+#  - 열은 시트 스키마(SHEET_COLUMNS) 순서로 고정하고, 없는 열은 빈 값으로 채웁니다. 비밀번호 열은 싣지 않습니다.
+#  - 부서명/구분/진행상태/회차정보는 순서가 있는 범주형입니다 (목록에 없는 값은 뒤에 나타난 순서대로).
+#    그래서 부서 순 정렬은 sort_values 한 번, 상태/부서별 건수는 value_counts 한 번으로 끝납니다.
+#  - 입력일시/마감기한은 날짜형입니다. 형식이 다른 값이 섞인 열은 문자열 그대로 둡니다.
+# 화면/문서로 내보낼 때는 display_frame()으로 날짜를 원래 형식의 문자열로 되돌립니다.
+import pandas as pd
+from datetime import datetime
+import re
+
+from config import DEPT_ORDER
+from metrics import timed
+from storage import HIDDEN_COLUMNS, SHEET_COLUMNS, get_storage
+from journal import get_journal
+
+STATUS_ORDER = ["진행중", "예정", "완료", "지연"]
+TYPE_ORDER = ["주요현안", "일반보고", "협조요청"]
+CATEGORY_ORDERS = {"회차정보": [], "부서명": DEPT_ORDER, "구분": TYPE_ORDER, "진행상태": STATUS_ORDER}
+DATE_FORMATS = {"입력일시": "%Y-%m-%d %H:%M", "마감기한": "%Y-%m-%d"}
+UNLOADED_COLUMNS = ["비밀번호"]
+
+@timed("데이터 준비")
+def records_to_df(records, sheet_name):
+    """레코드 목록을 안건 DataFrame으로 (인덱스 = 레코드 ID)"""
+    columns = [c for c in SHEET_COLUMNS[sheet_name] if c not in UNLOADED_COLUMNS]
+    df = pd.DataFrame(records, columns=["_id"] + columns).set_index("_id")
+    for name in columns:
+        values = df[name].fillna("").astype(str)
+        if name in CATEGORY_ORDERS:
+            # 서로 다른 값(범주)에 대해서만 순서를 정합니다
+            values = values.astype("category")
+            known = CATEGORY_ORDERS[name]
+            others = [v for v in values.unique() if v not in known]
+            df[name] = values.cat.set_categories(known + others, ordered=True)
+        elif name in DATE_FORMATS:
+            values = values.str.strip()
+            parsed = pd.to_datetime(values, format=DATE_FORMATS[name], errors="coerce")
+            df[name] = parsed if (parsed.notna() | values.eq("")).all() else values
+        else:
+            df[name] = values
+    return df
+
+def load_records_df(sheet_name, include_pending=False):
+    """저장소에서 레코드를 읽어 안건 DataFrame으로 반환
+
+    include_pending=True 이면 아직 저장소에 반영되지 않은 등록 대기 행도 뒤에 붙입니다.
+    """
+    records = get_storage().list_records(sheet_name)
+    if include_pending:
+        # 시트에 반영된 직후 저널에 표시하기 전까지는 같은 행이 양쪽에 있으므로 ID로 걸러 냅니다
+        written = {r["ID"] for r in records if r.get("ID")}
+        records += [r for r in get_journal().pending_records(sheet_name) if r.get("ID") not in written]
+    return records_to_df(records, sheet_name)
+
+@timed("데이터 준비")
+def sort_by_dept(df):
+    """DEPT_ORDER 순 (같은 부서 안에서는 원래 순서 유지)"""
+    return df.sort_values("부서명", kind="stable")
+
+@timed("데이터 준비")
+def summarize_records(df):
+    """진행상태별/부서별 건수. 범주 순서대로이며 건수가 0인 항목도 들어 있습니다."""
+    return {
+        "status": df["진행상태"].value_counts(sort=False),
+        "dept": df["부서명"].value_counts(sort=False),
+    }
+
+@timed("데이터 준비")
+def display_frame(df, columns=None):
+    """화면/출력용 사본: 숨김 열을 빼고 날짜 열을 원래 형식의 문자열로 바꿉니다."""
+    columns = [c for c in (columns or df.columns) if c not in HIDDEN_COLUMNS]
+    out = df[columns].copy()
+    for name, fmt in DATE_FORMATS.items():
+        if name in out.columns and pd.api.types.is_datetime64_any_dtype(out[name]):
+            # 같은 날짜가 많으므로 서로 다른 값만 문자열로 만들고 나머지는 위치로 채웁니다 (빈 값은 -1 -> "")
+            codes, uniques = pd.factorize(out[name])
+            labels = pd.Index(list(pd.DatetimeIndex(uniques).strftime(fmt)) + [""], dtype=object)
+            out[name] = labels.take(codes).to_numpy()
+    return out
+
+def meeting_date(meeting_name):
+    """회차 이름 앞의 날짜 (예: "2026-01-08 정기회의" -> date), 없으면 None"""
+    match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", meeting_name)
+    if match is None:
+        return None
+    try:
+        return datetime(*map(int, match.groups())).date()
+    except ValueError:
+        return None
@@ -0,0 +1,197 @@
+# 안건 등록 저널 (로컬 선기록 + 백그라운드 일괄 반영)
+# 안건 등록은 먼저 로컬 SQLite(WAL) 저널에 기록하고 즉시 완료 처리합니다.
+# 백그라운드 작업자가 모아서 append_rows 한 번으로 저장소에 반영하며,
+# 할당량 초과(429) 등으로 실패하면 지수 백오프로 재시도합니다.
+# 보낸 요청의 결과를 알 수 없는 경우(5xx, 시간 초과, 보내는 중 프로세스 종료)에는 이미 시트에 올라갔을 수 있으므로,
+# 다시 보내기 전에 ID 열을 읽어 이미 있는 행은 반영된 것으로 처리합니다.
+# JOURNAL_MAX_ATTEMPTS번 실패한 행은 반영 실패로 따로 두고 (관리자 화면에서 다시 시도/삭제), 다음 행을 계속 반영합니다.
+import streamlit as st
+import json
+import random
+import sqlite3
+import threading
+import time
+
+from config import get_storage_config
+from sheets import is_quota_error
+from storage import SHEET_COLUMNS, get_storage, without_password
+
+JOURNAL_BATCH_SIZE = 50      # append_rows 한 번에 보낼 최대 행 수
+JOURNAL_FLUSH_INTERVAL = 2   # 초. 새 등록이 없어도 이 간격으로 남은 행을 확인
+JOURNAL_MAX_BACKOFF = 60     # 초
+JOURNAL_KEEP_FLUSHED = 7 * 24 * 3600  # 반영 완료된 행을 저널에 남겨두는 기간 (초)
+JOURNAL_MAX_ATTEMPTS = 10    # 이만큼 실패하면 반영 실패로 옮김 (백오프 합계 약 6분)
+
+class WriteJournal:
+    def __init__(self, path, storage):
+        self.storage = storage
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS journal ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT, sheet TEXT NOT NULL, row TEXT NOT NULL,"
+            " created REAL NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, flushed REAL)"
+        )
+        # uncertain: 보낸 결과를 알 수 없음 (다음에 보내기 전에 ID로 확인), failed: 반영 실패로 옮긴 시각
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(journal)")}
+        for column, ddl in (("uncertain", "INTEGER NOT NULL DEFAULT 0"), ("failed", "REAL"), ("error", "TEXT")):
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE journal ADD COLUMN {column} {ddl}")
+        self._conn.commit()
+        threading.Thread(target=self._run, name="journal-flush", daemon=True).start()
+
+    def submit(self, sheet_name, row):
+        """행을 저널에 기록하고 바로 반환합니다. 저장소 반영은 백그라운드에서 진행됩니다."""
+        with self._lock, self._conn:
+            seq = self._conn.execute(
+                "INSERT INTO journal (sheet, row, created) VALUES (?, ?, ?)",
+                (sheet_name, json.dumps([str(v) for v in row], ensure_ascii=False), time.time()),
+            ).lastrowid
+        self._wake.set()
+        return seq
+
+    def pending_records(self, sheet_name):
+        """아직 저장소에 반영되지 않은 행 (list_records와 같은 형태, ID는 "pending-<번호>")"""
+        columns = SHEET_COLUMNS[sheet_name]
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, row FROM journal WHERE sheet = ? AND flushed IS NULL AND failed IS NULL ORDER BY seq", (sheet_name,)
+            ).fetchall()
+        return [{"_id": f"pending-{seq}", **dict(zip(columns, json.loads(row)))} for seq, row in rows]
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM journal WHERE flushed IS NULL AND failed IS NULL").fetchone()[0]
+
+    def failed_records(self):
+        """반영 실패로 옮긴 행 (관리자 화면 표시용)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, sheet, row, attempts, error, uncertain FROM journal WHERE flushed IS NULL AND failed IS NOT NULL ORDER BY seq"
+            ).fetchall()
+        # 결과를 알 수 없던 행은 이미 시트에 있을 수 있습니다 (다시 시도하면 ID로 확인한 뒤 없는 것만 보냄)
+        return [
+            {"번호": seq, "시트": sheet, "시도": attempts, "시트 반영": "확인 필요" if uncertain else "안 됨", "오류": error,
+             **without_password(dict(zip(SHEET_COLUMNS[sheet], json.loads(row))))}
+            for seq, sheet, row, attempts, error, uncertain in rows
+        ]
+
+    def retry_failed(self):
+        """반영 실패 행을 다시 대기열에 넣습니다."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE journal SET failed = NULL, attempts = 0 WHERE flushed IS NULL AND failed IS NOT NULL")
+        self._wake.set()
+
+    def discard_failed(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM journal WHERE flushed IS NULL AND failed IS NOT NULL")
+
+    def wait_until_flushed(self, timeout):
+        """남은 행을 바로 반영하도록 깨우고, 모두 반영되면 True (시간 초과 시 False)"""
+        deadline = time.monotonic() + timeout
+        while self.pending_count():
+            if time.monotonic() >= deadline:
+                return False
+            self._wake.set()
+            time.sleep(0.2)
+        return True
+
+    def _next_batch(self):
+        # 가장 오래된 행과 같은 시트의 행만 순서대로 묶음
+        with self._lock:
+            first = self._conn.execute(
+                "SELECT sheet FROM journal WHERE flushed IS NULL AND failed IS NULL ORDER BY seq LIMIT 1"
+            ).fetchone()
+            if first is None:
+                return None, []
+            rows = self._conn.execute(
+                "SELECT seq, row, uncertain FROM journal WHERE flushed IS NULL AND failed IS NULL AND sheet = ? ORDER BY seq LIMIT ?",
+                (first[0], JOURNAL_BATCH_SIZE),
+            ).fetchall()
+        return first[0], rows
+
+    def _mark(self, seqs, flushed):
+        marks = ",".join("?" for _ in seqs)
+        with self._lock, self._conn:
+            if flushed:
+                now = time.time()
+                self._conn.execute(f"UPDATE journal SET flushed = ? WHERE seq IN ({marks})", [now, *seqs])
+                self._conn.execute("DELETE FROM journal WHERE flushed < ?", (now - JOURNAL_KEEP_FLUSHED,))
+            else:
+                self._conn.execute(f"UPDATE journal SET attempts = attempts + 1 WHERE seq IN ({marks})", seqs)
+
+    def _set_uncertain(self, batch, sending):
+        """보내기 직전에는 모두 uncertain으로 표시하고, 429로 거절되면 (보내지 않은 것이 확실하므로) 원래 값으로 되돌립니다."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE journal SET uncertain = ? WHERE seq = ?",
+                [(1 if sending else uncertain, seq) for seq, _, uncertain in batch],
+            )
+
+    def _fail(self, seqs, error):
+        """실패 횟수를 올리고, 한도에 이른 행은 반영 실패로 옮깁니다."""
+        self._mark(seqs, flushed=False)
+        marks = ",".join("?" for _ in seqs)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE journal SET failed = ?, error = ? WHERE seq IN ({marks}) AND attempts >= ?",
+                [time.time(), error, *seqs, JOURNAL_MAX_ATTEMPTS],
+            )
+
+    def _already_written(self, sheet_name, batch):
+        """결과를 알 수 없던 행 중 이미 저장소에 있는 행의 seq (ID 열로 확인)"""
+        columns = SHEET_COLUMNS[sheet_name]
+        if "ID" not in columns or not any(uncertain for _, _, uncertain in batch):
+            return set()
+        existing = self.storage.record_ids(sheet_name)
+        id_col = columns.index("ID")
+        written = set()
+        for seq, row, uncertain in batch:
+            values = json.loads(row)
+            if uncertain and id_col < len(values) and values[id_col] in existing:
+                written.add(seq)
+        return written
+
+    def _run(self):
+        backoff = 1
+        while True:
+            self._wake.wait(timeout=JOURNAL_FLUSH_INTERVAL)
+            self._wake.clear()
+            while True:
+                sheet_name, batch = self._next_batch()
+                if not batch:
+                    break
+                seqs = [seq for seq, _, _ in batch]
+                try:
+                    # 지난번에 결과를 알 수 없었던 행은 이미 올라갔는지부터 확인 (같은 안건이 두 번 올라가지 않도록)
+                    written = self._already_written(sheet_name, batch)
+                    if written:
+                        self._mark(sorted(written), flushed=True)
+                        batch = [item for item in batch if item[0] not in written]
+                        seqs = [seq for seq, _, _ in batch]
+                    if batch:
+                        self._set_uncertain(batch, sending=True)
+                        try:
+                            self.storage.append_rows(sheet_name, [json.loads(row) for _, row, _ in batch])
+                        except Exception as e:
+                            if is_quota_error(e):
+                                self._set_uncertain(batch, sending=False)
+                            raise
+                except Exception as e:
+                    self.last_error = f"{'할당량 초과' if is_quota_error(e) else '반영 실패'}: {e}"
+                    self._fail(seqs, self.last_error)
+                    time.sleep(backoff * random.uniform(0.5, 1.0))
+                    backoff = min(backoff * 2, JOURNAL_MAX_BACKOFF)
+                    continue
+                if seqs:
+                    self._mark(seqs, flushed=True)
+                self.last_error = None
+                backoff = 1
+
+@st.cache_resource
+def get_journal():
+    cfg = get_storage_config()
+    return WriteJournal(cfg["journal_path"], get_storage())
@@ -0,0 +1,212 @@
+# 성능 계측 (화면별 구간 시간, 시트 API 호출)
+# 화면을 한 번 그릴 때마다(rerun) 구간별 시간을 모아 메뉴별로 최근 METRICS_SAMPLES회를 보관합니다.
+#  - 시트 조회: 저장소 읽기 (캐시 확인과 다른 세션의 조회를 기다린 시간 포함)
+#  - 데이터 준비: 레코드 -> DataFrame 변환, 정렬, 집계, 화면용 변환
+#  - 표 그리기 / 문서 생성: HTML 표, 워드/ZIP 파일
+#  - 기타: 나머지 (위젯, 검색/분석 색인 등)
+# 구간이 겹치면 안쪽 구간 시간은 바깥 구간에서 뺍니다 (합계 = 전체).
+# 시트 API 호출은 요청마다 시간을 재고, 화면 스크립트에서 나간 호출은 그 화면의 호출 수에도 셉니다.
+# 한 화면이 SLOW_RERUN_SECONDS보다 오래 걸리면 구간별 내역을 로그로 남깁니다.
+import streamlit as st
+from collections import defaultdict, deque
+from datetime import datetime
+import contextlib
+import logging
+import os
+import threading
+import time
+
+from config import get_storage_config
+
+METRICS_SAMPLES = 200
+SLOW_RERUN_SECONDS = 2.0
+SLOW_RERUN_KEEP = 20         # 관리자 화면에 보여 줄 최근 느린 화면 수
+METRICS_FILE_INTERVAL = 15   # 초. Prometheus 텍스트 파일을 다시 쓰는 최소 간격
+METRICS_STAGES = ["시트 조회", "데이터 준비", "표 그리기", "문서 생성", "기타"]
+
+logger = logging.getLogger("kiwu")
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+class Metrics:
+    """프로세스 공용 계측 값. 진행 중인 화면은 스레드별로 따로 기록합니다."""
+
+    def __init__(self, path=""):
+        self.path = path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._reruns = defaultdict(lambda: deque(maxlen=METRICS_SAMPLES))  # 메뉴 -> [(전체, 구간별, 호출 수)]
+        self._call_times = defaultdict(lambda: deque(maxlen=METRICS_SAMPLES))  # 호출 종류 -> 최근 소요 시간
+        self._call_log = deque()  # 최근 1분 동안의 호출 시각
+        self.call_totals = defaultdict(lambda: [0, 0.0, 0])  # 호출 종류 -> [횟수, 시간 합, 오류 수]
+        self.stage_totals = defaultdict(float)
+        self.rerun_totals = defaultdict(lambda: [0, 0.0])  # 메뉴 -> [횟수, 시간 합]
+        self.slow_reruns = deque(maxlen=SLOW_RERUN_KEEP)
+        self.slow_count = 0
+        self._written = 0.0
+
+    def start_rerun(self):
+        self._local.rerun = {"menu": "", "started": time.perf_counter(), "stages": defaultdict(float), "stack": [], "calls": 0}
+
+    def set_menu(self, menu):
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            rerun["menu"] = menu
+
+    def _charge(self, stage, elapsed, own):
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            rerun["stages"][stage] += own
+            if rerun["stack"]:
+                rerun["stack"][-1][0] += elapsed
+        with self._lock:
+            self.stage_totals[stage] += own
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        rerun = getattr(self._local, "rerun", None)
+        inner = [0.0]  # 안쪽 구간이 쓴 시간
+        if rerun is not None:
+            rerun["stack"].append(inner)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if rerun is not None:
+                rerun["stack"].pop()
+            self._charge(stage, elapsed, elapsed - inner[0])
+
+    def record_call(self, label, seconds, failed=False):
+        rerun = getattr(self._local, "rerun", None)
+        if rerun is not None:
+            rerun["calls"] += 1
+        now = time.monotonic()
+        with self._lock:
+            self._call_times[label].append(seconds)
+            self._call_log.append(now)
+            while self._call_log and self._call_log[0] < now - 60:
+                self._call_log.popleft()
+            totals = self.call_totals[label]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += int(failed)
+
+    def finish_rerun(self, cache_stats=None):
+        """cache_stats: 파일을 쓸 때 함께 내보낼 저장소 통계를 돌려주는 함수"""
+        rerun = getattr(self._local, "rerun", None)
+        self._local.rerun = None
+        if rerun is None or not rerun["menu"]:
+            return
+        total = time.perf_counter() - rerun["started"]
+        stages = {name: rerun["stages"].get(name, 0.0) for name in METRICS_STAGES[:-1]}
+        stages["기타"] = max(0.0, total - sum(stages.values()))
+        with self._lock:
+            self._reruns[rerun["menu"]].append((total, stages, rerun["calls"]))
+            self.rerun_totals[rerun["menu"]][0] += 1
+            self.rerun_totals[rerun["menu"]][1] += total
+            self.stage_totals["기타"] += stages["기타"]
+        if total >= SLOW_RERUN_SECONDS:
+            breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stages.items() if seconds >= 0.005)
+            logger.warning("느린 화면: %s %.2fs (API 호출 %d회: %s)", rerun["menu"], total, rerun["calls"], breakdown)
+            with self._lock:
+                self.slow_count += 1
+                self.slow_reruns.appendleft({
+                    "시각": datetime.now().strftime("%m-%d %H:%M:%S"), "메뉴": rerun["menu"],
+                    "전체(초)": round(total, 2), "API 호출": rerun["calls"],
+                    **{f"{name}(초)": round(seconds, 2) for name, seconds in stages.items()},
+                })
+        if self.path and time.monotonic() - self._written >= METRICS_FILE_INTERVAL:
+            self._written = time.monotonic()
+            self.write_file(cache_stats() if cache_stats else None)
+
+    def calls_last_minute(self):
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for t in self._call_log if t >= now - 60)
+
+    def menu_summary(self):
+        """메뉴별 최근 화면의 p50/p95 (밀리초)와 화면당 API 호출 수"""
+        with self._lock:
+            reruns = {menu: list(samples) for menu, samples in self._reruns.items()}
+        rows = []
+        for menu, samples in reruns.items():
+            row = {"메뉴": menu, "화면 수": len(samples)}
+            series = {"전체": [s[0] for s in samples], **{name: [s[1][name] for s in samples] for name in METRICS_STAGES}}
+            for name, values in series.items():
+                row[f"{name} p50"] = round(percentile(values, 0.5) * 1000)
+                row[f"{name} p95"] = round(percentile(values, 0.95) * 1000)
+            row["API 호출 p50"] = percentile([s[2] for s in samples], 0.5)
+            rows.append(row)
+        return rows
+
+    def call_summary(self):
+        """시트 API 호출 종류별 횟수와 p50/p95 (밀리초)"""
+        with self._lock:
+            times = {label: list(values) for label, values in self._call_times.items()}
+            totals = {label: list(values) for label, values in self.call_totals.items()}
+        return [
+            {"호출": label, "횟수": totals[label][0], "오류": totals[label][2],
+             "p50": round(percentile(values, 0.5) * 1000), "p95": round(percentile(values, 0.95) * 1000)}
+            for label, values in sorted(times.items())
+        ]
+
+    def prometheus_text(self, cache_stats=None):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector 등으로 수집)"""
+        def label(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"')
+        lines = [
+            "# HELP kiwu_rerun_seconds 화면 한 번을 그리는 데 걸린 시간 (분위수는 최근 화면 기준)",
+            "# TYPE kiwu_rerun_seconds summary",
+        ]
+        with self._lock:
+            reruns = {menu: [s[0] for s in samples] for menu, samples in self._reruns.items()}
+            rerun_totals = {menu: list(v) for menu, v in self.rerun_totals.items()}
+            call_totals = {name: list(v) for name, v in self.call_totals.items()}
+            stage_totals = dict(self.stage_totals)
+            slow_count = self.slow_count
+        for menu, values in reruns.items():
+            for q in (0.5, 0.95):
+                lines.append(f'kiwu_rerun_seconds{{menu="{label(menu)}",quantile="{q}"}} {percentile(values, q):.4f}')
+            lines.append(f'kiwu_rerun_seconds_count{{menu="{label(menu)}"}} {rerun_totals[menu][0]}')
+            lines.append(f'kiwu_rerun_seconds_sum{{menu="{label(menu)}"}} {rerun_totals[menu][1]:.4f}')
+        lines += ["# HELP kiwu_stage_seconds_total 구간별 누적 시간", "# TYPE kiwu_stage_seconds_total counter"]
+        lines += [f'kiwu_stage_seconds_total{{stage="{label(stage)}"}} {seconds:.4f}' for stage, seconds in stage_totals.items()]
+        lines += ["# HELP kiwu_sheet_requests_total 구글 API 요청 수", "# TYPE kiwu_sheet_requests_total counter"]
+        lines += [f'kiwu_sheet_requests_total{{call="{label(name)}"}} {v[0]}' for name, v in call_totals.items()]
+        lines += ["# HELP kiwu_sheet_request_errors_total 실패한 구글 API 요청 수", "# TYPE kiwu_sheet_request_errors_total counter"]
+        lines += [f'kiwu_sheet_request_errors_total{{call="{label(name)}"}} {v[2]}' for name, v in call_totals.items()]
+        lines += ["# HELP kiwu_sheet_request_seconds_total 구글 API 요청 누적 시간", "# TYPE kiwu_sheet_request_seconds_total counter"]
+        lines += [f'kiwu_sheet_request_seconds_total{{call="{label(name)}"}} {v[1]:.4f}' for name, v in call_totals.items()]
+        lines += ["# TYPE kiwu_slow_reruns_total counter", f"kiwu_slow_reruns_total {slow_count}"]
+        if cache_stats:
+            lines += ["# TYPE kiwu_read_cache_total counter"]
+            lines += [f'kiwu_read_cache_total{{result="{name}"}} {cache_stats[name]}' for name in ("hits", "coalesced", "revalidated", "misses")]
+            scheduler = cache_stats.get("scheduler")
+            if scheduler:
+                lines += ["# HELP kiwu_quota_used 최근 1분 동안 보낸 요청 수", "# TYPE kiwu_quota_used gauge"]
+                lines += [f'kiwu_quota_used{{kind="{kind}"}} {n}' for kind, n in scheduler["used"].items()]
+                lines += ["# TYPE kiwu_quota_limit gauge"]
+                lines += [f'kiwu_quota_limit{{kind="{kind}"}} {n}' for kind, n in scheduler["limit"].items()]
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, cache_stats=None):
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(self.prometheus_text(cache_stats))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning("계측 파일을 쓰지 못했습니다: %s", e)
+
+@st.cache_resource
+def get_metrics():
+    return Metrics(get_storage_config()["metrics_path"])
+
+@contextlib.contextmanager
+def timed(stage):
+    """이 블록(또는 데코레이터로 감싼 함수)에 걸린 시간을 진행 중인 화면의 stage 구간에 더합니다."""
+    with get_metrics().timer(stage):
+        yield
@@ -0,0 +1,97 @@
+# 회의록 파일(워드/인쇄용 HTML) 생성
+# 일괄 내보내기 작업 스레드에서도 실행되므로 streamlit에 의존하지 않습니다.
+import re
+import time
+from datetime import datetime
+from io import BytesIO
+from xml.sax.saxutils import escape as xml_escape
+
+import pandas as pd
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+# 표는 셀마다 python-docx 객체를 만들지 않고, 표 전체 XML을 한 번에 만들어 문서에 붙입니다.
+DOCX_COLUMNS = [("부서", "부서명"), ("구분", "구분"), ("내용", "업무내용"), ("상태", "진행상태"), ("기한", "마감기한"), ("담당자", "담당자")]
+XML_INVALID_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+FILE_NAME_INVALID_CHARS = re.compile(r'[\\/:*?"<>|]')
+
+def _docx_cell_xml(text, width, header=False):
+    run_props = '<w:rPr><w:b/><w:sz w:val="24"/><w:szCs w:val="24"/></w:rPr>' if header else ""
+    lines = [xml_escape(line) for line in XML_INVALID_CHARS.sub("", str(text)).split("\n")]
+    runs = "<w:br/>".join(f'<w:t xml:space="preserve">{line}</w:t>' for line in lines)
+    return (
+        f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr>'
+        f'<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r>{run_props}{runs}</w:r></w:p></w:tc>'
+    )
+
+def _docx_table_xml(df, table_width):
+    col_width = table_width // len(DOCX_COLUMNS)
+    grid = "".join(f'<w:gridCol w:w="{col_width}"/>' for _ in DOCX_COLUMNS)
+    rows = ["<w:tr>" + "".join(_docx_cell_xml(h, col_width, header=True) for h, _ in DOCX_COLUMNS) + "</w:tr>"]
+    for values in df[[c for _, c in DOCX_COLUMNS]].itertuples(index=False, name=None):
+        rows.append("<w:tr>" + "".join(_docx_cell_xml(v, col_width) for v in values) + "</w:tr>")
+    return (
+        f'<w:tbl {nsdecls("w")}>'
+        '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/><w:tblLook w:val="04A0"/></w:tblPr>'
+        f'<w:tblGrid>{grid}</w:tblGrid>{"".join(rows)}</w:tbl>'
+    )
+
+def create_docx(df, title_text):
+    doc = Document()
+    title = doc.add_heading(title_text, 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    divider = doc.add_paragraph("-" * 50)
+
+    section = doc.sections[0]
+    table_width = (section.page_width - section.left_margin - section.right_margin) // 635  # EMU -> twip
+    divider._p.addnext(parse_xml(_docx_table_xml(df, table_width)))
+
+    bio = BytesIO()
+    doc.save(bio)
+    bio.seek(0)
+    return bio
+
+def build_print_html(df, title_text):
+    html_table = df.to_html(index=False, classes='kiwu-table', escape=False)
+    return f"""
+    <html>
+    <head>
+        <style>
+            body {{ font-family: 'Malgun Gothic', sans-serif; padding: 20px; }}
+            h1 {{ text-align: center; color: #003478; }}
+            .date {{ text-align: right; color: #666; margin-bottom: 20px; }}
+            table {{ width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 12px; }}
+            th, td {{ border: 1px solid #444; padding: 8px; }}
+            th {{ 
+                background-color: #f2f2f2; 
+                text-align: center !important; 
+                font-weight: 900 !important; 
+                font-size: 18px !important; 
+                color: #003478;
+                padding: 10px;
+            }}
+            td {{ text-align: center; font-size: 14px; }}
+            td:nth-child(3) {{ text-align: left; }}
+        </style>
+    </head>
+    <body>
+        <h1>{title_text}</h1>
+        <div class="date">출력일: {datetime.now().strftime('%Y-%m-%d')}</div>
+        {html_table}
+    </body>
+    </html>
+    """
+
+def safe_file_name(name):
+    return FILE_NAME_INVALID_CHARS.sub("_", name).strip() or "회의록"
+
+def render_meeting_files(title_text, records, columns):
+    """한 회차의 (제목, 워드 바이트, 인쇄용 HTML 바이트, 소요초). 일괄 내보내기 작업자에서 호출됩니다."""
+    started = time.perf_counter()
+    df = pd.DataFrame(records, columns=columns)
+    docx_bytes = create_docx(df, title_text).getvalue()
+    html_bytes = build_print_html(df, title_text).encode("utf-8")
+    return title_text, docx_bytes, html_bytes, time.perf_counter() - started
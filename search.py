@@ -0,0 +1,122 @@
+# 지난 기록 전체 검색 (로컬 n-gram 색인)
+# History 전체에서 업무내용/비고/담당자/부서명을 찾습니다.
+# 형태소 분석 없이 낱말을 두 글자씩(바이그램) 잘라 색인하므로 "예산", "검토" 같은 한국어 부분 검색이 됩니다.
+# 색인은 로컬 SQLite 파일에 두고, 시트에 새로 생긴 회차만 추가합니다 (관리자 마감 직후, 검색 화면을 열 때).
+import streamlit as st
+import sqlite3
+import threading
+
+from config import get_storage_config
+from storage import HISTORY_COLUMNS
+from frames import meeting_date
+
+SEARCH_FIELDS = ["업무내용", "비고", "담당자", "부서명"]
+SEARCH_RESULT_LIMIT = 300
+
+def search_grams(text):
+    """공백으로 나눈 낱말마다의 두 글자 조각 (한 글자 낱말은 조각 없음)"""
+    grams = set()
+    for token in text.lower().split():
+        grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+class HistorySearchIndex:
+    """History 회차별 레코드의 바이그램 역색인.
+
+    docs에는 검색 결과로 보여줄 레코드를, grams에는 (조각, 문서) 쌍을 둡니다.
+    조각으로 후보를 좁힌 뒤 원문에 검색어가 실제로 있는지 한 번 더 확인합니다.
+    """
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        cols = ", ".join(f'"{c}" TEXT' for c in HISTORY_COLUMNS)
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS docs (doc INTEGER PRIMARY KEY AUTOINCREMENT, {cols}, meeting_date TEXT, search_text TEXT)")
+        self._conn.execute('CREATE INDEX IF NOT EXISTS docs_meeting ON docs ("회차정보")')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS docs_date ON docs (meeting_date)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS grams (gram TEXT NOT NULL, doc INTEGER NOT NULL, PRIMARY KEY (gram, doc)) WITHOUT ROWID")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meetings (meeting TEXT PRIMARY KEY, rows INTEGER NOT NULL)")
+        self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            meetings, rows = self._conn.execute("SELECT COUNT(*), IFNULL(SUM(rows), 0) FROM meetings").fetchone()
+        return {"meetings": meetings, "rows": rows}
+
+    def sync(self, storage):
+        """History에 새로 생긴 회차만 색인에 추가하고, 없어진 회차는 지웁니다. 추가한 회차 수를 반환."""
+        with self._sync_lock:
+            meetings = storage.list_meetings()
+            with self._lock:
+                indexed = {row[0] for row in self._conn.execute("SELECT meeting FROM meetings")}
+            added = [name for name in meetings if name not in indexed]
+            removed = indexed - set(meetings)
+            records = storage.records_for_meetings(added) if added else {}
+            with self._lock, self._conn:
+                for name in removed:
+                    self._delete(name)
+                for name in added:
+                    self._add(name, records.get(name, []))
+            return len(added)
+
+    def rebuild(self, storage):
+        with self._sync_lock, self._lock, self._conn:
+            self._conn.execute("DELETE FROM grams")
+            self._conn.execute("DELETE FROM docs")
+            self._conn.execute("DELETE FROM meetings")
+        return self.sync(storage)
+
+    def _add(self, meeting_name, records):
+        day = meeting_date(meeting_name)
+        columns = ", ".join(f'"{c}"' for c in HISTORY_COLUMNS)
+        marks = ", ".join("?" for _ in HISTORY_COLUMNS)
+        for record in records:
+            text = "\n".join(str(record.get(c, "")) for c in SEARCH_FIELDS).lower()
+            doc = self._conn.execute(
+                f"INSERT INTO docs ({columns}, meeting_date, search_text) VALUES ({marks}, ?, ?)",
+                [str(record.get(c, "")) for c in HISTORY_COLUMNS] + [day.isoformat() if day else "", text],
+            ).lastrowid
+            self._conn.executemany("INSERT OR IGNORE INTO grams (gram, doc) VALUES (?, ?)", [(g, doc) for g in search_grams(text)])
+        self._conn.execute("INSERT INTO meetings (meeting, rows) VALUES (?, ?)", (meeting_name, len(records)))
+
+    def _delete(self, meeting_name):
+        self._conn.execute('DELETE FROM grams WHERE doc IN (SELECT doc FROM docs WHERE "회차정보" = ?)', (meeting_name,))
+        self._conn.execute('DELETE FROM docs WHERE "회차정보" = ?', (meeting_name,))
+        self._conn.execute("DELETE FROM meetings WHERE meeting = ?", (meeting_name,))
+
+    def search(self, query, depts=None, statuses=None, date_from=None, date_to=None, limit=SEARCH_RESULT_LIMIT):
+        """검색어의 모든 낱말을 포함하는 레코드 (최근 회차부터, 최대 limit건). 검색어 없이 조건만으로도 찾습니다."""
+        tokens = query.lower().split()
+        where, params = [], []
+        grams = search_grams(query)
+        if grams:
+            where.append(f"doc IN (SELECT doc FROM grams WHERE gram IN ({', '.join('?' for _ in grams)}) GROUP BY doc HAVING COUNT(*) = ?)")
+            params += [*grams, len(grams)]
+        for token in tokens:
+            where.append("instr(search_text, ?) > 0")
+            params.append(token)
+        if depts:
+            where.append(f'"부서명" IN ({", ".join("?" for _ in depts)})')
+            params += list(depts)
+        if statuses:
+            where.append(f'"진행상태" IN ({", ".join("?" for _ in statuses)})')
+            params += list(statuses)
+        if date_from:
+            where.append("meeting_date >= ?")
+            params.append(date_from.isoformat())
+        if date_to:
+            where.append("meeting_date <= ?")
+            params.append(date_to.isoformat())
+        columns = ", ".join(f'"{c}"' for c in HISTORY_COLUMNS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT doc, {columns} FROM docs WHERE {' AND '.join(where) or '1'} ORDER BY meeting_date DESC, doc LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        return [dict(zip(["_id"] + HISTORY_COLUMNS, row)) for row in rows]
+
+@st.cache_resource
+def get_search_index():
+    return HistorySearchIndex(get_storage_config()["search_index_path"])
@@ -0,0 +1,227 @@
+# 구글 시트 연결 함수
+# 모든 구글 API 요청은 ScheduledHTTPClient를 거쳐 SheetScheduler의 허락을 받은 뒤 나갑니다.
+# - 할당량: Sheets API는 사용자(서비스 계정)당 분당 읽기 60회, 쓰기 60회입니다.
+#   최근 60초 동안 보낸 요청이 (한도 - SHEETS_BURST)개보다 적으면 기다리지 않고 바로 보냅니다.
+#   그 이상이면 토큰 버킷(최대 SHEETS_BURST개, 분당 (한도 - SHEETS_BURST)개 충전)으로 속도를 고르게 하되,
+#   어느 60초를 잘라 봐도 한도는 넘지 않습니다. 429를 받은 뒤 1분 동안은 모든 요청이 토큰을 기다립니다.
+# - 우선순위: 안건 등록/수정/삭제/마감 > 화면 조회 > 백그라운드(시트 복제) 순으로 토큰을 받습니다.
+# - 대기열이 가득 찼거나 SHEET_QUEUE_TIMEOUT 안에 차례가 오지 않으면 SheetBusyError를 냅니다.
+# - 429는 언제나, 5xx/408은 다시 보내도 결과가 같은 요청(GET/PUT)만 흔들림을 준 지수 백오프로 재시도합니다.
+#   (행 추가/삭제는 서버에서 이미 처리됐을 수 있어 재시도하지 않습니다)
+import streamlit as st
+import gspread
+from collections import deque
+import contextlib
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from metrics import get_metrics
+
+SHEETS_QUOTA_PER_MINUTE = {"read": 60, "write": 60}
+SHEETS_BURST = 10
+SHEET_QUEUE_LIMIT = 64     # 동시에 기다릴 수 있는 요청 수 (모든 우선순위 합계)
+SHEET_QUEUE_TIMEOUT = 30   # 초
+SHEET_MAX_RETRIES = 5
+SHEET_RETRY_BASE = 1       # 초
+SHEET_RETRY_CAP = 32       # 초
+SHEET_LANE_WRITE, SHEET_LANE_READ, SHEET_LANE_BACKGROUND = 0, 1, 2
+SHEET_LANE_NAMES = {SHEET_LANE_WRITE: "쓰기", SHEET_LANE_READ: "조회", SHEET_LANE_BACKGROUND: "백그라운드"}
+
+class SheetBusyError(Exception):
+    """시트 요청이 너무 많아 대기열에 들어가지 못했거나, 기다리는 시간이 초과된 경우"""
+
+_sheet_lane = threading.local()
+
+@contextlib.contextmanager
+def sheet_lane(lane):
+    """이 블록(또는 데코레이터로 감싼 함수) 안의 시트 요청 우선순위. 바깥에서 이미 정했으면 그대로 둡니다."""
+    previous = getattr(_sheet_lane, "lane", None)
+    _sheet_lane.lane = lane if previous is None else previous
+    try:
+        yield
+    finally:
+        _sheet_lane.lane = previous
+
+def is_retryable_error(e, idempotent):
+    if not isinstance(e, gspread.exceptions.APIError):
+        return False
+    return e.code == 429 or (idempotent and (e.code == 408 or e.code >= 500))
+
+def is_quota_error(e):
+    return isinstance(e, gspread.exceptions.APIError) and e.code == 429
+
+class SheetScheduler:
+    """구글 API 요청의 토큰 버킷 + 우선순위 대기열"""
+
+    def __init__(self, per_minute=SHEETS_QUOTA_PER_MINUTE, burst=SHEETS_BURST,
+                 queue_limit=SHEET_QUEUE_LIMIT, timeout=SHEET_QUEUE_TIMEOUT):
+        self.burst = burst
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._rates = {kind: (limit - burst) / 60 for kind, limit in per_minute.items()}
+        self._tokens = {kind: float(burst) for kind in per_minute}
+        self._refilled = time.monotonic()
+        self.per_minute = dict(per_minute)
+        self._waiting = {kind: [] for kind in per_minute}  # 종류별 (우선순위, 도착 순번) 힙
+        self._sent = {kind: deque() for kind in per_minute}  # 최근 1분 동안 보낸 시각
+        self._smooth_until = {kind: float("-inf") for kind in per_minute}  # 429 이후 토큰만으로 보내는 기한
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self.requests = {lane: 0 for lane in SHEET_LANE_NAMES}
+        self.retries = 0
+        self.rejected = 0
+        self.max_wait = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._refilled
+        self._refilled = now
+        for kind, rate in self._rates.items():
+            self._tokens[kind] = min(self.burst, self._tokens[kind] + elapsed * rate)
+
+    def _admit_delay(self, kind, now):
+        """지금 보낼 수 있으면 0, 아니면 보낼 수 있을 때까지 남은 초 (토큰이 필요하면 여기서 씁니다)"""
+        sent = self._sent[kind]
+        while sent and sent[0] <= now - 60:
+            sent.popleft()
+        limit = self.per_minute[kind]
+        if len(sent) >= limit:
+            return sent[0] + 60 - now
+        if len(sent) < limit - self.burst and now >= self._smooth_until[kind]:
+            return 0
+        # 한도 가까이에서는 토큰 버킷으로 고르게 보냅니다
+        if self._tokens[kind] >= 1:
+            self._tokens[kind] -= 1
+            return 0
+        return (1 - self._tokens[kind]) / self._rates[kind]
+
+    def acquire(self, kind, lane):
+        """차례가 오고 토큰이 생길 때까지 기다립니다."""
+        with self._cond:
+            if sum(len(queue) for queue in self._waiting.values()) >= self.queue_limit:
+                self.rejected += 1
+                raise SheetBusyError("시트 요청 대기열이 가득 찼습니다.")
+            queue = self._waiting[kind]
+            ticket = (lane, next(self._order))
+            heapq.heappush(queue, ticket)
+            started = time.monotonic()
+            deadline = started + self.timeout
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    first = queue[0] == ticket
+                    delay = self._admit_delay(kind, now) if first else None
+                    if delay == 0:
+                        break
+                    if now >= deadline:
+                        self.rejected += 1
+                        raise SheetBusyError(f"시트 요청이 {self.timeout}초 넘게 차례를 기다렸습니다.")
+                    wait = deadline - now
+                    if first:
+                        wait = min(wait, delay)
+                    self._cond.wait(wait)
+            finally:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+            self.requests[lane] += 1
+            self._sent[kind].append(now)
+            self.max_wait = max(self.max_wait, now - started)
+
+    def _throttle(self, kind):
+        # 429를 받았으면 (다른 프로세스도 같은 할당량을 쓰는 경우) 모아 둔 토큰을 버리고
+        # 1분 동안은 토큰으로만 보내서 다른 요청도 함께 속도를 늦춥니다
+        with self._cond:
+            self._tokens[kind] = min(self._tokens[kind], 0.0)
+            self._smooth_until[kind] = time.monotonic() + 60
+
+    def run(self, kind, send, idempotent):
+        lane = getattr(_sheet_lane, "lane", None)
+        if lane is None:
+            lane = SHEET_LANE_READ if kind == "read" else SHEET_LANE_WRITE
+        for attempt in range(SHEET_MAX_RETRIES + 1):
+            self.acquire(kind, lane)
+            try:
+                return send()
+            except gspread.exceptions.APIError as e:
+                if attempt == SHEET_MAX_RETRIES or not is_retryable_error(e, idempotent):
+                    raise
+                if e.code == 429:
+                    self._throttle(kind)
+                with self._cond:
+                    self.retries += 1
+            time.sleep(random.uniform(0, min(SHEET_RETRY_CAP, SHEET_RETRY_BASE * 2 ** attempt)))
+
+    def stats(self):
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            for sent in self._sent.values():
+                while sent and sent[0] <= now - 60:
+                    sent.popleft()
+            return {
+                "used": {kind: len(sent) for kind, sent in self._sent.items()},
+                "limit": dict(self.per_minute),
+                "tokens": {kind: int(tokens) for kind, tokens in self._tokens.items()},
+                "queued": sum(len(queue) for queue in self._waiting.values()),
+                "requests": {SHEET_LANE_NAMES[lane]: n for lane, n in self.requests.items()},
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "max_wait": self.max_wait,
+            }
+
+class ScheduledHTTPClient(gspread.http_client.HTTPClient):
+    """모든 요청을 SheetScheduler에 통과시키는 gspread HTTP 클라이언트"""
+
+    def __init__(self, auth, session=None):
+        super().__init__(auth, session)
+        self.scheduler = SheetScheduler()
+        self.metrics = get_metrics()
+
+    def request(self, method, endpoint, *args, **kwargs):
+        send = super().request
+        method = method.upper()
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.scheduler.run(
+                "read" if method == "GET" else "write",
+                lambda: send(method, endpoint, *args, **kwargs),
+                idempotent=method in ("GET", "PUT"),
+            )
+            failed = False
+            return response
+        finally:
+            self.metrics.record_call(f"{method} {endpoint_label(endpoint)}", time.perf_counter() - started, failed)
+
+def endpoint_label(endpoint):
+    """계측용 요청 종류 (예: values:batchGet, values:append, batchUpdate, drive/files)"""
+    path = endpoint.split("?", 1)[0]
+    if "/drive/" in path:
+        return "drive"
+    if "/values" in path:
+        tail = path.split("/values", 1)[1]
+        return "values" + (":" + tail.rsplit(":", 1)[1] if ":" in tail.rsplit("/", 1)[-1] else "")
+    last = path.rsplit("/", 1)[-1]
+    return last.rsplit(":", 1)[1] if ":" in last else "spreadsheet"
+
+def error_message(e):
+    """화면에 보여 줄 오류 내용 (시트 혼잡은 다시 시도하라는 안내로 바꿉니다)"""
+    if isinstance(e, SheetBusyError) or is_quota_error(e):
+        return "지금 시트 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+    return str(e)
+
+@st.cache_resource
+def get_connection():
+    try:
+        if "gcp_service_account" in st.secrets:
+            creds_dict = st.secrets["gcp_service_account"]
+            gc = gspread.service_account_from_dict(creds_dict, http_client=ScheduledHTTPClient)
+        else:
+            gc = gspread.service_account(filename='service_account.json', http_client=ScheduledHTTPClient)
+    except Exception:
+        gc = gspread.service_account(filename='service_account.json', http_client=ScheduledHTTPClient)
+    return gc
@@ -0,0 +1,1229 @@
+# 저장소 계층 (Google Sheets / 로컬 SQLite)
+# 모든 메뉴는 아래 인터페이스만 사용합니다. 어떤 저장소를 쓸지는 secrets의 [storage] 설정으로 고릅니다.
+#   [storage]
+#   backend = "sqlite"              # 기본값 "gspread"
+#   sqlite_path = "kiwu_meeting.db"
+#   mirror_to_sheets = true         # SQLite 사용 시 구글 시트에 백그라운드로 복제
+# 환경변수 KIWU_STORAGE_BACKEND 로도 지정할 수 있습니다 (오프라인 테스트용).
+import streamlit as st
+import gspread
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import uuid
+
+from config import get_storage_config
+from metrics import timed
+from sheets import SHEET_LANE_BACKGROUND, SHEET_LANE_WRITE, get_connection, sheet_lane
+
+# --- 시트 읽기 공용 캐시 ---
+# 모든 사용자(세션)가 같은 조회 결과를 공유합니다.
+# 우리 앱에서 쓰기를 하면 즉시 무효화되므로, TTL은 "다른 경로로 수정된 내용"이 반영되는 최대 지연 시간입니다.
+# TTL이 지나도 시트의 리비전(Meta 시트)이 그대로면 전체를 다시 읽지 않고 기존 결과를 계속 씁니다.
+# 다만 시트를 직접 고친 경우는 리비전이 바뀌지 않으므로, REVISION_MAX_AGE마다 한 번은 전체를 다시 읽습니다.
+READ_CACHE_TTL = 30  # 초
+REVISION_MAX_AGE = 600  # 초
+
+class _LoadAbandoned(Exception):
+    """같은 key를 읽던 스레드가 결과 없이 멈춘 경우 (화면 중단, 새로 실행 등). 기다리던 쪽이 직접 다시 읽습니다."""
+
+class SheetReadCache:
+    """시트 읽기 결과를 프로세스 전체에서 공유하는 캐시.
+
+    - TTL 안에서는 저장된 결과를 그대로 돌려줍니다.
+    - TTL이 지난 뒤에는 revalidate()가 True를 돌려주면 (내용이 그대로면) 다시 읽지 않고 TTL만 연장합니다.
+    - 같은 시트를 여러 세션이 동시에 요청하면 구글 API는 한 번만 호출합니다 (single-flight).
+    - invalidate() 이후에는 진행 중이던 조회 결과도 저장하지 않습니다.
+    """
+
+    def __init__(self, ttl, max_age=None):
+        self.ttl = ttl
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries = {}     # key -> (확인 시각, 결과, 전체 조회 시각)
+        self._inflight = {}    # key -> Future
+        self._generation = {}  # sheet_name -> 무효화 횟수
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.revalidated = 0
+
+    def get(self, key, loader, revalidate=None):
+        sheet_name = key[0]
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                is_leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                generation = self._generation.get(sheet_name, 0)
+                is_leader = True
+                # 너무 오래된 결과는 리비전과 상관없이 전체를 다시 읽습니다
+                if revalidate is None or entry is None or (self.max_age is not None and now - entry[2] >= self.max_age):
+                    entry = None
+
+        if not is_leader:
+            try:
+                return future.result()
+            except _LoadAbandoned:
+                return self.get(key, loader, revalidate)
+
+        try:
+            if entry is not None and revalidate():
+                value, loaded_at = entry[1], entry[2]
+                revalidated = True
+            else:
+                value, loaded_at = loader(), time.monotonic()
+                revalidated = False
+        except BaseException as e:
+            # Streamlit의 StopException/RerunException은 Exception이 아니므로 여기서 함께 정리해야
+            # 기다리던 다른 세션이 멈추지 않습니다 (그 경우 그 세션들은 직접 다시 읽습니다)
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(e if isinstance(e, Exception) else _LoadAbandoned())
+            raise
+
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.misses += 1
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if self._generation.get(sheet_name, 0) == generation:
+                self._entries[key] = (time.monotonic(), value, loaded_at)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, *sheet_names):
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] in sheet_names:
+                    del self._entries[key]
+            for key in list(self._inflight):
+                if key[0] in sheet_names:
+                    del self._inflight[key]
+            for name in sheet_names:
+                self._generation[name] = self._generation.get(name, 0) + 1
+
+    def expire(self, *sheet_names):
+        """결과는 남겨 두고 TTL만 끝난 것으로 표시합니다 (다음 조회 때 리비전부터 확인)."""
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key[0] in sheet_names:
+                    self._entries[key] = (float("-inf"), entry[1], entry[2])
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses + self.coalesced + self.revalidated
+            saved = self.hits + self.coalesced + self.revalidated
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "revalidated": self.revalidated,
+                "hit_rate": saved / total if total else 0.0,
+            }
+
+# --- 시트 구성 ---
+SPREADSHEET_NAME = "경인여대 스마트회의 DB"
+CURRENT_COLUMNS = ["입력일시", "부서명", "구분", "업무내용", "진행상태", "마감기한", "담당자", "비고", "비밀번호", "ID"]
+HIDDEN_COLUMNS = ["비밀번호", "ID"]  # 화면/출력에 보이지 않는 열
+HISTORY_COLUMNS = ["회차정보"] + [c for c in CURRENT_COLUMNS if c not in HIDDEN_COLUMNS]  # 비밀번호와 ID는 보관하지 않음
+SHEET_COLUMNS = {"Current": CURRENT_COLUMNS, "History": HISTORY_COLUMNS}
+# 지난 기록 색인: 회차별로 History의 몇 번째 행부터 몇 번째 행까지인지 (관리자 마감 때 한 줄씩 추가)
+HISTORY_INDEX_SHEET = "HistoryIndex"
+HISTORY_INDEX_COLUMNS = ["회차정보", "시작행", "끝행", "행수"]
+# 마감 작업 기록: 중간에 실패해도 같은 회차 이름으로 다시 실행하면 이어서 진행합니다
+CLOSE_JOBS_SHEET = "CloseJobs"
+CLOSE_JOB_COLUMNS = ["회차정보", "상태", "전체행수", "완료행수", "시작일시", "갱신일시"]
+CLOSE_CHUNK_ROWS = 500  # append_rows 한 번에 보낼 행 수 (요청 크기 제한보다 충분히 작게)
+HISTORY_BATCH_RANGES = 100  # batch_get 한 번에 요청할 범위 수 (URL 길이 제한)
+# 변경 감지: 우리 앱이 시트에 쓸 때마다 Meta 시트의 리비전 값을 새로 바꿉니다.
+# 다른 세션/프로세스는 이 작은 범위만 읽어서 전체 조회가 필요한지 판단합니다.
+REVISION_SHEET = "Meta"
+REVISION_COLUMNS = ["시트", "리비전", "갱신일시"]
+REVISION_ROWS = {"Current": 2, "History": 3}  # Meta 시트에서 각 시트의 리비전이 있는 행
+REVISION_SOURCES = {"Current": "Current", "History": "History", HISTORY_INDEX_SHEET: "History"}  # 캐시 시트 -> 리비전
+REVISION_POLL_TTL = 2  # 초. 여러 화면이 동시에 확인해도 Meta 조회는 이 간격에 한 번
+PREFETCH_WORKERS = 2  # 세션 시작 때 Current와 History를 동시에 읽는 작업자 수
+# History 로컬 사본(HistorySnapshot): 시트와 맞출 때 기존 행 중 마지막 행과 임의의 몇 행을 시트와 직접 비교합니다
+SNAPSHOT_META_KEY = b"kiwu"
+SNAPSHOT_PROBE_ROWS = 2  # 마지막 행 말고 무작위로 비교할 기존 행 수
+# 안건 비밀번호는 솔트를 붙인 PBKDF2 해시로 저장합니다 (해시 도입 전에 등록된 평문도 그대로 확인됩니다)
+PASSWORD_HASH_ITERATIONS = 100_000
+PASSWORD_HASH_PREFIX = "pbkdf2_sha256"
+
+class RecordConflictError(Exception):
+    """수정/삭제하려는 안건이 읽은 이후 다른 사용자에 의해 바뀌었거나 삭제된 경우"""
+
+class MeetingAlreadyClosedError(Exception):
+    """같은 회차 이름으로 이미 마감이 끝난 경우 (중복 클릭 등)"""
+
+def new_record_id():
+    return uuid.uuid4().hex[:12]
+
+def legacy_record_id(record):
+    """ID 열이 생기기 전에 등록된 행의 임시 ID (등록일시+부서+내용 기준)"""
+    key = "|".join(str(record.get(c, "")) for c in ("입력일시", "부서명", "업무내용"))
+    return "legacy-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+def with_record_ids(records):
+    """Current 레코드 목록에 "_id"를 붙인 복사본 (시트 순서대로 넘겨야 합니다).
+
+    ID가 없는 기존 행은 legacy_record_id()를 쓰되, 같은 분에 같은 부서가 같은 내용을 두 번 등록한 경우
+    (예전 화면에서 두 번 클릭) 두 번째부터는 "-2", "-3"을 붙여 서로 다른 ID가 되게 합니다.
+    같은 내용의 행은 부서도 같으므로 한 부서의 행만 넘겨도 전체에서 붙인 ID와 같습니다.
+    """
+    seen = {}
+    result = []
+    for record in records:
+        record_id = record.get("ID")
+        if not record_id:
+            record_id = legacy_record_id(record)
+            seen[record_id] = seen.get(record_id, 0) + 1
+            if seen[record_id] > 1:
+                record_id = f"{record_id}-{seen[record_id]}"
+        result.append({"_id": record_id, **record})
+    return result
+
+def row_runs(row_nums):
+    """오름차순 행 번호 목록 -> 이어진 구간 [(시작행, 끝행), ...]"""
+    runs = []
+    for row_num in row_nums:
+        if runs and runs[-1][1] == row_num - 1:
+            runs[-1][1] = row_num
+        else:
+            runs.append([row_num, row_num])
+    return [tuple(run) for run in runs]
+
+def _read_row_runs(sheet, header, runs):
+    """[(시작행, 끝행), ...] 구간을 batch_get으로 묶어 읽고 [(행 번호, 레코드), ...]를 반환합니다."""
+    end_col = gspread.utils.rowcol_to_a1(1, len(header))[:-1]
+    ranges = [f"A{first}:{end_col}{last}" for first, last in runs]
+    blocks = []
+    for start in range(0, len(ranges), HISTORY_BATCH_RANGES):
+        blocks.extend(sheet.batch_get(ranges[start:start + HISTORY_BATCH_RANGES]))
+    return [
+        (first + offset, dict(zip(header, row + [""] * (len(header) - len(row)))))
+        for (first, _), block in zip(runs, blocks)
+        for offset, row in enumerate(block)
+    ]
+
+def find_conflict(current, expected):
+    """읽었던 값(expected)과 지금 값(current)이 다른 열 이름, 없으면 None"""
+    for name, value in expected.items():
+        if name in current and name != "ID" and str(value) != str(current[name]):
+            return name
+    return None
+
+def hash_password(password, salt=None, iterations=PASSWORD_HASH_ITERATIONS):
+    """시트에 저장할 비밀번호 값 ("pbkdf2_sha256$반복횟수$솔트$해시")"""
+    salt = salt or os.urandom(8).hex()
+    digest = hashlib.pbkdf2_hmac("sha256", str(password).encode("utf-8"), salt.encode("ascii"), iterations).hex()
+    return f"{PASSWORD_HASH_PREFIX}${iterations}${salt}${digest}"
+
+def password_matches(stored, password):
+    """저장된 값(해시 또는 예전 평문)과 입력한 비밀번호가 같은지"""
+    stored = str(stored)
+    if stored.startswith(PASSWORD_HASH_PREFIX + "$"):
+        _, iterations, salt, _ = stored.split("$", 3)
+        candidate = hash_password(password, salt, int(iterations))
+    else:
+        candidate = str(password)
+    return hmac.compare_digest(stored.encode("utf-8"), candidate.encode("utf-8"))
+
+def without_password(record):
+    return {k: v for k, v in record.items() if k != "비밀번호"}
+
+class Storage:
+    """안건 저장소 인터페이스.
+
+    list_records()가 돌려주는 각 레코드에는 "_id" 키가 들어 있으며,
+    update_record()/delete_record()에 그대로 넘기면 됩니다.
+    expected에 읽었던 레코드를 넘기면 그 사이 다른 사용자가 바꾼 경우 RecordConflictError를 냅니다.
+    """
+
+    def list_records(self, sheet_name):
+        raise NotImplementedError
+
+    def list_departments(self, sheet_name):
+        """레코드가 있는 부서 이름 (가나다순)"""
+        return sorted({r["부서명"] for r in self.list_records(sheet_name) if r.get("부서명")})
+
+    def _department_records_raw(self, sheet_name, dept):
+        """한 부서의 레코드 (비밀번호 포함 — 저장소 밖으로 내보내지 않습니다)"""
+        return [r for r in self.list_records(sheet_name) if r.get("부서명") == dept]
+
+    def department_records(self, sheet_name, dept):
+        """한 부서의 레코드만 반환합니다. 비밀번호 열은 싣지 않습니다."""
+        return [without_password(r) for r in self._department_records_raw(sheet_name, dept)]
+
+    def check_password(self, sheet_name, dept, record_id, password):
+        """부서 안건 하나의 비밀번호 확인. 맞으면 그 레코드(비밀번호와 _id 제외, 수정/삭제의 expected로 쓰면 됨), 틀리면 None"""
+        record = next((r for r in self._department_records_raw(sheet_name, dept) if r["_id"] == record_id), None)
+        if record is None:
+            raise RecordConflictError("다른 사용자가 이미 삭제한 안건입니다.")
+        if not password_matches(record.get("비밀번호") or "", password):
+            return None
+        return {k: v for k, v in without_password(record).items() if k != "_id"}
+
+    def record_ids(self, sheet_name):
+        """지금 저장된 행들의 ID 열 값 (캐시를 거치지 않음 — 결과를 알 수 없던 쓰기를 다시 보내기 전 확인용)"""
+        return {r.get("ID") for r in self.list_records(sheet_name) if r.get("ID")}
+
+    def append_rows(self, sheet_name, rows):
+        raise NotImplementedError
+
+    def append_row(self, sheet_name, row):
+        self.append_rows(sheet_name, [row])
+
+    def update_record(self, sheet_name, record_id, fields, expected=None):
+        raise NotImplementedError
+
+    def delete_record(self, sheet_name, record_id, expected=None):
+        raise NotImplementedError
+
+    def close_meeting(self, meeting_name, on_progress=None):
+        """Current 전체를 회차 이름과 함께 History로 옮기고 Current를 비웁니다. 옮긴 행 수를 반환.
+
+        on_progress(완료행수, 전체행수, 이번 묶음 소요초)가 묶음마다 호출됩니다.
+        이미 마감된 회차 이름이면 MeetingAlreadyClosedError를 냅니다.
+        """
+        raise NotImplementedError
+
+    def incomplete_close_jobs(self):
+        """중간에 멈춘 마감 작업의 회차 이름 목록"""
+        return []
+
+    def list_meetings(self):
+        """History에 보관된 회차 이름 (마감 순서)"""
+        raise NotImplementedError
+
+    def meeting_records(self, meeting_name):
+        """한 회차의 History 레코드만 반환"""
+        return self.records_for_meetings([meeting_name])[meeting_name]
+
+    def records_for_meetings(self, meeting_names):
+        """여러 회차의 History 레코드를 한 번에 읽어 {회차: 레코드 목록}으로 반환"""
+        raise NotImplementedError
+
+    def rebuild_history_index(self):
+        """History를 직접 고친 경우 회차 색인을 다시 만듭니다."""
+
+    def prefetch(self):
+        """세션 시작 때 자주 쓰는 데이터를 백그라운드에서 미리 읽어 둡니다 (결과를 기다리지 않음)."""
+
+    def revision(self, sheet_name):
+        """변경 감지용 리비전 값 (우리 앱의 쓰기마다 바뀜). 지원하지 않거나 아직 없으면 None"""
+        return None
+
+    def invalidate(self, *sheet_names):
+        """외부에서 바뀌었을 수 있는 데이터를 다시 읽도록 표시합니다."""
+
+    def refresh(self, *sheet_names):
+        """새로고침: 리비전이 바뀐 경우에만 다시 읽도록 표시합니다."""
+        self.invalidate(*sheet_names)
+
+    def cache_stats(self):
+        return None
+
+class GSheetStorage(Storage):
+    """구글 스프레드시트 저장소.
+
+    레코드 ID는 Current의 ID 열 값이고, ID가 없는 기존 행은 with_record_ids()가 내용으로 만든 ID를 씁니다.
+    수정/삭제 시에는 그 시점의 실제 행 번호를 ID로 다시 찾으므로 중간에 다른 행이 지워져도 안전합니다.
+    """
+
+    def __init__(self, gc, cache, snapshot=None):
+        self.gc = gc
+        self.cache = cache
+        self.snapshot = snapshot
+        self.revision_cache = SheetReadCache(REVISION_POLL_TTL)
+        self._seen_revisions = {}  # 캐시 key -> 그 결과를 읽기 직전의 리비전
+        self._headers = {}
+        # 스프레드시트와 시트 핸들은 한 번 찾으면 계속 재사용합니다 (gc.open은 Drive 검색 + 메타데이터 조회)
+        self._doc = None
+        self._worksheets = {}
+        self._handle_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="sheet-prefetch")
+        # 마감 중에는 이 프로세스의 다른 Current 쓰기(등록 저널 반영 등)를 잠시 멈춥니다
+        self._write_lock = threading.RLock()
+
+    def worksheet(self, sheet_name):
+        sheet = self._find_worksheet(sheet_name)
+        if sheet is None:
+            raise gspread.exceptions.WorksheetNotFound(sheet_name)
+        return sheet
+
+    def _find_worksheet(self, title, create_columns=None):
+        """시트 핸들. 없으면 create_columns가 있을 때 머리글과 함께 만들고, 아니면 None"""
+        with self._handle_lock:
+            if self._doc is None:
+                self._doc = self.gc.open(SPREADSHEET_NAME)
+                # 메타데이터 한 번으로 모든 시트의 핸들을 찾아 둡니다
+                self._worksheets = {sheet.title: sheet for sheet in self._doc.worksheets()}
+            if title not in self._worksheets:
+                try:
+                    self._worksheets[title] = self._doc.worksheet(title)
+                except gspread.exceptions.WorksheetNotFound:
+                    if create_columns is None:
+                        return None
+                    sheet = self._doc.add_worksheet(title=title, rows=1000, cols=len(create_columns))
+                    sheet.update(values=[create_columns], range_name="A1")
+                    self._worksheets[title] = sheet
+            return self._worksheets[title]
+
+    def _header(self, sheet):
+        """시트 머리글. Current에 ID 열이 없으면 한 번 추가합니다."""
+        if sheet.title not in self._headers:
+            header = sheet.row_values(1)
+            if sheet.title == "Current" and "ID" not in header:
+                sheet.update_cell(1, len(header) + 1, "ID")
+                header.append("ID")
+            self._headers[sheet.title] = header
+        return self._headers[sheet.title]
+
+    def _locate(self, sheet, header, record_id):
+        """ID에 해당하는 지금의 (행 번호, 행 값) — 없으면 RecordConflictError"""
+        ids = sheet.col_values(header.index("ID") + 1)
+        if record_id in ids[1:]:
+            row_num = ids.index(record_id, 1) + 1
+            row = sheet.row_values(row_num)
+        else:
+            # ID 열이 비어 있는 기존 행은 내용으로 찾습니다 (list_records와 같은 순서로 ID를 붙여 비교)
+            rows = sheet.get_all_values()[1:]
+            records = with_record_ids(dict(zip(header, row)) for row in rows)
+            matches = [i for i, record in enumerate(records) if record["_id"] == record_id]
+            if not matches:
+                raise RecordConflictError("다른 사용자가 이미 삭제한 안건입니다.")
+            row_num, row = matches[0] + 2, rows[matches[0]]
+        return row_num, row + [""] * (len(header) - len(row))
+
+    def _check_expected(self, current, expected):
+        if expected is not None:
+            changed = find_conflict(current, expected)
+            if changed:
+                raise RecordConflictError(f"다른 사용자가 먼저 수정한 안건입니다. ({changed})")
+
+    @timed("시트 조회")
+    def list_records(self, sheet_name):
+        # 값은 모두 문자열로 받습니다 (비밀번호 "0123"이 123으로 바뀌지 않도록)
+        data = self._cached((sheet_name, "records"), lambda: self.worksheet(sheet_name).get_all_records(numericise_ignore=["all"]))
+        # 캐시된 원본이 바뀌지 않도록 복사본에 ID를 붙여서 반환
+        if sheet_name == "Current":
+            return with_record_ids(data)
+        return [{"_id": i + 2, **r} for i, r in enumerate(data)]
+
+    def department_rows(self, sheet_name):
+        """부서명 -> 그 부서의 행 번호 목록. 부서명 열 하나만 읽으며, 쓰기나 리비전 변경 시 다시 만듭니다."""
+        def load():
+            sheet = self.worksheet(sheet_name)
+            names = sheet.col_values(self._header(sheet).index("부서명") + 1)
+            rows = {}
+            for row_num, dept in enumerate(names[1:], start=2):
+                if dept:
+                    rows.setdefault(dept, []).append(row_num)
+            return rows
+        return self._cached((sheet_name, "dept_rows"), load)
+
+    @timed("시트 조회")
+    def list_departments(self, sheet_name):
+        return sorted(self.department_rows(sheet_name))
+
+    @timed("시트 조회")
+    def _department_records_raw(self, sheet_name, dept):
+        def read():
+            row_nums = self.department_rows(sheet_name).get(dept, [])
+            if not row_nums:
+                return [], True
+
+            def load():
+                # 이어진 행은 범위 하나로 묶어 batch_get으로 한꺼번에 읽습니다
+                sheet = self.worksheet(sheet_name)
+                return [record for _, record in _read_row_runs(sheet, self._header(sheet), row_runs(row_nums))]
+
+            records = self._cached((sheet_name, "dept", dept), load)
+            mine = [r for r in records if r.get("부서명") == dept]
+            return mine, len(mine) == len(records) == len(row_nums)
+
+        return with_record_ids(self._read_checked(read, lambda: self.cache.invalidate(sheet_name)))
+
+    def _read_checked(self, read, repair):
+        """read()는 (결과, 색인과 맞는지)를 반환합니다.
+
+        맞지 않으면 (누군가 시트에서 행을 직접 지우거나 옮긴 경우) repair()로 색인을 다시 만들고 한 번 더 읽습니다.
+        그래도 맞지 않으면 두 번째 결과를 그대로 씁니다.
+        """
+        result, consistent = read()
+        if not consistent:
+            repair()
+            result, _ = read()
+        return result
+
+    @timed("시트 조회")
+    def record_ids(self, sheet_name):
+        sheet = self.worksheet(sheet_name)
+        return {value for value in sheet.col_values(self._header(sheet).index("ID") + 1)[1:] if value}
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def append_rows(self, sheet_name, rows):
+        sheet = self.worksheet(sheet_name)
+        self._header(sheet)
+        with self._write_lock:
+            sheet.append_rows([list(r) for r in rows])
+        self.cache.invalidate(sheet_name)
+        if sheet_name == "History":
+            self.cache.invalidate(HISTORY_INDEX_SHEET)
+            if self.snapshot is not None:
+                self.snapshot.expire()
+        self._bump_revision(sheet_name)
+
+    def append_row(self, sheet_name, row):
+        self.append_rows(sheet_name, [row])
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def update_record(self, sheet_name, record_id, fields, expected=None):
+        sheet = self.worksheet(sheet_name)
+        header = self._header(sheet)
+        try:
+            self._write_lock.acquire()
+            row_num, row = self._locate(sheet, header, record_id)
+            current = dict(zip(header, row))
+            self._check_expected(current, expected)
+            current.update({name: str(value) for name, value in fields.items()})
+            current["ID"] = current.get("ID") or new_record_id()  # 임시 ID는 다른 중복 행과 겹칠 수 있으므로 새 ID
+            # 바뀐 열 개수와 상관없이 한 행을 범위 하나로 한 번에 기록
+            end_cell = gspread.utils.rowcol_to_a1(row_num, len(header))
+            sheet.update(values=[[current.get(c, "") for c in header]], range_name=f"A{row_num}:{end_cell}")
+        finally:
+            self._write_lock.release()
+            self.cache.invalidate(sheet_name)
+        self._bump_revision(sheet_name)
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def delete_record(self, sheet_name, record_id, expected=None):
+        sheet = self.worksheet(sheet_name)
+        header = self._header(sheet)
+        try:
+            self._write_lock.acquire()
+            row_num, row = self._locate(sheet, header, record_id)
+            self._check_expected(dict(zip(header, row)), expected)
+            sheet.delete_rows(row_num)
+        finally:
+            self._write_lock.release()
+            self.cache.invalidate(sheet_name)
+        self._bump_revision(sheet_name)
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def close_meeting(self, meeting_name, on_progress=None):
+        with self._write_lock:
+            try:
+                return self._run_close_job(meeting_name, on_progress)
+            finally:
+                self.cache.invalidate("Current", "History", HISTORY_INDEX_SHEET, CLOSE_JOBS_SHEET)
+                if self.snapshot is not None:
+                    self.snapshot.expire()
+                self._bump_revision("Current", "History")
+
+    def _run_close_job(self, meeting_name, on_progress):
+        jobs_sheet = self._aux_sheet(CLOSE_JOBS_SHEET, CLOSE_JOB_COLUMNS, create=True)
+        jobs = jobs_sheet.get_all_records(numericise_ignore=["all"])
+        job_row = next((i for i, job in enumerate(jobs, start=2) if job["회차정보"] == meeting_name), None)
+        if job_row is not None and jobs[job_row - 2]["상태"] == "완료":
+            raise MeetingAlreadyClosedError(f"'{meeting_name}' 회차는 이미 마감되었습니다.")
+        if job_row is None and meeting_name in self.list_meetings():
+            raise MeetingAlreadyClosedError(f"'{meeting_name}' 회차는 이미 History에 있습니다.")
+        resumed = job_row is not None
+        job = jobs[job_row - 2] if resumed else None
+        if resumed and job["상태"] == "비움":
+            # Current를 이미 비운 뒤 멈춘 경우: 옮길 행은 모두 History에 있습니다.
+            # 지금 Current에 있는 행은 그 뒤에 등록된 다음 회차 안건이므로 다시 읽지 않습니다.
+            return self._finish_cleared_close(jobs_sheet, job_row, int(job["전체행수"] or 0), on_progress)
+
+        cur_sheet = self.worksheet("Current")
+        his_sheet = self.worksheet("History")
+        # 마감은 반드시 최신 데이터로 처리 (캐시 미사용)
+        data = cur_sheet.get_all_values()
+        header = data[0] if data else []
+        history_records = []
+        for row in data[1:]:
+            record = dict(zip(header, row))
+            history_records.append([meeting_name] + [record.get(c, "") for c in HISTORY_COLUMNS[1:]])
+        total = len(history_records)
+        if total == 0 and job_row is None:
+            return 0
+
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if not resumed:
+            jobs_sheet.append_row([meeting_name, "진행중", total, 0, now, now])
+            job_row = len(jobs) + 2
+            remaining = history_records
+        else:
+            # 재개: 이미 History로 옮겨진 행은 내용으로 대조해서 건너뜁니다
+            remaining, archived = self._not_yet_moved(his_sheet, meeting_name, history_records)
+            recorded = int(job["전체행수"] or 0)
+            if recorded and archived >= recorded and len(remaining) == len(history_records):
+                # "비움" 기록 직전에 멈춘 경우: 기록된 행은 모두 옮겨졌고 Current에는 그중 한 행도 남아 있지 않습니다
+                return self._finish_cleared_close(jobs_sheet, job_row, recorded, on_progress)
+        done = total - len(remaining)
+        if on_progress:
+            on_progress(done, total, 0.0)
+
+        responses = []
+        for start in range(0, len(remaining), CLOSE_CHUNK_ROWS):
+            started = time.perf_counter()
+            chunk = remaining[start:start + CLOSE_CHUNK_ROWS]
+            responses.append(his_sheet.append_rows(chunk))
+            done += len(chunk)
+            jobs_sheet.update(values=[["진행중", total, done, now, datetime.now().strftime("%Y-%m-%d %H:%M:%S")]], range_name=f"B{job_row}:F{job_row}")
+            if on_progress:
+                on_progress(done, total, time.perf_counter() - started)
+
+        # 마감 시작 때 읽은 실제 데이터 범위 전체를 비웁니다 (1000행 제한 없음)
+        if len(data) > 1:
+            end_col = gspread.utils.rowcol_to_a1(1, max(len(header), max(len(r) for r in data)))[:-1]
+            cur_sheet.batch_clear([f"A2:{end_col}{len(data)}"])
+        # 여기서부터 멈추면 Current를 다시 읽지 않고 색인만 마무리합니다
+        jobs_sheet.update(values=[["비움", total, done]], range_name=f"B{job_row}:D{job_row}")
+        # 재개한 작업은 첫 시도에서 옮긴 구간을 모르므로 A열로 색인을 다시 계산합니다
+        self._append_history_index(meeting_name, responses, resumed=resumed)
+        jobs_sheet.update(values=[["완료", total, done]], range_name=f"B{job_row}:D{job_row}")
+        return total
+
+    def _finish_cleared_close(self, jobs_sheet, job_row, total, on_progress):
+        self.rebuild_history_index()
+        jobs_sheet.update(values=[["완료", total, total]], range_name=f"B{job_row}:D{job_row}")
+        if on_progress:
+            on_progress(total, total, 0.0)
+        return total
+
+    def _not_yet_moved(self, his_sheet, meeting_name, history_records):
+        """(아직 History에 없는 행 목록, History에 이미 있는 이 회차의 행 수)"""
+        names = his_sheet.col_values(1)
+        header = self._header(his_sheet)
+        row_nums = [row_num for row_num, name in enumerate(names, start=1) if row_num > 1 and name == meeting_name]
+        moved = {}
+        for _, record in _read_row_runs(his_sheet, header, row_runs(row_nums)):
+            key = tuple(record[c] for c in header)
+            moved[key] = moved.get(key, 0) + 1
+        archived = sum(moved.values())
+        remaining = []
+        for record in history_records:
+            key = tuple(str(v) for v in record)
+            if moved.get(key):
+                moved[key] -= 1
+            else:
+                remaining.append(record)
+        return remaining, archived
+
+    def incomplete_close_jobs(self):
+        def load():
+            jobs_sheet = self._aux_sheet(CLOSE_JOBS_SHEET, CLOSE_JOB_COLUMNS)
+            return jobs_sheet.get_all_records(numericise_ignore=["all"]) if jobs_sheet is not None else []
+        return [job["회차정보"] for job in self.cache.get((CLOSE_JOBS_SHEET, "records"), load) if job["상태"] != "완료"]
+
+    def _cached(self, key, fetch):
+        """공용 캐시 조회. TTL이 지났어도 key[0] 시트의 리비전이 읽을 때와 같으면 fetch를 생략합니다."""
+        source = REVISION_SOURCES.get(key[0])
+        if source is None:
+            return self.cache.get(key, fetch)
+
+        def load():
+            # 리비전을 먼저 읽어야, 조회 도중에 바뀐 내용이 있으면 다음 확인 때 다시 읽게 됩니다
+            seen = self.revision(source)
+            value = fetch()
+            self._seen_revisions[key] = seen
+            return value
+
+        def unchanged():
+            seen = self._seen_revisions.get(key)
+            return seen is not None and self.revision(source) == seen
+
+        return self.cache.get(key, load, revalidate=unchanged)
+
+    def revisions(self):
+        """Meta 시트의 {시트 이름: 리비전} (Meta 시트가 아직 없으면 빈 dict)"""
+        def load():
+            meta = self._aux_sheet(REVISION_SHEET, REVISION_COLUMNS)
+            if meta is None:
+                return {}
+            rows = meta.get(f"A2:B{max(REVISION_ROWS.values())}")
+            return {row[0]: row[1] for row in rows if len(row) >= 2 and row[1]}
+        return self.revision_cache.get((REVISION_SHEET, "revisions"), load)
+
+    def revision(self, sheet_name):
+        return self.revisions().get(sheet_name)
+
+    def _bump_revision(self, *sheet_names):
+        """쓰기를 마친 시트의 리비전을 새 값으로 바꿉니다."""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            meta = self._aux_sheet(REVISION_SHEET, REVISION_COLUMNS, create=True)
+            meta.batch_update([
+                {"range": f"A{REVISION_ROWS[name]}:C{REVISION_ROWS[name]}", "values": [[name, uuid.uuid4().hex[:12], now]]}
+                for name in sheet_names
+            ])
+        except Exception:
+            # 쓰기 자체는 끝났으므로 실패로 처리하지 않습니다 (다른 세션은 REVISION_MAX_AGE 안에 전체 조회로 맞춰짐)
+            pass
+        finally:
+            self.revision_cache.invalidate(REVISION_SHEET)
+
+    def _aux_sheet(self, title, columns, create=False):
+        """색인/작업 기록용 보조 시트 (없으면 create=True일 때 머리글과 함께 만듦)"""
+        return self._find_worksheet(title, create_columns=columns if create else None)
+
+    def _append_history_index(self, meeting_name, responses, resumed=False):
+        # append_rows 응답의 updatedRange (예: "History!A43:I52")로 방금 추가된 행 범위를 압니다
+        runs = []
+        for response in responses:
+            updated = (response or {}).get("updates", {}).get("updatedRange", "")
+            match = re.search(r"!\$?[A-Z]+\$?(\d+):\$?[A-Z]+\$?(\d+)$", updated)
+            if match is None:
+                runs = None
+                break
+            start, end = int(match.group(1)), int(match.group(2))
+            if runs and runs[-1][2] == start - 1:
+                runs[-1][2] = end
+                runs[-1][3] += end - start + 1
+            else:
+                runs.append([meeting_name, start, end, end - start + 1])
+        index_sheet = self._aux_sheet(HISTORY_INDEX_SHEET, HISTORY_INDEX_COLUMNS)
+        # 재개된 작업이었거나 범위를 알 수 없으면 A열로 다시 계산
+        if resumed or not runs or index_sheet is None:
+            self.rebuild_history_index()
+            return
+        index_sheet.append_rows(runs)
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def rebuild_history_index(self):
+        """History의 A열(회차정보)만 읽어서 회차별 연속 구간을 다시 계산합니다."""
+        rows = self._write_history_index()
+        self.cache.invalidate(HISTORY_INDEX_SHEET, "History")
+        self._bump_revision("History")
+        return rows
+
+    @sheet_lane(SHEET_LANE_WRITE)
+    def _write_history_index(self):
+        names = self.worksheet("History").col_values(1)[1:]
+        runs = []
+        for row_num, name in enumerate(names, start=2):
+            if runs and runs[-1][0] == name and runs[-1][2] == row_num - 1:
+                runs[-1][2] = row_num
+                runs[-1][3] += 1
+            elif name:
+                runs.append([name, row_num, row_num, 1])
+        index_sheet = self._aux_sheet(HISTORY_INDEX_SHEET, HISTORY_INDEX_COLUMNS, create=True)
+        index_sheet.clear()
+        index_sheet.update(values=[HISTORY_INDEX_COLUMNS] + runs, range_name="A1")
+        return [dict(zip(HISTORY_INDEX_COLUMNS, [str(v) for v in run])) for run in runs]
+
+    def history_index(self):
+        def load():
+            index_sheet = self._aux_sheet(HISTORY_INDEX_SHEET, HISTORY_INDEX_COLUMNS)
+            if index_sheet is None:
+                # 색인 시트가 아직 없으면 만들어서 그 결과를 씁니다.
+                # History 내용은 그대로이므로 리비전은 바꾸지 않고, 지금 읽는 중인 이 key도 무효화하지 않습니다.
+                return self._write_history_index()
+            # 머리글만 있으면 History가 비어 있는 것 (빈 목록도 정상 결과로 캐시)
+            # 색인과 시트가 어긋난 경우는 records_for_meetings가 읽은 행으로 알아채고 다시 만듭니다
+            return index_sheet.get_all_records(numericise_ignore=["all"])
+        return self._cached((HISTORY_INDEX_SHEET, "records"), load)
+
+    @timed("시트 조회")
+    def list_meetings(self):
+        if self._snapshot_ready():
+            return self.snapshot.list_meetings()
+        return list(dict.fromkeys(r["회차정보"] for r in self.history_index()))
+
+    def _snapshot_ready(self):
+        """History 로컬 사본을 시트와 맞추고, 사본에서 읽어도 되면 True"""
+        if self.snapshot is None:
+            return False
+        try:
+            return self.snapshot.sync(self)
+        except Exception:
+            # 사본을 맞추지 못하면 이번에는 시트에서 직접 읽습니다
+            return False
+
+    def prefetch(self):
+        # 공용 캐시에 들어가므로, 그 사이 메뉴를 열면 진행 중인 조회에 합류합니다
+        self._prefetch_pool.submit(self.list_records, "Current")
+        self._prefetch_pool.submit(self._prefetch_history)
+
+    def _prefetch_history(self):
+        meetings = self.list_meetings()
+        if meetings:
+            # 지난 기록 메뉴가 처음 보여주는 회차
+            self.meeting_records(meetings[0])
+
+    @timed("시트 조회")
+    def records_for_meetings(self, meeting_names):
+        if self._snapshot_ready():
+            return self.snapshot.records_for_meetings(meeting_names)
+        wanted = list(dict.fromkeys(meeting_names))
+
+        def read():
+            runs = [r for r in self.history_index() if r["회차정보"] in wanted]
+            result = {name: [] for name in wanted}
+            if not runs:
+                return result, True
+
+            def load():
+                sheet = self.worksheet("History")
+                spans = [(int(r["시작행"]), int(r["끝행"])) for r in runs]
+                return [{"_id": row_num, **record} for row_num, record in _read_row_runs(sheet, self._header(sheet), spans)]
+
+            # 한 회차 조회(지난 기록 화면)만 캐시합니다. 여러 회차 묶음은 조합마다 따로 쌓이므로 캐시하지 않습니다.
+            records = self._cached(("History", "meeting", wanted[0]), load) if len(wanted) == 1 else load()
+            for record in records:
+                if record.get("회차정보") in result:
+                    result[record["회차정보"]].append(dict(record))
+            expected_rows = sum(int(r["행수"]) for r in runs)
+            return result, len(records) == expected_rows == sum(len(v) for v in result.values())
+
+        return self._read_checked(read, self.rebuild_history_index)
+
+    def invalidate(self, *sheet_names):
+        if "History" in sheet_names:
+            sheet_names += (HISTORY_INDEX_SHEET,)
+        self.cache.invalidate(*sheet_names)
+        # 시트를 새로 만들거나 이름을 바꾼 경우에 대비해 핸들도 다시 찾습니다
+        with self._handle_lock:
+            self._doc = None
+            self._worksheets = {}
+        if "History" in sheet_names and self.snapshot is not None:
+            self.snapshot.discard()
+
+    def refresh(self, *sheet_names):
+        if "History" in sheet_names:
+            sheet_names += (HISTORY_INDEX_SHEET,)
+        self.revision_cache.invalidate(REVISION_SHEET)
+        self.cache.expire(*sheet_names)
+
+    def cache_stats(self):
+        stats = self.cache.stats()
+        if self.snapshot is not None:
+            stats["snapshot"] = self.snapshot.stats()
+        scheduler = getattr(getattr(self.gc, "http_client", None), "scheduler", None)
+        if scheduler is not None:
+            stats["scheduler"] = scheduler.stats()
+        return stats
+
+class SheetMirror:
+    """SQLite 내용을 구글 시트로 복제하는 백그라운드 작업자.
+
+    쓰기가 몰려도 시트별로 마지막 상태만 한 번에 올립니다 (시트 전체 덮어쓰기).
+    target은 복제 대상 GSheetStorage 입니다.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.source = None
+        self._cond = threading.Condition()
+        self._dirty = set()
+        self.last_error = None
+        threading.Thread(target=self._run, name="sheet-mirror", daemon=True).start()
+
+    def schedule(self, *sheet_names):
+        with self._cond:
+            self._dirty.update(sheet_names)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._dirty:
+                    self._cond.wait()
+                sheet_names = sorted(self._dirty)
+                self._dirty.clear()
+            for sheet_name in sheet_names:
+                try:
+                    self._push(sheet_name)
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = f"{sheet_name}: {e}"
+                    time.sleep(5)
+                    self.schedule(sheet_name)
+
+    @sheet_lane(SHEET_LANE_BACKGROUND)
+    def _push(self, sheet_name):
+        columns = SHEET_COLUMNS[sheet_name]
+        rows = [[r[c] for c in columns] for r in self.source.list_records(sheet_name)]
+        sheet = self.target.worksheet(sheet_name)
+        sheet.update(values=[columns] + rows, range_name="A1")
+        last_row = max(sheet.row_count, len(rows) + 2)
+        sheet.batch_clear([f"A{len(rows) + 2}:Z{last_row}"])
+        if sheet_name == "History":
+            self.target.rebuild_history_index()
+        else:
+            self.target._bump_revision(sheet_name)
+
+class HistorySnapshot:
+    """History 시트의 로컬 열 지향 사본 (Arrow IPC 파일).
+    pyarrow는 사본을 켠 경우에만 필요하므로 모듈 첫머리가 아니라 각 메서드 안에서 불러옵니다.
+
+    시작할 때 파일을 메모리 매핑으로 열고, sync()로 시트와 맞춥니다.
+    - ttl 안에서는 API를 호출하지 않고, 그 뒤에는 History 리비전이 그대로인지만 확인합니다.
+    - 리비전이 바뀌었거나, 우리 앱이 History에 썼거나, 마지막 확인 후 max_age가 지났으면 (재시작 포함)
+      A열(회차정보)과 기존 행 몇 개를 시트와 비교하고, 같으면 새로 붙은 행만 받아 덧붙입니다.
+      시트를 직접 고치면 리비전이 바뀌지 않으므로 max_age마다 이렇게 확인합니다.
+    - 사본이 없거나 시트와 어긋나면 (누군가 시트를 직접 고친 경우) 백그라운드에서 History 전체를 다시 받고,
+      그동안은 sync()가 False를 돌려주어 시트에서 직접 읽게 합니다.
+    """
+
+    def __init__(self, path, ttl=READ_CACHE_TTL, max_age=REVISION_MAX_AGE):
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._resync_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-snapshot")
+        self._resyncing = False
+        self.table = None
+        self.revision = None
+        self.last_row = 1  # 사본에 들어 있는 마지막 시트 행 번호 (1 = 머리글만)
+        self.polled_at = float("-inf")    # 마지막으로 리비전을 확인한 시각
+        self.verified_at = float("-inf")  # 마지막으로 시트와 행을 비교한 시각 (파일에도 기록)
+        self._stale = False  # 우리 앱이 History에 쓴 뒤: 리비전과 상관없이 다음 sync()에서 시트와 비교
+        self.full_syncs = 0
+        self.top_ups = 0
+        self.last_error = None
+        if os.path.exists(path):
+            try:
+                self._load()
+            except Exception:
+                # 깨진 파일은 다음 sync()에서 전체를 다시 받습니다
+                self.table = None
+
+    def _load(self):
+        import pyarrow as pa
+        table = pa.ipc.open_file(pa.memory_map(self.path, "r")).read_all()
+        meta = json.loads(table.schema.metadata[SNAPSHOT_META_KEY])
+        self.table, self.revision, self.last_row = table, meta["revision"], meta["last_row"]
+        # 확인 시각은 벽시계로 저장해 두었다가 재시작 후에도 이어서 씁니다
+        self.verified_at = time.monotonic() - max(0.0, time.time() - meta.get("verified", 0))
+
+    def _save(self, table, revision, last_row):
+        import pyarrow as pa
+        meta = json.dumps({"revision": revision, "last_row": last_row, "verified": time.time() - (time.monotonic() - self.verified_at)})
+        table = table.replace_schema_metadata({SNAPSHOT_META_KEY: meta})
+        temp_path = self.path + ".tmp"
+        with pa.OSFile(temp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(temp_path, self.path)
+        self._load()
+
+    @staticmethod
+    def _to_table(header, rows, first_row):
+        import pyarrow as pa
+        columns = {name: pa.array([row[i] for row in rows], type=pa.string()) for i, name in enumerate(header)}
+        columns["_row"] = pa.array(range(first_row, first_row + len(rows)), type=pa.int64())
+        return pa.table(columns)
+
+    def discard(self):
+        """다음 sync()에서 전체를 다시 받도록 합니다."""
+        with self._lock:
+            self.table = None
+
+    def expire(self):
+        """우리 앱이 History에 쓴 뒤 호출: 리비전 갱신이 실패했더라도 다음 sync()에서 새 행을 받습니다."""
+        with self._lock:
+            self._stale = True
+
+    def sync(self, storage):
+        """사본에서 읽어도 되면 True. 사본이 없거나 시트와 어긋났으면 False (다시 받는 동안은 시트에서 읽습니다)."""
+        with self._lock:
+            if self.table is None or self._resyncing:
+                self._start_resync(storage)
+                return False
+            now = time.monotonic()
+            check = self._stale or now - self.verified_at >= self.max_age
+            if not check:
+                if now - self.polled_at < self.ttl:
+                    return True
+                revision = storage.revision("History")
+                if revision is not None and revision == self.revision:
+                    self.polled_at = now
+                    return True
+            else:
+                revision = storage.revision("History")
+            if not self._catch_up(storage, revision, now):
+                self._start_resync(storage)
+                return False
+            self.polled_at = now
+            self._stale = False
+            return True
+
+    def _catch_up(self, storage, revision, now):
+        """사본의 기존 행이 시트와 같으면 새로 붙은 행만 덧붙이고 True, 어긋났으면 False.
+
+        A열 한 번과, 비교할 기존 행 + 새 행을 묶은 batch_get 한 번만 읽습니다.
+        """
+        import pyarrow as pa
+        sheet = storage.worksheet("History")
+        header = storage._header(sheet)
+        if self.table.column_names != header + ["_row"]:
+            return False
+        # 1) 회차 이름 열이 그대로여야 합니다 (행 삭제/이동/끼워 넣기 감지)
+        names = sheet.col_values(1)[1:]
+        mine = self.table.column("회차정보").to_pylist()
+        while mine and not mine[-1]:
+            mine.pop()  # col_values는 끝의 빈 칸을 돌려주지 않습니다
+        if names[:len(mine)] != mine:
+            return False
+        last_row = max(len(names) + 1, self.last_row)
+        # 2) 기존 행 몇 개를 시트와 직접 비교 (내용 수정 감지) — 새 행과 함께 한 번에 요청
+        end_col = gspread.utils.rowcol_to_a1(1, len(header))[:-1]
+        probes = []
+        if self.last_row >= 2:
+            probes = sorted({self.last_row, *(random.randint(2, self.last_row) for _ in range(SNAPSHOT_PROBE_ROWS))})
+        ranges = [f"A{r}:{end_col}{r}" for r in probes]
+        if last_row > self.last_row:
+            ranges.append(f"A{self.last_row + 1}:{end_col}{last_row}")
+        blocks = sheet.batch_get(ranges) if ranges else []
+        for row_num, block in zip(probes, blocks):
+            sheet_row = (block[0] if block else []) + [""] * len(header)
+            if sheet_row[:len(header)] != [self.table.column(c)[row_num - 2].as_py() for c in header]:
+                return False
+        table = self.table
+        if last_row > self.last_row:
+            new_rows = [row + [""] * (len(header) - len(row)) for row in blocks[len(probes)]]
+            if len(new_rows) != last_row - self.last_row:
+                return False
+            table = pa.concat_tables([table, self._to_table(header, new_rows, self.last_row + 1)])
+            self.top_ups += 1
+        # 새 행이 없어도 확인한 시각과 리비전을 기록해 재시작 직후 다시 비교하지 않게 합니다
+        self.verified_at = now
+        self._save(table, revision, last_row)
+        return True
+
+    def _start_resync(self, storage):
+        if not self._resyncing:
+            self._resyncing = True
+            self._resync_pool.submit(self._resync, storage)
+
+    @sheet_lane(SHEET_LANE_BACKGROUND)
+    def _resync(self, storage):
+        """History 전체를 받아 사본을 새로 만듭니다 (백그라운드 — 사용자 요청은 그동안 시트에서 읽습니다)."""
+        try:
+            # 먼저 리비전을 읽어 두면, 받는 도중에 바뀐 내용은 다음 sync()에서 따라잡습니다
+            revision = storage.revision("History")
+            sheet = storage.worksheet("History")
+            header = storage._header(sheet)
+            values = sheet.get_all_values()
+            rows = [row + [""] * (len(header) - len(row)) for row in values[1:]]
+            table = self._to_table(header, rows, 2)
+            with self._lock:
+                self.verified_at = self.polled_at = time.monotonic()
+                self._save(table, revision, len(rows) + 1)
+                self.full_syncs += 1
+                self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+        finally:
+            with self._lock:
+                self._resyncing = False
+
+    def wait_for_resync(self):
+        """진행 중인 전체 다시 받기가 끝날 때까지 기다립니다 (측정/테스트용)."""
+        self._resync_pool.submit(lambda: None).result()
+
+    def list_meetings(self):
+        import pyarrow.compute as pc
+        return [name for name in pc.unique(self.table.column("회차정보")).to_pylist() if name]
+
+    def records_for_meetings(self, meeting_names):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        result = {name: [] for name in meeting_names}
+        if not result:
+            return result
+        table = self.table
+        mask = pc.is_in(table.column("회차정보"), value_set=pa.array(list(result), type=pa.string()))
+        for record in table.filter(mask).to_pylist():
+            result[record["회차정보"]].append({"_id": record.pop("_row"), **record})
+        return result
+
+    def stats(self):
+        return {
+            "rows": self.table.num_rows if self.table is not None else 0,
+            "full_syncs": self.full_syncs,
+            "top_ups": self.top_ups,
+            "resyncing": self._resyncing,
+            "last_error": self.last_error,
+        }
+
+class SQLiteStorage(Storage):
+    """로컬 디스크의 SQLite 저장소. 레코드 ID는 SQLite의 _id(자동 증가) 값입니다."""
+
+    def __init__(self, path, mirror=None):
+        self.path = path
+        self.mirror = mirror
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for sheet_name, columns in SHEET_COLUMNS.items():
+            cols = ", ".join(f'"{c}" TEXT' for c in columns)
+            self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{sheet_name}" (_id INTEGER PRIMARY KEY AUTOINCREMENT, {cols})')
+            existing = {row[1] for row in self._conn.execute(f'PRAGMA table_info("{sheet_name}")')}
+            for c in columns:
+                if c not in existing:
+                    self._conn.execute(f'ALTER TABLE "{sheet_name}" ADD COLUMN "{c}" TEXT DEFAULT \'\'')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS history_meeting ON "History" ("회차정보", _id)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS current_dept ON "Current" ("부서명", _id)')
+        self._conn.execute("CREATE TABLE IF NOT EXISTS revisions (sheet TEXT PRIMARY KEY, revision INTEGER NOT NULL)")
+        self._conn.commit()
+        if mirror is not None:
+            mirror.source = self
+
+    def is_empty(self):
+        with self._lock:
+            return all(
+                self._conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0] == 0
+                for name in SHEET_COLUMNS
+            )
+
+    @staticmethod
+    def _col_list(columns):
+        return ", ".join(f'"{c}"' for c in columns)
+
+    def _changed(self, *sheet_names):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO revisions (sheet, revision) VALUES (?, 1) ON CONFLICT(sheet) DO UPDATE SET revision = revision + 1",
+                [(name,) for name in sheet_names],
+            )
+        if self.mirror is not None:
+            self.mirror.schedule(*sheet_names)
+
+    def list_records(self, sheet_name):
+        columns = SHEET_COLUMNS[sheet_name]
+        with self._lock:
+            rows = self._conn.execute(f'SELECT _id, {self._col_list(columns)} FROM "{sheet_name}" ORDER BY _id').fetchall()
+        return [dict(zip(["_id"] + columns, row)) for row in rows]
+
+    def record_ids(self, sheet_name):
+        with self._lock:
+            return {row[0] for row in self._conn.execute(f'SELECT "ID" FROM "{sheet_name}" WHERE IFNULL("ID", \'\') != \'\'')}
+
+    def list_departments(self, sheet_name):
+        with self._lock:
+            rows = self._conn.execute(f'SELECT DISTINCT "부서명" FROM "{sheet_name}" WHERE "부서명" != \'\' ORDER BY "부서명"').fetchall()
+        return [row[0] for row in rows]
+
+    def _department_records_raw(self, sheet_name, dept):
+        columns = SHEET_COLUMNS[sheet_name]
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT _id, {self._col_list(columns)} FROM "{sheet_name}" WHERE "부서명" = ? ORDER BY _id', (dept,)
+            ).fetchall()
+        return [dict(zip(["_id"] + columns, row)) for row in rows]
+
+    def append_rows(self, sheet_name, rows):
+        columns = SHEET_COLUMNS[sheet_name]
+        placeholders = ", ".join("?" for _ in columns)
+        values = [[str(v) for v in row] + [""] * (len(columns) - len(row)) for row in rows]
+        with self._lock, self._conn:
+            self._conn.executemany(f'INSERT INTO "{sheet_name}" ({self._col_list(columns)}) VALUES ({placeholders})', values)
+        self._changed(sheet_name)
+
+    def _expected_clause(self, sheet_name, expected):
+        """expected와 같은 값일 때만 적용되도록 붙이는 WHERE 조건"""
+        columns = [c for c in SHEET_COLUMNS[sheet_name] if c != "ID" and expected and c in expected]
+        clause = "".join(f' AND IFNULL("{c}", \'\') = ?' for c in columns)
+        return clause, [str(expected[c]) for c in columns]
+
+    def update_record(self, sheet_name, record_id, fields, expected=None):
+        assignments = ", ".join(f'"{name}" = ?' for name in fields)
+        clause, params = self._expected_clause(sheet_name, expected)
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                f'UPDATE "{sheet_name}" SET {assignments} WHERE _id = ?{clause}',
+                [str(v) for v in fields.values()] + [int(record_id)] + params,
+            ).rowcount
+        if not updated:
+            raise RecordConflictError("다른 사용자가 먼저 수정했거나 삭제한 안건입니다.")
+        self._changed(sheet_name)
+
+    def delete_record(self, sheet_name, record_id, expected=None):
+        clause, params = self._expected_clause(sheet_name, expected)
+        with self._lock, self._conn:
+            deleted = self._conn.execute(f'DELETE FROM "{sheet_name}" WHERE _id = ?{clause}', [int(record_id)] + params).rowcount
+        if not deleted:
+            raise RecordConflictError("다른 사용자가 먼저 수정했거나 삭제한 안건입니다.")
+        self._changed(sheet_name)
+
+    def close_meeting(self, meeting_name, on_progress=None):
+        # SQLite는 한 트랜잭션으로 옮기므로 중간 실패 시 전부 취소되고, 재실행하면 처음부터 다시 합니다
+        src_cols = self._col_list(HISTORY_COLUMNS[1:])
+        started = time.perf_counter()
+        with self._lock, self._conn:
+            if self._conn.execute('SELECT 1 FROM "History" WHERE "회차정보" = ? LIMIT 1', (meeting_name,)).fetchone():
+                raise MeetingAlreadyClosedError(f"'{meeting_name}' 회차는 이미 History에 있습니다.")
+            moved = self._conn.execute(
+                f'INSERT INTO "History" ({self._col_list(HISTORY_COLUMNS)}) SELECT ?, {src_cols} FROM "Current" ORDER BY _id',
+                (meeting_name,),
+            ).rowcount
+            self._conn.execute('DELETE FROM "Current"')
+        self._changed("Current", "History")
+        if on_progress:
+            on_progress(moved, moved, time.perf_counter() - started)
+        return moved
+
+    def revision(self, sheet_name):
+        with self._lock:
+            row = self._conn.execute("SELECT revision FROM revisions WHERE sheet = ?", (sheet_name,)).fetchone()
+        return str(row[0]) if row else "0"
+
+    def list_meetings(self):
+        with self._lock:
+            rows = self._conn.execute('SELECT "회차정보" FROM "History" GROUP BY "회차정보" ORDER BY MIN(_id)').fetchall()
+        return [row[0] for row in rows]
+
+    def records_for_meetings(self, meeting_names):
+        result = {name: [] for name in meeting_names}
+        if not result:
+            return result
+        marks = ", ".join("?" for _ in result)
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT _id, {self._col_list(HISTORY_COLUMNS)} FROM "History" WHERE "회차정보" IN ({marks}) ORDER BY _id',
+                list(result),
+            ).fetchall()
+        for row in rows:
+            record = dict(zip(["_id"] + HISTORY_COLUMNS, row))
+            result[record["회차정보"]].append(record)
+        return result
+
+@st.cache_resource
+def get_storage():
+    cfg = get_storage_config()
+    if cfg["backend"] == "sqlite":
+        if not cfg["mirror_to_sheets"]:
+            return SQLiteStorage(cfg["sqlite_path"])
+        source = GSheetStorage(get_connection(), SheetReadCache(0))
+        storage = SQLiteStorage(cfg["sqlite_path"], mirror=SheetMirror(source))
+        if storage.is_empty():
+            # 처음 전환할 때는 기존 시트 내용을 먼저 가져옵니다 (복제 과정에서 시트를 덮어쓰지 않도록)
+            for sheet_name, columns in SHEET_COLUMNS.items():
+                storage.append_rows(sheet_name, [[r.get(c, "") for c in columns] for r in source.list_records(sheet_name)])
+        return storage
+    snapshot = HistorySnapshot(cfg["history_snapshot_path"]) if cfg["history_snapshot_path"] else None
+    return GSheetStorage(get_connection(), SheetReadCache(READ_CACHE_TTL, max_age=REVISION_MAX_AGE), snapshot=snapshot)
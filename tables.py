@@ -0,0 +1,54 @@
+# 스타일링된 HTML 테이블 생성 함수
+# 만든 HTML은 (데이터 해시, 열, 행 구간) 단위로 캐시되고, 행이 많으면 한 페이지 분량만 보냅니다.
+import streamlit as st
+import pandas as pd
+import hashlib
+
+from metrics import timed
+
+TABLE_PAGE_SIZE = 50
+
+def frame_fingerprint(df):
+    """DataFrame 내용(열 이름 + 값)의 해시. 같은 내용이면 같은 값이 나옵니다."""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    return digest.hexdigest()
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _table_html(fingerprint, columns, start, stop, _df):
+    """_df는 해시 대상에서 제외됩니다 (fingerprint가 대신함)"""
+    html = _df.iloc[start:stop].to_html(index=False, classes='kiwu-table', escape=False)
+    return f'<div class="kiwu-table-container">{html}</div>'
+
+@timed("표 그리기")
+def render_styled_table(df, key="table", page_size=TABLE_PAGE_SIZE, fingerprint=None):
+    fingerprint = fingerprint or frame_fingerprint(df)
+    columns = tuple(map(str, df.columns))
+    if page_size is None or len(df) <= page_size:
+        st.markdown(_table_html(fingerprint, columns, 0, len(df), df), unsafe_allow_html=True)
+        return
+
+    page_count = (len(df) + page_size - 1) // page_size
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+
+    col_page, col_jump = st.columns([0.3, 0.7])
+    if '부서명' in df.columns:
+        # 부서 바로가기: 선택한 부서의 첫 행이 있는 페이지로 이동
+        first_rows = {}
+        for pos, dept in enumerate(df['부서명'].astype(str)):
+            first_rows.setdefault(dept, pos)
+
+        def jump_to_dept():
+            dept = st.session_state.get(f"{key}_jump")
+            if dept in first_rows:
+                st.session_state[page_key] = first_rows[dept] // page_size + 1
+
+        with col_jump:
+            st.selectbox("부서 바로가기", list(first_rows), index=None, placeholder="부서를 선택하세요", key=f"{key}_jump", on_change=jump_to_dept)
+    with col_page:
+        page = st.number_input(f"페이지 (전체 {page_count}쪽, {len(df)}건)", min_value=1, max_value=page_count, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    st.markdown(_table_html(fingerprint, columns, start, min(start + page_size, len(df)), df), unsafe_allow_html=True)
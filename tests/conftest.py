@@ -0,0 +1,20 @@
+# 테스트 공통 설정: 저장소 루트의 모듈을 불러오고, benchmark.py의 가짜 gspread로 시트를 만듭니다.
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark  # noqa: E402
+from storage import GSheetStorage, SheetReadCache  # noqa: E402
+
+@pytest.fixture
+def backend():
+    """부서 두 곳, Current 5행, History 30행(회차당 10행)인 가짜 스프레드시트"""
+    return benchmark.FakeBackend(benchmark.make_sheets(["교목실", "기획처"], 5, 30, 10), 0, 0, 0)
+
+@pytest.fixture
+def storage(backend):
+    """캐시 없이 매번 시트를 읽는 GSheetStorage"""
+    return GSheetStorage(backend.client(), SheetReadCache(0))
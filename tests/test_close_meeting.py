@@ -0,0 +1,81 @@
+# 마감 작업: History로 옮기기와 중간에 멈춘 작업 이어 하기
+import pytest
+
+import storage as storage_module
+from storage import CLOSE_JOB_COLUMNS, CLOSE_JOBS_SHEET, new_record_id
+
+def current_row(text):
+    return ["2026-10-17 10:00", "교목실", "주요현안", text, "진행중", "", "", "", "h", new_record_id()]
+
+def assert_closed(backend, storage, meeting_name, moved):
+    """회차 행이 한 번씩만 옮겨지고, 색인과 작업 기록이 맞는지 확인합니다."""
+    history = backend.sheets["History"]
+    rows = [row_num for row_num, row in enumerate(history, start=1) if row[0] == meeting_name]
+    assert len(rows) == moved
+    index = [r for r in storage.history_index() if r["회차정보"] == meeting_name]
+    assert index == [{"회차정보": meeting_name, "시작행": str(rows[0]), "끝행": str(rows[-1]), "행수": str(moved)}]
+    assert len(storage.meeting_records(meeting_name)) == moved
+    jobs = [row for row in backend.sheets[CLOSE_JOBS_SHEET][1:] if row[0] == meeting_name]
+    assert [row[1:4] for row in jobs] == [["완료", str(moved), str(moved)]]
+    # 색인은 History 전체를 다시 세어도 같아야 합니다
+    assert storage.history_index() == storage._write_history_index()
+
+def test_close_moves_current_to_history(backend, storage):
+    assert storage.close_meeting("W1") == 5
+    assert_closed(backend, storage, "W1", 5)
+    assert len(backend.sheets["Current"]) == 1
+    with pytest.raises(storage_module.MeetingAlreadyClosedError):
+        storage.close_meeting("W1")
+
+def test_resume_after_index_write_failure(backend, storage, monkeypatch):
+    # Current를 비운 뒤 색인 추가에서 멈춘 경우: 다시 실행할 때 새로 등록된 안건을 옮기면 안 됩니다
+    monkeypatch.setattr(storage, "_append_history_index", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("색인 쓰기 실패")))
+    with pytest.raises(RuntimeError):
+        storage.close_meeting("W1")
+    monkeypatch.undo()
+    storage.append_rows("Current", [current_row("다음 주 안건")])
+
+    assert storage.close_meeting("W1") == 5
+    assert_closed(backend, storage, "W1", 5)
+    assert [row[3] for row in backend.sheets["Current"][1:]] == ["다음 주 안건"]
+
+def test_resume_after_cleared_state_write_failure(backend, storage):
+    # Current를 비운 직후 "비움" 상태를 기록하지 못한 경우: 작업 기록은 아직 진행중입니다
+    jobs = storage._aux_sheet(CLOSE_JOBS_SHEET, CLOSE_JOB_COLUMNS, create=True)
+    update = jobs.update
+
+    def flaky(values=None, range_name=None, **kwargs):
+        if values and values[0][0] == "비움":
+            raise RuntimeError("상태 기록 실패")
+        return update(values=values, range_name=range_name, **kwargs)
+
+    jobs.update = flaky
+    with pytest.raises(RuntimeError):
+        storage.close_meeting("W1")
+    jobs.update = update
+    storage.append_rows("Current", [current_row("다음 주 안건")])
+
+    assert storage.close_meeting("W1") == 5
+    assert_closed(backend, storage, "W1", 5)
+    assert [row[3] for row in backend.sheets["Current"][1:]] == ["다음 주 안건"]
+
+def test_resume_after_partial_append(backend, storage, monkeypatch):
+    monkeypatch.setattr(storage_module, "CLOSE_CHUNK_ROWS", 2)
+    history = storage.worksheet("History")
+    append_rows = history.append_rows
+    calls = []
+
+    def flaky(rows, **kwargs):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("추가 실패")
+        return append_rows(rows, **kwargs)
+
+    history.append_rows = flaky
+    with pytest.raises(RuntimeError):
+        storage.close_meeting("W1")
+    history.append_rows = append_rows
+
+    assert storage.close_meeting("W1") == 5
+    assert_closed(backend, storage, "W1", 5)
+    assert len(backend.sheets["Current"]) == 1
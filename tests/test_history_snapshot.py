@@ -0,0 +1,61 @@
+# HistorySnapshot: 재시작 뒤에는 새 행만 받고, 어긋나면 백그라운드에서 전체를 다시 받습니다
+import pytest
+
+import benchmark
+from storage import GSheetStorage, HistorySnapshot, SheetReadCache
+
+@pytest.fixture
+def full_downloads(monkeypatch):
+    """History 전체를 받은 횟수 ([n])"""
+    count = [0]
+    get_all_values = benchmark.FakeWorksheet.get_all_values
+
+    def spy(self, **kwargs):
+        if self.title == "History":
+            count[0] += 1
+        return get_all_values(self, **kwargs)
+
+    monkeypatch.setattr(benchmark.FakeWorksheet, "get_all_values", spy)
+    return count
+
+def open_snapshot(backend, path, max_age=600):
+    snapshot = HistorySnapshot(str(path), max_age=max_age)
+    return GSheetStorage(backend.client(), SheetReadCache(30), snapshot=snapshot), snapshot
+
+def history_row(meeting_name, text):
+    return [meeting_name, "2026-10-17 10:00", "교목실", "주요현안", text, "진행중", "", "", ""]
+
+def test_first_sync_downloads_in_the_background(backend, tmp_path):
+    storage, snapshot = open_snapshot(backend, tmp_path / "history.arrow")
+    assert not snapshot.sync(storage)  # 사본이 없으면 이번에는 시트에서 직접 읽습니다
+    snapshot.wait_for_resync()
+    assert snapshot.sync(storage)
+    assert snapshot.stats()["rows"] == len(backend.sheets["History"]) - 1
+
+def test_restart_fetches_only_new_rows(backend, tmp_path, full_downloads):
+    path = tmp_path / "history.arrow"
+    storage, snapshot = open_snapshot(backend, path)
+    snapshot.sync(storage)
+    snapshot.wait_for_resync()
+    backend.sheets["History"] += [history_row("W9", "새 안건 1"), history_row("W9", "새 안건 2")]
+
+    # max_age가 지난 뒤의 재시작: 파일에서 열고 A열과 일부 행만 확인합니다
+    storage, snapshot = open_snapshot(backend, path, max_age=0)
+    assert full_downloads == [1]
+    assert snapshot.sync(storage)
+    assert full_downloads == [1]
+    assert snapshot.stats()["top_ups"] == 1
+    assert [r["업무내용"] for r in snapshot.records_for_meetings(["W9"])["W9"]] == ["새 안건 1", "새 안건 2"]
+
+def test_direct_edit_triggers_a_background_resync(backend, tmp_path):
+    storage, snapshot = open_snapshot(backend, tmp_path / "history.arrow", max_age=0)
+    snapshot.sync(storage)
+    snapshot.wait_for_resync()
+    meeting_name = backend.sheets["History"][-1][0]
+    backend.sheets["History"][-1][4] = "시트에서 직접 고침"  # 리비전은 그대로
+
+    assert not snapshot.sync(storage)
+    snapshot.wait_for_resync()
+    assert snapshot.sync(storage)
+    assert snapshot.stats()["full_syncs"] == 2
+    assert snapshot.records_for_meetings([meeting_name])[meeting_name][-1]["업무내용"] == "시트에서 직접 고침"
@@ -0,0 +1,114 @@
+# WriteJournal: 결과를 알 수 없는 재전송, 429, 반영 실패 처리
+import types
+
+import pytest
+
+import journal
+from journal import WriteJournal
+from storage import new_record_id
+
+@pytest.fixture
+def appends(backend, monkeypatch):
+    """appends[:] = ["applied-503" | "503" | "429", ...]: 다음 행 추가 요청들의 결과.
+
+    "applied-503"은 시트에 반영한 뒤 503을 돌려줍니다 (응답만 잃어버린 경우).
+    목록이 비면 정상 처리합니다. "always-500"을 넣으면 계속 실패합니다.
+    """
+    monkeypatch.setattr(journal, "random", types.SimpleNamespace(uniform=lambda a, b: 0))  # 백오프 없이
+    outcomes = []
+    serve = backend.serve
+
+    def flaky(method, url):
+        if not (method == "POST" and url.endswith(":append")) or not outcomes:
+            return serve(method, url)
+        outcome = outcomes[0] if outcomes[0] == "always-500" else outcomes.pop(0)
+        if outcome == "applied-503":
+            serve(method, url)
+        code = int(outcome[-3:])
+        return code, {"error": {"code": code, "message": "fake", "status": "FAKE"}}
+
+    monkeypatch.setattr(backend, "serve", flaky)
+    return outcomes
+
+@pytest.fixture
+def id_reads(storage, monkeypatch):
+    """저널이 ID 열을 읽은 횟수 ([n])"""
+    count = [0]
+    record_ids = storage.record_ids
+
+    def spy(sheet_name):
+        count[0] += 1
+        return record_ids(sheet_name)
+
+    monkeypatch.setattr(storage, "record_ids", spy)
+    return count
+
+def agenda_row(text):
+    record_id = new_record_id()
+    return ["2026-10-17 10:00", "교목실", "주요현안", text, "진행중", "", "", "", "h", record_id], record_id
+
+def rows_with_id(backend, record_id):
+    return sum(1 for row in backend.sheets["Current"][1:] if row[-1] == record_id)
+
+def test_resend_after_uncertain_failure_skips_written_rows(tmp_path, backend, storage, appends, id_reads):
+    appends[:] = ["applied-503"]
+    row, record_id = agenda_row("응답만 잃어버린 안건")
+    j = WriteJournal(str(tmp_path / "journal.db"), storage)
+    j.submit("Current", row)
+
+    assert j.wait_until_flushed(10)
+    assert rows_with_id(backend, record_id) == 1
+    assert id_reads == [1]
+
+def test_quota_error_keeps_previous_uncertain_flag(tmp_path, backend, storage, appends, id_reads):
+    # 429는 보내지 않은 것이 확실하므로 ID를 확인할 필요가 없습니다
+    appends[:] = ["429", "429"]
+    row, record_id = agenda_row("할당량 초과")
+    j = WriteJournal(str(tmp_path / "journal.db"), storage)
+    j.submit("Current", row)
+    assert j.wait_until_flushed(10)
+    assert rows_with_id(backend, record_id) == 1
+    assert id_reads == [0]
+
+    # 결과를 알 수 없던 행은 429 뒤에도 확인 대상으로 남습니다
+    appends[:] = ["503", "429"]
+    row, record_id = agenda_row("결과를 모르는 안건")
+    j.submit("Current", row)
+    assert j.wait_until_flushed(10)
+    assert rows_with_id(backend, record_id) == 1
+    assert id_reads == [2]  # 429 앞뒤로 한 번씩
+
+def test_row_that_keeps_failing_is_moved_aside(tmp_path, backend, storage, appends, monkeypatch):
+    monkeypatch.setattr(journal, "JOURNAL_MAX_ATTEMPTS", 2)
+    appends[:] = ["always-500"]
+    row, record_id = agenda_row("계속 실패하는 안건")
+    j = WriteJournal(str(tmp_path / "journal.db"), storage)
+    j.submit("Current", row)
+
+    # 반영 실패로 옮긴 행은 대기 중으로 세지 않으므로 기다리는 화면을 막지 않습니다
+    assert j.wait_until_flushed(10)
+    assert j.pending_count() == 0
+    assert j.pending_records("Current") == []
+    failed = j.failed_records()
+    assert [(r["시도"], r["시트 반영"], r["업무내용"]) for r in failed] == [(2, "확인 필요", "계속 실패하는 안건")]
+    assert "비밀번호" not in failed[0]
+
+    # 다시 시도하면 반영되고, 같은 행이 두 번 올라가지 않습니다
+    appends.clear()
+    j.retry_failed()
+    assert j.wait_until_flushed(10)
+    assert j.failed_records() == []
+    assert rows_with_id(backend, record_id) == 1
+
+def test_failed_rows_can_be_discarded(tmp_path, backend, storage, appends, monkeypatch):
+    monkeypatch.setattr(journal, "JOURNAL_MAX_ATTEMPTS", 1)
+    appends[:] = ["always-500"]
+    row, record_id = agenda_row("버릴 안건")
+    j = WriteJournal(str(tmp_path / "journal.db"), storage)
+    j.submit("Current", row)
+    assert j.wait_until_flushed(10)
+
+    j.discard_failed()
+    assert j.failed_records() == []
+    assert j.pending_count() == 0
+    assert rows_with_id(backend, record_id) == 0
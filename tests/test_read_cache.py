@@ -0,0 +1,121 @@
+# SheetReadCache: single-flight, 조회 도중 무효화, 중단된 조회
+import threading
+
+import pytest
+
+from storage import SheetReadCache
+
+class Stop(BaseException):
+    """Streamlit의 StopException처럼 Exception이 아닌 중단"""
+
+class BlockingLoader:
+    """release()할 때까지 돌아오지 않는 loader. 호출 횟수를 셉니다."""
+
+    def __init__(self, value="결과"):
+        self.value = value
+        self.calls = 0
+        self.started = threading.Event()
+        self._release = threading.Event()
+        self.error = None
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        assert self._release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def release(self, error=None):
+        self.error = error
+        self._release.set()
+
+def run_in_threads(n, target):
+    results = [None] * n
+
+    def run(i):
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+def wait_for_followers(cache, n):
+    deadline = threading.Event()
+    for _ in range(500):
+        if cache.stats()["coalesced"] >= n:
+            return
+        deadline.wait(0.01)
+    raise AssertionError("다른 세션이 같은 조회를 기다리지 않았습니다")
+
+def test_concurrent_reads_share_one_load():
+    cache = SheetReadCache(60)
+    loader = BlockingLoader()
+    threads, results = run_in_threads(5, lambda: cache.get(("Current", "records"), loader))
+    assert loader.started.wait(5)
+    wait_for_followers(cache, 4)
+    loader.release()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert results == ["결과"] * 5
+    assert cache.get(("Current", "records"), BlockingLoader("새 결과")) == "결과"
+
+def test_invalidate_during_load_discards_the_result():
+    cache = SheetReadCache(60)
+    loader = BlockingLoader("쓰기 전에 읽은 내용")
+    threads, results = run_in_threads(1, lambda: cache.get(("Current", "records"), loader))
+    assert loader.started.wait(5)
+    cache.invalidate("Current")  # 조회 도중에 누군가 Current에 씀
+    loader.release()
+    threads[0].join()
+
+    assert results == ["쓰기 전에 읽은 내용"]  # 이미 시작한 조회는 결과를 받되
+    assert cache.get(("Current", "records"), lambda: "쓴 뒤의 내용") == "쓴 뒤의 내용"  # 캐시에는 남기지 않습니다
+
+def test_other_sheets_survive_invalidate():
+    cache = SheetReadCache(60)
+    cache.get(("History", "records"), lambda: "지난 기록")
+    cache.invalidate("Current")
+    assert cache.get(("History", "records"), lambda: "다시 읽음") == "지난 기록"
+
+def test_followers_reload_when_the_leader_is_stopped():
+    cache = SheetReadCache(60)
+    loader = BlockingLoader()
+    leader_error = []
+
+    def leader():
+        try:
+            cache.get(("Current", "records"), loader)
+        except Stop as e:
+            leader_error.append(e)
+
+    leader_thread = threading.Thread(target=leader)
+    leader_thread.start()
+    assert loader.started.wait(5)
+    threads, results = run_in_threads(2, lambda: cache.get(("Current", "records"), lambda: "다시 읽은 결과"))
+    wait_for_followers(cache, 2)
+    loader.release(Stop())
+    for thread in [leader_thread, *threads]:
+        thread.join(5)
+        assert not thread.is_alive()
+
+    assert len(leader_error) == 1
+    assert results == ["다시 읽은 결과"] * 2
+    assert ("Current", "records") not in cache._inflight
+
+def test_loader_error_reaches_followers():
+    cache = SheetReadCache(60)
+    loader = BlockingLoader()
+    threads, results = run_in_threads(3, lambda: pytest.raises(RuntimeError, cache.get, ("Current", "records"), loader))
+    assert loader.started.wait(5)
+    wait_for_followers(cache, 2)
+    loader.release(RuntimeError("시트 오류"))
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert all(str(r.value) == "시트 오류" for r in results)
+    assert cache.get(("Current", "records"), lambda: "복구") == "복구"
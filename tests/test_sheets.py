@@ -0,0 +1,146 @@
+# SheetScheduler: 우선순위 대기열, 분당 한도, 재시도
+import threading
+import time
+import types
+
+import gspread
+import pytest
+
+import sheets
+from sheets import SHEET_LANE_BACKGROUND, SHEET_LANE_READ, SHEET_LANE_WRITE, ScheduledHTTPClient, SheetScheduler
+
+class FakeClock:
+    """sheets.time 대역: 기다리는 대신 시계를 그만큼 앞으로 돌립니다."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        # 실제 시계처럼 조금이라도 흐르게 합니다 (부동소수 오차로 0.999…개가 남아 제자리걸음하지 않도록)
+        self.now += max(seconds, 0.001)
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "조건을 기다리다 시간 초과"
+        time.sleep(0.001)
+
+@pytest.fixture
+def clocked(monkeypatch):
+    """가짜 시계로 도는 SheetScheduler (기다리는 동안 시계만 앞으로 갑니다)"""
+    clock = FakeClock()
+    monkeypatch.setattr(sheets, "time", types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    scheduler = SheetScheduler(timeout=3600)
+    scheduler._cond.wait = lambda timeout=None: clock.sleep(timeout)
+    scheduler.clock = clock
+    return scheduler
+
+def test_requests_well_under_quota_do_not_wait(clocked):
+    started = clocked.clock.now
+    for _ in range(30):
+        clocked.acquire("read", SHEET_LANE_READ)
+    assert clocked.clock.now == started
+    assert clocked.stats()["tokens"]["read"] == sheets.SHEETS_BURST  # 버킷은 한도 근처에서만 씁니다
+
+def test_quota_never_exceeds_limit_in_any_minute(clocked):
+    limit = sheets.SHEETS_QUOTA_PER_MINUTE["read"]
+    sent = []
+    for _ in range(150):
+        clocked.acquire("read", SHEET_LANE_READ)
+        sent.append(clocked.clock.now)
+
+    # 한도에서 SHEETS_BURST개를 뺀 만큼은 바로 나갑니다
+    assert sent[:limit - sheets.SHEETS_BURST] == [sent[0]] * (limit - sheets.SHEETS_BURST)
+    for i, started in enumerate(sent):
+        assert sum(1 for t in sent[i:] if t < started + 60) <= limit
+    # 한도를 지키면서도 너무 느리지 않아야 합니다: 1분에 한도만큼
+    assert sent[-1] - sent[0] <= (150 // limit) * 60 + 1
+
+def test_quota_error_switches_to_the_token_bucket(clocked):
+    clocked._throttle("read")
+    started = clocked.clock.now
+    for _ in range(3):
+        clocked.acquire("read", SHEET_LANE_READ)
+    rate = (sheets.SHEETS_QUOTA_PER_MINUTE["read"] - sheets.SHEETS_BURST) / 60
+    assert clocked.clock.now - started >= 3 / rate - 0.01
+
+def test_lanes_are_served_in_priority_order():
+    scheduler = SheetScheduler(per_minute={"read": 10, "write": 10}, burst=1, timeout=30)
+    scheduler._throttle("read")  # 토큰으로만 보내게 하고, 토큰은 테스트가 한 개씩 넣습니다
+    lanes = [SHEET_LANE_BACKGROUND, SHEET_LANE_READ, SHEET_LANE_WRITE, SHEET_LANE_READ]
+    threads = []
+    for i, lane in enumerate(lanes, start=1):
+        thread = threading.Thread(target=scheduler.acquire, args=("read", lane))
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda: len(scheduler._waiting["read"]) == i)
+
+    served = []
+    for _ in lanes:
+        before = dict(scheduler.requests)
+        with scheduler._cond:
+            scheduler._tokens["read"] = 1.0
+            scheduler._cond.notify_all()
+        wait_until(lambda: scheduler.requests != before)
+        served += [lane for lane in scheduler.requests if scheduler.requests[lane] != before[lane]]
+    for thread in threads:
+        thread.join()
+
+    # 같은 우선순위끼리는 도착 순서대로
+    assert served == [SHEET_LANE_WRITE, SHEET_LANE_READ, SHEET_LANE_READ, SHEET_LANE_BACKGROUND]
+
+def test_full_queue_is_rejected():
+    scheduler = SheetScheduler(per_minute={"read": 10, "write": 10}, burst=1, queue_limit=1, timeout=0.2)
+    scheduler._throttle("read")
+    waiter = threading.Thread(target=lambda: pytest.raises(sheets.SheetBusyError, scheduler.acquire, "read", SHEET_LANE_READ))
+    waiter.start()
+    wait_until(lambda: len(scheduler._waiting["read"]) == 1)
+    with pytest.raises(sheets.SheetBusyError):
+        scheduler.acquire("read", SHEET_LANE_READ)
+    waiter.join()
+    assert scheduler.rejected == 2
+
+@pytest.fixture
+def failing(backend, monkeypatch):
+    """failing[:] = [상태 코드, ...]: 다음 요청들이 차례로 그 코드로 실패합니다."""
+    monkeypatch.setattr(sheets, "SHEET_RETRY_BASE", 0)
+    codes = []
+    serve = backend.serve
+
+    def flaky(method, url):
+        if codes:
+            code = codes.pop(0)
+            backend.requests += 1
+            return code, {"error": {"code": code, "message": "fake", "status": "FAKE"}}
+        return serve(method, url)
+
+    monkeypatch.setattr(backend, "serve", flaky)
+    return codes
+
+def test_quota_error_is_retried_for_writes(backend, failing):
+    client = backend.client(ScheduledHTTPClient)
+    sheet = client.open("가짜").worksheet("Current")
+    rows_before = len(backend.sheets["Current"])
+    failing[:] = [429, 429]
+    sheet.append_rows([["2026-10-17 10:00", "교목실", "주요현안", "재시도", "진행중", "", "", "", "h", "id"]])
+    assert len(backend.sheets["Current"]) == rows_before + 1
+    assert client.http_client.scheduler.retries == 2
+
+def test_server_error_is_retried_only_when_idempotent(backend, failing):
+    client = backend.client(ScheduledHTTPClient)
+    sheet = client.open("가짜").worksheet("Current")
+    failing[:] = [503]
+    assert sheet.col_values(1)[0] == "입력일시"
+
+    # 행 추가는 서버에서 이미 처리됐을 수 있으므로 다시 보내지 않습니다
+    rows_before = len(backend.sheets["Current"])
+    requests_before = backend.requests
+    failing[:] = [503]
+    with pytest.raises(gspread.exceptions.APIError):
+        sheet.append_rows([["2026-10-17 10:00", "교목실", "주요현안", "한 번만", "진행중", "", "", "", "h", "id"]])
+    assert backend.requests == requests_before + 1
+    assert len(backend.sheets["Current"]) == rows_before
+    assert client.http_client.scheduler.retries == 1
@@ -0,0 +1,16 @@
+# 메뉴별 화면. 메뉴마다 모듈 하나이고, 모듈의 render()가 화면을 그립니다.
+# 화면 모듈은 그 메뉴를 처음 열 때 불러오므로, 한 메뉴에서만 쓰는 라이브러리(python-docx 등)는 첫 화면을 늦추지 않습니다.
+import importlib
+
+MENUS = {
+    "📊 금주 현황 (Current)": "current",
+    "📝 안건 등록 (Input)": "input",
+    "🛠️ 수정/삭제 (Edit)": "edit",
+    "🗄️ 지난 기록 (History)": "history",
+    "📈 회의 분석 (Analytics)": "analytics",
+    "🖨️ 회의록 다운로드 (Export)": "export",
+    "⚙️ 관리자 (Admin)": "admin",
+}
+
+def load_view(menu):
+    return importlib.import_module(f"{__name__}.{MENUS[menu]}")
@@ -0,0 +1,177 @@
+# 기능: 관리자
+import streamlit as st
+import pandas as pd
+
+from metrics import SLOW_RERUN_SECONDS, get_metrics
+from sheets import error_message
+from storage import MeetingAlreadyClosedError, get_storage
+from journal import JOURNAL_MAX_ATTEMPTS, get_journal
+from search import get_search_index
+from analytics import get_analytics
+
+def render():
+    st.markdown('<div class="main-header">⚙️ 관리자 페이지</div>', unsafe_allow_html=True)
+    password = st.text_input("관리자 비밀번호", type="password")
+
+    try:
+        real_password = st.secrets["admin"]["password"] if "admin" in st.secrets else "1234"
+    except:
+        real_password = "1234"
+    
+    if password == real_password:
+        st.success("✅ 접속 완료")
+        st.markdown("""
+        <div class="admin-box">
+            <h4>🔴 주간 회의 마감 (Data Closing)</h4>
+            <p><b>[Current]</b> 데이터를 <b>[History]</b>로 이동하고 초기화합니다.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        try:
+            for unfinished in get_storage().incomplete_close_jobs():
+                st.warning(f"⏸️ '{unfinished}' 마감이 중간에 멈췄습니다. 같은 회차 이름으로 다시 실행하면 이어서 진행합니다.")
+        except Exception as e:
+            st.error(f"마감 작업 기록을 확인하지 못했습니다: {e}")
+
+        meeting_name = st.text_input("마감할 회차 이름 (예: 2026-01-08 정기회의)")
+        confirm_close = st.checkbox("⚠️ 데이터 마감 확인")
+        
+        if st.button("🚀 마감 실행"):
+            if not confirm_close or not meeting_name:
+                st.warning("회차 이름과 확인 체크박스를 모두 입력해주세요.")
+            else:
+                try:
+                    # 저널에 남아 있는 등록 건까지 반영한 뒤 마감
+                    journal = get_journal()
+                    if not journal.wait_until_flushed(timeout=30):
+                        st.error(f"아직 시트에 반영되지 않은 등록 건이 있습니다. 잠시 후 다시 시도해주세요. ({journal.last_error or '반영 중'})")
+                    else:
+                        progress_bar = st.progress(0.0, text="마감 준비 중...")
+                        chunk_log = []
+
+                        def show_progress(done, total, seconds):
+                            if seconds:
+                                chunk_log.append(f"{len(chunk_log) + 1}번째 묶음: {done}/{total}행 ({seconds:.2f}초)")
+                            progress_bar.progress(done / total if total else 1.0, text=f"History로 옮기는 중... {done}/{total}행")
+
+                        moved = get_storage().close_meeting(meeting_name, on_progress=show_progress)
+                        if moved == 0:
+                            progress_bar.empty()
+                            st.warning("데이터 없음")
+                        else:
+                            progress_bar.progress(1.0, text=f"{moved}행 이동 완료")
+                            if chunk_log:
+                                st.caption(" · ".join(chunk_log))
+                            st.balloons()
+                            st.success("✅ 마감 완료")
+                            try:
+                                # 방금 마감한 회차만 검색 색인과 분석 집계에 추가
+                                get_search_index().sync(get_storage())
+                                get_analytics().sync(get_storage())
+                            except Exception as e:
+                                st.caption(f"검색 색인/분석 집계는 다음에 화면을 열 때 갱신됩니다. ({e})")
+                except MeetingAlreadyClosedError as e:
+                    st.warning(f"{e} 회차 이름을 확인해주세요.")
+                except Exception as e:
+                    st.error(f"오류: {error_message(e)} (같은 회차 이름으로 다시 실행하면 이어서 진행합니다)")
+
+        st.markdown("---")
+        st.markdown("#### 📮 등록 저널 현황")
+        journal = get_journal()
+        failed_rows = journal.failed_records()
+        j1, j2, j3 = st.columns(3)
+        j1.metric("시트 반영 대기", journal.pending_count())
+        j2.metric("반영 실패", len(failed_rows))
+        j3.metric("최근 반영 오류", "없음" if journal.last_error is None else "있음")
+        if journal.last_error:
+            st.caption(journal.last_error)
+        if failed_rows:
+            st.error(f"{JOURNAL_MAX_ATTEMPTS}번 시도해도 시트에 반영하지 못한 등록 건입니다. 원인을 확인한 뒤 다시 시도하거나 삭제하세요. (마감에는 포함되지 않습니다)")
+            st.dataframe(pd.DataFrame(failed_rows), hide_index=True)
+            f1, f2 = st.columns(2)
+            if f1.button("반영 실패 건 다시 시도"):
+                journal.retry_failed()
+                st.rerun()
+            if f2.button("반영 실패 건 삭제"):
+                journal.discard_failed()
+                st.rerun()
+
+        with st.expander("🗂️ 지난 기록 색인 다시 만들기"):
+            st.caption("History 시트를 직접 고친 뒤 회차 목록이 맞지 않으면 실행하세요. (회차정보 열만 읽습니다)")
+            if st.button("색인 다시 만들기"):
+                try:
+                    get_storage().rebuild_history_index()
+                    st.success("색인을 다시 만들었습니다.")
+                except Exception as e:
+                    st.error(f"오류: {error_message(e)}")
+            st.caption("지난 기록의 내용을 시트에서 직접 고쳤다면 검색 색인도 다시 만드세요. (History 전체를 읽습니다)")
+            if st.button("검색 색인 다시 만들기"):
+                try:
+                    get_search_index().rebuild(get_storage())
+                    st.success("검색 색인을 다시 만들었습니다.")
+                except Exception as e:
+                    st.error(f"오류: {error_message(e)}")
+
+        cache_stats = get_storage().cache_stats()
+        if cache_stats is not None:
+            st.markdown("---")
+            st.markdown("#### 📈 시트 읽기 캐시 현황")
+            m1, m2, m3, m4, m5 = st.columns(5)
+            m1.metric("캐시 적중", cache_stats["hits"])
+            m2.metric("동시 요청 병합", cache_stats["coalesced"])
+            m3.metric("변경 없음 확인", cache_stats["revalidated"])
+            m4.metric("실제 API 조회", cache_stats["misses"])
+            m5.metric("절감률", f"{cache_stats['hit_rate']:.0%}")
+            if "snapshot" in cache_stats:
+                snap = cache_stats["snapshot"]
+                st.caption(f"💾 History 로컬 사본: {snap['rows']}행 · 새 행 덧붙이기 {snap['top_ups']}회 · 전체 다시 받기 {snap['full_syncs']}회 (이번 실행 기준)")
+                if snap["resyncing"]:
+                    st.caption("💾 History 전체를 다시 받는 중입니다. 그동안 지난 기록은 시트에서 직접 읽습니다.")
+                elif snap["last_error"]:
+                    st.caption(f"💾 History 사본을 다시 받지 못했습니다: {snap['last_error']}")
+            if "scheduler" in cache_stats:
+                sched = cache_stats["scheduler"]
+                requests = " · ".join(f"{lane} {n}회" for lane, n in sched["requests"].items())
+                st.caption(
+                    f"🚦 시트 요청: {requests} · 재시도 {sched['retries']}회 · 거절 {sched['rejected']}회"
+                    f" · 최장 대기 {sched['max_wait']:.1f}초 · 남은 토큰 읽기 {sched['tokens']['read']}/쓰기 {sched['tokens']['write']}"
+                )
+            # 시트를 직접 고친 경우는 리비전이 바뀌지 않으므로 여기서 강제로 다시 읽습니다
+            if st.button("시트 전체 다시 읽기", help="구글 시트에서 직접 수정한 내용을 바로 반영합니다."):
+                get_storage().invalidate("Current", "History")
+                st.success("다음 조회부터 시트 전체를 다시 읽습니다.")
+
+        st.markdown("---")
+        st.markdown("#### 🩺 운영 현황 (이 서버 프로세스 기준)")
+        metrics = get_metrics()
+        o1, o2, o3, o4 = st.columns(4)
+        o1.metric("분당 API 호출", metrics.calls_last_minute())
+        scheduler_stats = (cache_stats or {}).get("scheduler")
+        if scheduler_stats:
+            for col, kind, name in ((o2, "read", "읽기"), (o3, "write", "쓰기")):
+                used, limit = scheduler_stats["used"][kind], scheduler_stats["limit"][kind]
+                col.metric(f"할당량 여유 ({name})", f"{limit - used}/{limit}", help="최근 1분 동안 보낸 요청을 뺀 나머지")
+        else:
+            o2.metric("할당량 여유 (읽기)", "-")
+            o3.metric("할당량 여유 (쓰기)", "-")
+        o4.metric("느린 화면", metrics.slow_count, help=f"{SLOW_RERUN_SECONDS:g}초 이상 걸린 화면 수")
+        menu_rows = metrics.menu_summary()
+        if menu_rows:
+            st.caption("메뉴별 화면 시간 (밀리초, 최근 화면 기준 p50/p95)")
+            st.dataframe(pd.DataFrame(menu_rows), hide_index=True)
+        call_rows = metrics.call_summary()
+        if call_rows:
+            st.caption("구글 API 호출 종류별 시간 (밀리초)")
+            st.dataframe(pd.DataFrame(call_rows), hide_index=True)
+        if metrics.slow_reruns:
+            with st.expander(f"🐢 최근 느린 화면 {len(metrics.slow_reruns)}건"):
+                st.dataframe(pd.DataFrame(list(metrics.slow_reruns)), hide_index=True)
+        st.download_button(
+            "Prometheus 형식으로 내려받기",
+            data=metrics.prometheus_text(cache_stats),
+            file_name="kiwu_metrics.prom",
+            mime="text/plain",
+            help="서버 설정에서 KIWU_METRICS_FILE을 지정하면 같은 내용을 주기적으로 파일에 씁니다.",
+        )
+    elif password:
+        st.error("비밀번호 불일치")
@@ -0,0 +1,56 @@
+# 기능: 회의 분석
+import streamlit as st
+import pandas as pd
+
+from config import DEPT_ORDER
+from sheets import error_message
+from storage import get_storage
+from analytics import SUBMISSION_CUTOFF, get_analytics
+
+def render():
+    st.markdown('<div class="main-header">📈 회의 분석</div>', unsafe_allow_html=True)
+    analytics = get_analytics()
+    try:
+        # 아직 집계하지 않은 회차가 있으면 그 회차만 읽어서 반영
+        analytics.sync(get_storage())
+    except Exception as e:
+        st.warning(f"새 회차를 분석에 반영하지 못했습니다. 지금까지 집계된 내용으로 보여줍니다. ({e})")
+
+    try:
+        if not analytics.meeting_count():
+            st.info("아직 마감된 회차가 없습니다.")
+        else:
+            tab_delay, tab_duration, tab_punctual = st.tabs(["⏰ 지연 추이", "⏳ 완료까지 걸린 기간", "📮 제출 준수율"])
+            with tab_delay:
+                trend = analytics.delay_trend()
+                if trend.empty:
+                    st.info("날짜가 있는 회차가 없습니다.")
+                else:
+                    dept_totals = trend.sum()
+                    dept_options = [d for d in DEPT_ORDER if d in trend.columns] + [d for d in trend.columns if d not in DEPT_ORDER]
+                    default_depts = [d for d in dept_totals.sort_values(ascending=False).index[:5] if dept_totals[d] > 0]
+                    picked_depts = st.multiselect("부서 (기본: 지연이 많은 5개 부서)", dept_options, default=default_depts)
+                    if picked_depts:
+                        st.line_chart(trend[picked_depts])
+                    if len(trend) >= 2:
+                        this_week, last_week = trend.iloc[-1], trend.iloc[-2]
+                        change = pd.DataFrame({"이번 회의": this_week, "지난 회의": last_week, "증감": this_week - last_week})
+                        change = change[(change["이번 회의"] > 0) | (change["지난 회의"] > 0)].sort_values("증감", ascending=False)
+                        st.caption(f"지난 회의 대비 지연 건수 ({trend.index[-2]} → {trend.index[-1]})")
+                        st.dataframe(change)
+            with tab_duration:
+                st.caption("같은 부서의 같은 업무내용을 한 안건으로 보고, 처음 '진행중'으로 보고된 회의부터 '완료'로 보고된 회의까지의 일수입니다.")
+                durations = analytics.completion_durations()
+                if durations.empty:
+                    st.info("진행중에서 완료로 바뀐 안건이 아직 없습니다.")
+                else:
+                    st.bar_chart(durations["평균일수"])
+                    st.dataframe(durations.round(1))
+            with tab_punctual:
+                st.caption(f"회의 당일 {SUBMISSION_CUTOFF} 이후에 등록된 안건이 없으면 제때 제출한 것으로 봅니다.")
+                punctuality = analytics.punctuality()
+                punctuality["준수율(%)"] = (punctuality.pop("준수율") * 100).round(0)
+                st.bar_chart(punctuality["준수율(%)"])
+                st.dataframe(punctuality)
+    except Exception as e:
+        st.error(f"오류: {error_message(e)}")
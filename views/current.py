@@ -0,0 +1,132 @@
+# 기능: 금주 현황
+import streamlit as st
+from datetime import datetime
+
+from config import DEPT_ORDER
+from sheets import error_message
+from storage import get_storage
+from frames import STATUS_ORDER, display_frame, load_records_df, sort_by_dept, summarize_records
+from tables import frame_fingerprint, render_styled_table
+
+# --- 전체화면 팝업 ---
+@st.dialog("🔍 전체 안건 확대 보기", width="large")
+def show_fullscreen_table(df, fingerprint=None):
+    st.markdown("### 📋 전체 안건 목록")
+    # 대시보드에서 만든 HTML 캐시를 그대로 재사용
+    render_styled_table(df, key="fullscreen", fingerprint=fingerprint)
+    if st.button("닫기"):
+        st.rerun()
+
+# --- 금주 현황 표 (부분 재실행 영역) ---
+# 부서 필터와 크게 보기 버튼은 이 함수만 다시 실행합니다.
+# 시트 조회, 미제출 부서 계산, 현황 카드는 메뉴 이동/새로고침 때만 실행됩니다.
+@st.fragment
+def current_table_fragment(df):
+    try:
+        _current_table(df)
+    except Exception as e:
+        st.error(f"오류: {error_message(e)}")
+
+def _current_table(df):
+    col_filter, col_btn = st.columns([0.85, 0.15]) 
+    
+    with col_filter:
+        with st.expander("🔍 부서별 필터링 옵션 (클릭하여 펼치기)", expanded=False):
+            dept_counts = summarize_records(df)["dept"]
+            final_dept_list = list(dept_counts.index[dept_counts > 0])
+            selected_dept = st.multiselect("보고 싶은 부서를 선택하세요:", final_dept_list, default=final_dept_list)
+    
+    if selected_dept:
+        display_df = display_frame(sort_by_dept(df[df['부서명'].isin(selected_dept)]))
+
+        table_fingerprint = frame_fingerprint(display_df)
+        render_styled_table(display_df, key="current", fingerprint=table_fingerprint)
+
+        with col_btn:
+            st.write("") 
+            if st.button("🖥️ 크게 보기", type="secondary"):
+                show_fullscreen_table(display_df, table_fingerprint)
+    else:
+        st.info("선택된 부서가 없습니다. 필터를 확인해주세요.")
+
+# --- 회의실 화면 자동 새로고침 ---
+# 켜 두면 정해진 간격마다 Current의 리비전만 확인하고, 바뀐 경우에만 전체 화면을 다시 그립니다.
+AUTO_REFRESH_CHOICES = [10, 30, 60, 300]  # 초
+AUTO_REFRESH_DEFAULT = 30
+
+def watch_revision(sheet_name, interval):
+    @st.fragment(run_every=interval)
+    def _poll():
+        storage = get_storage()
+        revision = storage.revision(sheet_name)
+        seen_key = f"seen_revision_{sheet_name}"
+        seen = st.session_state.get(seen_key)
+        st.session_state[seen_key] = revision
+        if seen is not None and revision != seen:
+            storage.refresh(sheet_name)
+            st.rerun()
+        st.caption(f"📺 자동 새로고침: {interval}초마다 변경 확인 (마지막 확인 {datetime.now().strftime('%H:%M:%S')})")
+    _poll()
+
+# --- 화면 ---
+def render():
+    with st.sidebar:
+        auto_refresh = st.toggle("📺 자동 새로고침 (회의실 화면)", key="auto_refresh")
+        if auto_refresh:
+            refresh_interval = st.selectbox(
+                "확인 간격 (초)", AUTO_REFRESH_CHOICES,
+                index=AUTO_REFRESH_CHOICES.index(AUTO_REFRESH_DEFAULT), key="auto_refresh_interval",
+            )
+
+    current_hour = datetime.now().hour 
+    caption_text = "경인여자대학교의 힘찬 하루 ☀️" if 6 <= current_hour < 18 else "경인여자대학교의 빛나는 열정 🌙"
+    st.caption(caption_text)
+
+    st.markdown('<div class="main-header">🎓 경인여자대학교 전략회의</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="sub-header">📅 기준일: {datetime.now().strftime("%Y년 %m월 %d일")} | 종이 없는 스마트 회의 시스템</div>', unsafe_allow_html=True)
+    if auto_refresh:
+        watch_revision("Current", refresh_interval)
+    
+    try:
+        df = load_records_df("Current", include_pending=True)
+        pending_cnt = sum(str(i).startswith("pending-") for i in df.index)
+        if pending_cnt:
+            st.caption(f"⏳ 시트 저장 대기 중인 안건 {pending_cnt}건이 함께 표시됩니다.")
+
+        summary = summarize_records(df)
+        unsubmitted_list = [d for d in DEPT_ORDER if not summary["dept"].get(d, 0)]
+
+        if unsubmitted_list:
+            with st.expander(f"🚨 미제출 부서 현황: 총 {len(unsubmitted_list)}개 부서 (클릭하여 명단 확인)", expanded=False):
+                st.markdown(f"""
+                <div style='background-color: #fff5f5; padding: 15px; border-radius: 5px; border-left: 5px solid #fc8181;'>
+                    <p style='color: #c53030; font-weight: bold; margin: 0;'>{', '.join(unsubmitted_list)}</p>
+                    <p style='font-size: 0.85rem; color: #718096; margin-top: 8px; margin-bottom: 0;'>
+                        ※ 원활한 회의 진행을 위해 빠른 입력을 부탁드립니다.
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            if not df.empty:
+                st.balloons()
+                st.success("🎉 모든 부서가 안건 제출을 완료했습니다!")
+
+        if not df.empty:
+            cnt_total = len(df)
+            cnt_ing, cnt_plan, cnt_done, cnt_delay = (int(summary["status"].get(s, 0)) for s in STATUS_ORDER)
+
+            c1, c2, c3, c4, c5 = st.columns(5)
+            with c1: st.markdown(f'<div class="card-box"><h5>전체 안건</h5><h2>{cnt_total}</h2></div>', unsafe_allow_html=True)
+            with c2: st.markdown(f'<div class="card-box" style="border-top-color: #e67e22;"><h5>진행중</h5><h2 style="color:#e67e22;">{cnt_ing}</h2></div>', unsafe_allow_html=True)
+            with c3: st.markdown(f'<div class="card-box" style="border-top-color: #3182ce;"><h5>예정</h5><h2 style="color:#3182ce;">{cnt_plan}</h2></div>', unsafe_allow_html=True)
+            with c4: st.markdown(f'<div class="card-box" style="border-top-color: #38a169;"><h5>완료</h5><h2 style="color:#38a169;">{cnt_done}</h2></div>', unsafe_allow_html=True)
+            with c5: st.markdown(f'<div class="card-box" style="border-top-color: #e53e3e;"><h5>지연</h5><h2 style="color:#e53e3e;">{cnt_delay}</h2></div>', unsafe_allow_html=True)
+            
+            st.markdown("---")
+            
+            current_table_fragment(df)
+        else:
+            st.info("👋 아직 등록된 안건이 없습니다.")
+
+    except Exception as e:
+        st.error(f"오류: {error_message(e)}")
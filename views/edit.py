@@ -0,0 +1,72 @@
+# 기능: 수정/삭제
+import streamlit as st
+
+from sheets import error_message
+from storage import RecordConflictError, get_storage
+from frames import display_frame, records_to_df
+
+def render():
+    st.markdown('<div class="main-header">🛠️ 안건 수정 및 삭제</div>', unsafe_allow_html=True)
+    try:
+        dept_list_for_edit = get_storage().list_departments("Current")
+        if not dept_list_for_edit:
+            st.info("수정할 데이터가 없습니다.")
+        else:
+            edit_dept = st.selectbox("부서를 선택하세요", dept_list_for_edit)
+            # 선택한 부서의 안건만 가져옵니다 (비밀번호는 저장소 밖으로 나오지 않습니다)
+            target_df = display_frame(records_to_df(get_storage().department_records("Current", edit_dept), "Current"))
+            
+            if not target_df.empty:
+                task_options = target_df.apply(lambda x: f"[{x['입력일시']}] {str(x['업무내용'])[:20]}...", axis=1)
+                selected_task_idx = st.selectbox("안건을 선택하세요", task_options.index, format_func=lambda x: task_options[x])
+                selected_row = target_df.loc[selected_task_idx]
+                
+                st.info(f"선택: {selected_row['업무내용']}")
+                chk_pw = st.text_input("비밀번호 확인", type="password")
+                
+                if st.button("확인"):
+                    # 비밀번호는 화면으로 가져오지 않고, 저장소가 이 안건 하나의 해시와 비교합니다
+                    checked_record = get_storage().check_password("Current", edit_dept, selected_task_idx, chk_pw)
+                    if checked_record is not None:
+                        st.session_state['auth_success'] = True
+                        st.session_state['target_idx'] = selected_task_idx 
+                        # 인증 시점의 내용을 기억해 두었다가, 저장할 때 그 사이 바뀌었는지 확인
+                        st.session_state['target_snapshot'] = checked_record
+                        st.success("인증 성공")
+                    else:
+                        st.error("비밀번호 불일치")
+                        st.session_state['auth_success'] = False
+                
+                if st.session_state.get('auth_success', False) and st.session_state.get('target_idx') == selected_task_idx:
+                    st.divider()
+                    st.subheader("내용 수정")
+                    with st.form("edit_form"):
+                        def safe_index(lst, val): return lst.index(val) if val in lst else 0
+                        e_type = st.selectbox("구분", ["주요현안", "일반보고", "협조요청"], index=safe_index(["주요현안", "일반보고", "협조요청"], selected_row['구분']))
+                        e_status = st.selectbox("상태", ["진행중", "완료", "지연", "예정"], index=safe_index(["진행중", "완료", "지연", "예정"], selected_row['진행상태']))
+                        e_content = st.text_area("업무 내용", value=selected_row['업무내용'])
+                        e_note = st.text_input("비고", value=selected_row['비고'])
+                        
+                        c1, c2 = st.columns(2)
+                        with c1: update_btn = st.form_submit_button("수정 저장", type="primary")
+                        with c2: delete_btn = st.form_submit_button("🗑️ 삭제하기")
+                        
+                        snapshot = st.session_state.get('target_snapshot')
+                        try:
+                            if update_btn:
+                                get_storage().update_record("Current", selected_task_idx, {
+                                    "구분": e_type, "업무내용": e_content, "진행상태": e_status, "비고": e_note,
+                                }, expected=snapshot)
+                                st.success("수정 완료! 새로고침 해주세요.")
+                                del st.session_state['auth_success']
+                            if delete_btn:
+                                get_storage().delete_record("Current", selected_task_idx, expected=snapshot)
+                                st.success("삭제 완료! 새로고침 해주세요.")
+                                del st.session_state['auth_success']
+                        except RecordConflictError as e:
+                            st.error(f"저장하지 않았습니다: {e} 새로고침 후 다시 시도해주세요.")
+                            del st.session_state['auth_success']
+            else:
+                st.warning("해당 부서에 등록된 안건이 없습니다.")
+    except Exception as e:
+        st.error(f"오류: {error_message(e)}")
@@ -0,0 +1,197 @@
+# 기능: 회의록 다운로드 (워드 / 인쇄용 HTML / 여러 회차 ZIP)
+# python-docx를 쓰는 minutes.py는 이 메뉴를 처음 열 때 불러옵니다.
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
+import tempfile
+import time
+import zipfile
+
+from minutes import build_print_html, create_docx, render_meeting_files, safe_file_name
+from metrics import timed
+from sheets import error_message
+from storage import get_storage
+from frames import display_frame, load_records_df, meeting_date, records_to_df, sort_by_dept
+from tables import frame_fingerprint, render_styled_table
+
+# --- 워드 파일 ---
+# 실제 생성 코드는 minutes.py (일괄 내보내기 작업 스레드에서도 같이 씁니다)
+@timed("문서 생성")
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_docx_cached(fingerprint, title_text, _df):
+    """같은 회의(내용 해시 + 제목)의 워드 파일은 한 번만 만듭니다. _df는 해시 대상에서 제외됩니다."""
+    return create_docx(_df, title_text).getvalue()
+
+# --- 여러 회차 일괄 내보내기 (ZIP) ---
+EXPORT_COLUMNS = ['부서명', '구분', '업무내용', '진행상태', '마감기한', '담당자']
+BULK_EXPORT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+BULK_EXPORT_DIR = os.path.join(tempfile.gettempdir(), "kiwu_bulk_export")  # 만든 ZIP은 메모리 대신 여기 둡니다
+BULK_EXPORT_KEEP_SECONDS = 3600  # 이보다 오래된 ZIP 파일은 새 ZIP을 만들 때 지웁니다
+
+@st.cache_resource
+def get_export_pool():
+    # 프로세스 풀은 쓰지 않습니다. Streamlit 서버는 여러 스레드로 돌아 fork는 다른 스레드가 잡고 있던 잠금까지 복사하고,
+    # spawn/forkserver 작업자는 Streamlit이 __main__으로 등록한 app.py를 처음부터 다시 실행합니다.
+    return ThreadPoolExecutor(max_workers=BULK_EXPORT_WORKERS, thread_name_prefix="bulk-export")
+
+def _remove_old_archives():
+    os.makedirs(BULK_EXPORT_DIR, exist_ok=True)
+    cutoff = time.time() - BULK_EXPORT_KEEP_SECONDS
+    for entry in os.scandir(BULK_EXPORT_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def read_archive(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def discard_archive(bulk):
+    try:
+        os.remove(bulk["path"])
+    except OSError:
+        pass
+
+@timed("문서 생성")
+def build_bulk_archive(meeting_names, on_progress=None):
+    """선택한 회차들의 워드/인쇄용 HTML을 ZIP 파일 하나로 만듭니다.
+
+    History는 한 번에 읽고, 문서는 작업 스레드에서 만들어 끝나는 대로 ZIP에 씁니다.
+    (ZIP 파일 경로, 회차별 소요시간 목록, 전체 소요초)를 반환합니다.
+    """
+    started = time.perf_counter()
+    records_by_meeting = get_storage().records_for_meetings(meeting_names)
+    fetched = time.perf_counter()
+
+    pool = get_export_pool()
+    pending = set()
+    for name in meeting_names:
+        if not records_by_meeting.get(name):
+            continue
+        df = display_frame(sort_by_dept(records_to_df(records_by_meeting[name], "History")), EXPORT_COLUMNS)
+        pending.add(pool.submit(render_meeting_files, f"{name} 회의록", df.astype(str).to_dict("records"), list(df.columns)))
+    del records_by_meeting
+    count = len(pending)
+
+    _remove_old_archives()
+    fd, path = tempfile.mkstemp(suffix=".zip", dir=BULK_EXPORT_DIR)
+    timings = []
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+            # 끝난 문서는 ZIP에 쓰는 즉시 버립니다 (전체 결과를 메모리에 모아 두지 않음)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                while done:
+                    title_text, docx_bytes, html_bytes, seconds = done.pop().result()
+                    file_name = safe_file_name(title_text)
+                    archive.writestr(f"{file_name}.docx", docx_bytes)
+                    archive.writestr(f"{file_name}.html", html_bytes)
+                    del docx_bytes, html_bytes
+                    timings.append({"회차": title_text, "생성 시간(초)": round(seconds, 3)})
+                    if on_progress:
+                        on_progress(len(timings), count)
+    except BaseException:
+        os.remove(path)
+        raise
+    total = time.perf_counter() - started
+    timings.sort(key=lambda t: t["회차"])
+    return path, timings, {"전체": total, "History 조회": fetched - started}
+
+# --- 화면 ---
+def render():
+    st.markdown('<div class="main-header">🖨️ 회의록 생성 및 다운로드</div>', unsafe_allow_html=True)
+    
+    export_target = st.radio("출력할 대상을 선택하세요:", ["금주 안건 (Current)", "지난 기록 (History)", "여러 회차 일괄 (ZIP)"], horizontal=True)
+    target_df = pd.DataFrame()
+    report_title = ""
+
+    try:
+        if "금주" in export_target:
+            target_df = load_records_df("Current")
+            report_title = f"{datetime.now().strftime('%Y-%m-%d')} 전략회의 안건"
+        elif "일괄" in export_target:
+            meeting_dates = get_storage().list_meetings()
+            if not meeting_dates:
+                st.warning("보관된 기록이 없습니다.")
+            else:
+                pick_mode = st.radio("회차 선택 방법", ["기간으로 선택", "직접 선택"], horizontal=True)
+                if pick_mode == "기간으로 선택":
+                    dated = [(name, meeting_date(name)) for name in meeting_dates]
+                    known = [d for _, d in dated if d is not None]
+                    period = st.date_input("기간", value=(min(known), max(known)) if known else ())
+                    if isinstance(period, tuple) and len(period) == 2:
+                        bulk_meetings = [name for name, d in dated if d is not None and period[0] <= d <= period[1]]
+                    else:
+                        bulk_meetings = []
+                    st.caption(f"선택된 회차: {len(bulk_meetings)}개 (회차 이름 앞의 날짜 기준)")
+                else:
+                    bulk_meetings = st.multiselect("내보낼 회차", meeting_dates)
+
+                # 다른 회차를 고르면 전에 만든 ZIP은 버립니다
+                bulk = st.session_state.get('bulk_export')
+                if bulk and (bulk["meetings"] != list(bulk_meetings) or not os.path.exists(bulk["path"])):
+                    discard_archive(bulk)
+                    bulk = st.session_state['bulk_export'] = None
+
+                if st.button("📦 ZIP 만들기", type="primary", disabled=not bulk_meetings):
+                    if bulk:
+                        discard_archive(bulk)
+                    progress_bar = st.progress(0.0, text="History 불러오는 중...")
+                    archive_path, timings, totals = build_bulk_archive(
+                        bulk_meetings,
+                        on_progress=lambda done, total: progress_bar.progress(done / total, text=f"문서 생성 중... {done}/{total}"),
+                    )
+                    progress_bar.empty()
+                    bulk = st.session_state['bulk_export'] = {
+                        "meetings": list(bulk_meetings), "path": archive_path, "timings": timings, "totals": totals,
+                    }
+
+                if bulk:
+                    st.success(f"✅ {len(bulk['timings'])}개 회차 · 전체 {bulk['totals']['전체']:.2f}초 (History 조회 {bulk['totals']['History 조회']:.2f}초)")
+                    st.download_button(
+                        label="ZIP 다운로드",
+                        # 누를 때 파일에서 읽어 보냅니다 (세션에 ZIP 내용을 들고 있지 않음)
+                        data=lambda: read_archive(bulk["path"]),
+                        file_name=f"회의록_일괄_{datetime.now().strftime('%Y%m%d')}.zip",
+                        mime="application/zip",
+                    )
+                    with st.expander("⏱️ 회차별 생성 시간"):
+                        st.dataframe(pd.DataFrame(bulk["timings"]), hide_index=True)
+        else:
+            meeting_dates = get_storage().list_meetings()
+            if meeting_dates:
+                selected_date = st.selectbox("출력할 회차를 선택하세요:", meeting_dates)
+                target_df = records_to_df(get_storage().meeting_records(selected_date), "History")
+                report_title = f"{selected_date} 회의록"
+        
+        if not target_df.empty:
+            final_df = display_frame(sort_by_dept(target_df), EXPORT_COLUMNS)
+
+            st.divider()
+            st.subheader(f"📄 미리보기: {report_title}")
+            render_styled_table(final_df, key="export")
+
+            c1, c2 = st.columns(2)
+            with c1:
+                st.markdown("### 📥 Word 다운로드")
+                # 버튼을 누를 때만 만들고, 같은 내용이면 캐시된 파일을 그대로 보냅니다
+                docx_key = frame_fingerprint(final_df)
+                st.download_button(
+                    label="워드 파일 다운로드 (.docx)",
+                    data=lambda: create_docx_cached(docx_key, report_title, final_df),
+                    file_name=f"{report_title}.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                )
+            with c2:
+                st.markdown("### 🖨️ 인쇄 / PDF 저장")
+                with timed("문서 생성"):
+                    html_content = build_print_html(final_df, report_title)
+                with st.expander("👁️ 인쇄용 뷰 열기 (클릭)"):
+                    st.components.v1.html(html_content, height=600, scrolling=True)
+                    st.info("💡 위 표 위에서 마우스 오른쪽 버튼 -> '프레임 인쇄' 또는 이 화면 전체를 'Ctrl+P'로 인쇄하세요.")
+    except Exception as e:
+        st.error(f"데이터 처리 중 오류 발생: {error_message(e)}")
@@ -0,0 +1,56 @@
+# 기능: 지난 기록
+import streamlit as st
+import time
+
+from config import DEPT_ORDER
+from sheets import error_message
+from storage import get_storage
+from frames import STATUS_ORDER, display_frame, records_to_df, sort_by_dept
+from search import SEARCH_RESULT_LIMIT, get_search_index
+from tables import render_styled_table
+
+def render():
+    st.markdown('<div class="main-header">🗄️ 지난 회의 기록</div>', unsafe_allow_html=True)
+    history_view = st.radio("보기 방식", ["회차별 보기", "🔎 전체 검색"], horizontal=True, label_visibility="collapsed")
+    try:
+        if history_view == "회차별 보기":
+            # 회차 목록은 색인에서, 선택한 회차의 행만 따로 가져옵니다
+            meeting_dates = get_storage().list_meetings()
+            if meeting_dates:
+                selected_date = st.selectbox("회차 선택:", meeting_dates)
+                
+                history_df = display_frame(sort_by_dept(records_to_df(get_storage().meeting_records(selected_date), "History")))
+                
+                render_styled_table(history_df, key="history")
+            else:
+                st.warning("보관된 기록이 없습니다.")
+        else:
+            search_index = get_search_index()
+            try:
+                # 아직 색인에 없는 회차가 있으면 그 회차만 읽어서 추가
+                search_index.sync(get_storage())
+            except Exception as e:
+                st.warning(f"새 회차를 검색 색인에 추가하지 못했습니다. 기존 색인으로 검색합니다. ({e})")
+
+            query = st.text_input("검색어 (업무내용 · 비고 · 담당자 · 부서명)", placeholder="예: 예산 검토")
+            with st.expander("🔧 검색 조건", expanded=False):
+                f_depts = st.multiselect("부서", DEPT_ORDER)
+                f_statuses = st.multiselect("진행상태", STATUS_ORDER)
+                f_period = st.date_input("회의 기간 (회차 이름의 날짜 기준)", value=())
+            date_from, date_to = f_period if isinstance(f_period, tuple) and len(f_period) == 2 else (None, None)
+
+            if query.strip() or f_depts or f_statuses or date_from:
+                started = time.perf_counter()
+                results = search_index.search(query, depts=f_depts, statuses=f_statuses, date_from=date_from, date_to=date_to)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if results:
+                    more = " (최근 순으로 일부만 표시)" if len(results) >= SEARCH_RESULT_LIMIT else ""
+                    st.caption(f"{len(results)}건{more} · {elapsed_ms:.0f}ms · 가장 최근: {results[0]['회차정보']}")
+                    render_styled_table(display_frame(records_to_df(results, "History")), key="search")
+                else:
+                    st.info("검색 결과가 없습니다.")
+            else:
+                index_stats = search_index.stats()
+                st.caption(f"지난 회의 {index_stats['meetings']}회차, {index_stats['rows']}건에서 찾습니다.")
+    except Exception as e:
+        st.error(f"오류: {error_message(e)}")
@@ -0,0 +1,39 @@
+# 기능: 안건 등록
+import streamlit as st
+from datetime import datetime
+
+from config import DEPT_ORDER
+from storage import hash_password, new_record_id
+from journal import get_journal
+
+def render():
+    st.markdown('<div class="main-header">📝 안건 등록</div>', unsafe_allow_html=True)
+    st.info("입력된 내용은 '이번 주 현황'에 즉시 반영됩니다.")
+
+    with st.form("input_form", clear_on_submit=True):
+        col_a, col_b = st.columns(2)
+        with col_a:
+            input_dept = st.selectbox("부서", DEPT_ORDER)
+            input_type = st.selectbox("구분", ["주요현안", "일반보고", "협조요청"])
+        with col_b:
+            input_status = st.selectbox("상태", ["진행중", "완료", "지연", "예정"])
+            input_date = st.date_input("마감 기한")
+        
+        input_content = st.text_area("업무 내용", height=100)
+        col_c, col_d = st.columns(2)
+        with col_c: input_name = st.text_input("담당자")
+        with col_d: input_note = st.text_input("비고")
+        
+        st.markdown("---")
+        input_pw = st.text_input("비밀번호(수정/삭제용 숫자 4자리)", type="password", max_chars=4)
+        
+        if st.form_submit_button("💾 등록하기", type="primary"):
+            if not input_pw:
+                st.warning("비밀번호를 입력해주세요!")
+            else:
+                try:
+                    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+                    get_journal().submit("Current", [now, input_dept, input_type, input_content, input_status, str(input_date), input_name, input_note, hash_password(input_pw), new_record_id()])
+                    st.success("등록되었습니다! (금주 현황에 바로 표시되며, 시트 저장은 자동으로 이어서 진행됩니다)")
+                except Exception as e:
+                    st.error(f"저장 실패: {e}")